@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+
+FAST_LANE = "fast"
+SLOW_LANE = "slow"
+
+
+@dataclass(frozen=True)
+class LaneLimits:
+    concurrency: int
+    queue_depth: int
+
+
+# Template answers take milliseconds; a local Ollama serves one LLM call at a time.
+DEFAULT_FAST_LIMITS = LaneLimits(concurrency=4, queue_depth=16)
+DEFAULT_SLOW_LIMITS = LaneLimits(concurrency=1, queue_depth=4)
+
+
+class LaneFullError(RuntimeError):
+    def __init__(self, lane: Lane):
+        super().__init__(
+            f"The {lane.name} lane is full ({lane.limits.concurrency} running, "
+            f"{lane.limits.queue_depth} waiting); retry later."
+        )
+        self.lane = lane.name
+
+
+@dataclass
+class Lane:
+    """A counting semaphore with a bounded wait queue; arrivals beyond it are shed."""
+
+    name: str
+    limits: LaneLimits
+    running: int = field(default=0, init=False)
+    waiting: int = field(default=0, init=False)
+    admitted: int = field(default=0, init=False)
+    shed: int = field(default=0, init=False)
+    _condition: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+
+    def acquire(self) -> None:
+        with self._condition:
+            if self.running >= self.limits.concurrency and self.waiting >= self.limits.queue_depth:
+                self.shed += 1
+                raise LaneFullError(self)
+            self.waiting += 1
+            try:
+                self._condition.wait_for(lambda: self.running < self.limits.concurrency)
+            finally:
+                self.waiting -= 1
+            self.running += 1
+            self.admitted += 1
+
+    def release(self) -> None:
+        with self._condition:
+            self.running -= 1
+            self._condition.notify()
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "concurrency": self.limits.concurrency,
+                "queue_depth": self.limits.queue_depth,
+                "running": self.running,
+                "waiting": self.waiting,
+                "admitted": self.admitted,
+                "shed": self.shed,
+            }
+
+
+class AdmissionController:
+    """Separates answers that need Ollama (slow lane) from deterministic ones (fast lane).
+
+    `AnalyticsAgent.answer` picks the lane after planning: template SQL runs in the
+    fast lane and moves to the slow lane only if its summary needs the LLM.
+    """
+
+    def __init__(self, fast: LaneLimits = DEFAULT_FAST_LIMITS, slow: LaneLimits = DEFAULT_SLOW_LIMITS):
+        self.lanes = {FAST_LANE: Lane(FAST_LANE, fast), SLOW_LANE: Lane(SLOW_LANE, slow)}
+
+    @property
+    def capacity(self) -> int:
+        """Questions that can be running or waiting at once, across both lanes."""
+        return sum(lane.limits.concurrency + lane.limits.queue_depth for lane in self.lanes.values())
+
+    def stats(self) -> dict[str, Any]:
+        return {name: lane.stats() for name, lane in self.lanes.items()}
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entities import Catalog
+
+
+DEFAULT_SNAPSHOT_PATH = Path("data/processed/catalog_snapshot.pkl")
+
+# Bump when Catalog's fields change so older snapshots are rebuilt, not misread.
+SNAPSHOT_FORMAT = 1
+
+
+def load_catalog_snapshot(data_version: str, path: Path = DEFAULT_SNAPSHOT_PATH) -> Catalog | None:
+    """The snapshot written for `data_version`, read in a single call, or None.
+
+    Missing, stale, unreadable and older-format snapshots all return None.
+    """
+    try:
+        snapshot_format, snapshot_version, catalog = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError):
+        return None
+    if snapshot_format != SNAPSHOT_FORMAT or snapshot_version != data_version:
+        return None
+    return catalog
+
+
+def save_catalog_snapshot(catalog: Catalog, data_version: str, path: Path = DEFAULT_SNAPSHOT_PATH) -> bool:
+    payload = pickle.dumps((SNAPSHOT_FORMAT, data_version, catalog), protocol=pickle.HIGHEST_PROTOCOL)
+    staged = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_bytes(payload)
+        # Concurrent CLI processes may race to write; the rename keeps readers whole.
+        os.replace(staged, path)
+    except OSError:
+        staged.unlink(missing_ok=True)
+        return False
+    return True
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -13,6 +15,10 @@ class AgentSettings:
     ollama_sql_model: str
     ollama_summary_model: str
     sql_max_rows: int
+    entity_resolver: str = "catalog"
+    result_cache: bool = True
+    result_cache_max_mb: int = 100
+    daemon_socket: Path = Path(tempfile.gettempdir()) / f"courtside-{os.getuid()}.sock"
 
 
 
@@ -29,4 +35,8 @@ def load_agent_settings() -> AgentSettings:
         ollama_sql_model=os.getenv("OLLAMA_SQL_MODEL", "llama3.1:8b"),
         ollama_summary_model=os.getenv("OLLAMA_SUMMARY_MODEL", "llama3.1:8b"),
         sql_max_rows=int(os.getenv("SQL_MAX_ROWS", "500")),
+        entity_resolver=os.getenv("ENTITY_RESOLVER", "catalog").strip().lower(),
+        result_cache=os.getenv("RESULT_CACHE", "on").strip().lower() not in {"0", "off", "false", "no"},
+        result_cache_max_mb=int(os.getenv("RESULT_CACHE_MAX_MB", "100")),
+        daemon_socket=Path(os.getenv("COURTSIDE_SOCKET", str(AgentSettings.daemon_socket))),
     )
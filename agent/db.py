@@ -1,22 +1,124 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import psycopg
 
 from .types import QueryResult
 
+if TYPE_CHECKING:
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+
+# games and player_game_stats share their season partitioning, so joins on season_id
+# can run per season, each against one partition's indexes.
+SESSION_OPTIONS = "-c enable_partitionwise_join=on"
+
+# Pooled connections prepare a statement server-side from its second execution on;
+# the template builders reuse a few SQL shapes with different parameters.
+POOLED_PREPARE_THRESHOLD = 1
+
 
 class QueryExecutor:
+    """Runs one query per call, on a fresh connection or, once `open_pool` is called, a pooled one.
+
+    `run_async` is the asyncio counterpart, pooled after `open_async_pool`; the
+    two pools are independent and a process normally opens only one of them.
+    """
+
     def __init__(self, database_url: str):
         self.database_url = database_url
+        self.pool: ConnectionPool | None = None
+        self.async_pool: AsyncConnectionPool | None = None
+
+    def open_pool(self, min_size: int = 1, max_size: int | None = None) -> None:
+        from psycopg_pool import ConnectionPool
+
+        if self.pool is not None:
+            return
+        self.pool = ConnectionPool(
+            self.database_url,
+            min_size=min_size,
+            max_size=max_size,
+            kwargs={"options": SESSION_OPTIONS, "prepare_threshold": POOLED_PREPARE_THRESHOLD},
+            check=ConnectionPool.check_connection,
+            name="courtside",
+            open=True,
+        )
+
+    async def open_async_pool(self, min_size: int = 1, max_size: int | None = None) -> None:
+        """Must be awaited on the event loop that will run the queries."""
+        from psycopg_pool import AsyncConnectionPool
+
+        if self.async_pool is not None:
+            return
+        self.async_pool = AsyncConnectionPool(
+            self.database_url,
+            min_size=min_size,
+            max_size=max_size,
+            kwargs={"options": SESSION_OPTIONS, "prepare_threshold": POOLED_PREPARE_THRESHOLD},
+            check=AsyncConnectionPool.check_connection,
+            name="courtside-async",
+            open=False,
+        )
+        await self.async_pool.open()
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    async def aclose(self) -> None:
+        if self.async_pool is not None:
+            await self.async_pool.close()
+            self.async_pool = None
 
     def run(self, sql: str, params: tuple[Any, ...]) -> QueryResult:
-        with psycopg.connect(self.database_url) as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                rows = cur.fetchall()
-                columns = [desc.name for desc in cur.description]
-
-        mapped_rows = [dict(zip(columns, row, strict=False)) for row in rows]
-        return QueryResult(columns=columns, rows=mapped_rows)
+        if self.pool is None:
+            with psycopg.connect(self.database_url, options=SESSION_OPTIONS) as conn:
+                return _fetch(conn, sql, params)
+        with self.pool.connection() as conn:
+            return _fetch(conn, sql, params)
+
+    async def run_async(self, sql: str, params: tuple[Any, ...]) -> QueryResult:
+        if self.async_pool is None:
+            async with await psycopg.AsyncConnection.connect(self.database_url, options=SESSION_OPTIONS) as conn:
+                return await _fetch_async(conn, sql, params)
+        async with self.async_pool.connection() as conn:
+            return await _fetch_async(conn, sql, params)
+
+    def stats(self) -> dict[str, Any]:
+        pool = self.pool if self.pool is not None else self.async_pool
+        if pool is None:
+            return {"pooled": False}
+        stats = pool.get_stats()
+        return {
+            "pooled": True,
+            "connections": stats.get("pool_size", 0),
+            "idle": stats.get("pool_available", 0),
+            "requests": stats.get("requests_num", 0),
+            "waiting": stats.get("requests_waiting", 0),
+        }
+
+
+def _fetch(conn: psycopg.Connection, sql: str, params: tuple[Any, ...]) -> QueryResult:
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        columns = [desc.name for desc in cur.description]
+
+    return _to_result(columns, rows)
+
+
+async def _fetch_async(conn: psycopg.AsyncConnection, sql: str, params: tuple[Any, ...]) -> QueryResult:
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        rows = await cur.fetchall()
+        columns = [desc.name for desc in cur.description]
+
+    return _to_result(columns, rows)
+
+
+def _to_result(columns: list[str], rows: list[tuple[Any, ...]]) -> QueryResult:
+    mapped_rows = [dict(zip(columns, row, strict=False)) for row in rows]
+    return QueryResult(columns=columns, rows=mapped_rows)
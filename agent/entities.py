@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import re
-from dataclasses import dataclass
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import psycopg
 from rapidfuzz import fuzz, process
 
+from data_ingestion.data_version import DEFAULT_DATA_VERSION_PATH, read_data_version
+
+from .catalog_snapshot import DEFAULT_SNAPSHOT_PATH, load_catalog_snapshot, save_catalog_snapshot
 from .intents import (
     detect_against_mode,
     extract_game_scope,
@@ -30,21 +37,54 @@ SEASON_LABEL_RANGE_RE = re.compile(
     re.IGNORECASE,
 )
 
+ENTITY_RESOLVER_BACKENDS = ("catalog", "trigram")
+
+# Candidate recall for the trigram backend: the lowest word_similarity between a
+# name and its best-matching span of the question that is still scored.
+TRIGRAM_CANDIDATE_THRESHOLD = 0.5
+
 
 @dataclass
 class Catalog:
     teams: list[tuple[str, str, str | None]]
     players: list[tuple[str, str]]
     seasons: list[str]
+    # Matching inputs derived once per catalog and persisted with it in snapshots.
+    team_choices: list[str] = field(init=False, repr=False)
+    team_names_lower: list[str] = field(init=False, repr=False)
+    player_choices: list[str] = field(init=False, repr=False)
+    player_names_lower: list[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.team_choices = [team_name for _, team_name, _ in self.teams]
+        self.team_names_lower = [(team_name or "").lower() for team_name in self.team_choices]
+        self.player_choices = [player_name for _, player_name in self.players]
+        self.player_names_lower = [(player_name or "").lower() for player_name in self.player_choices]
 
 
 class EntityResolver:
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        snapshot_path: Path | None = DEFAULT_SNAPSHOT_PATH,
+        data_version_path: Path = DEFAULT_DATA_VERSION_PATH,
+    ):
         self.database_url = database_url
+        self.snapshot_path = snapshot_path
+        self.data_version_path = data_version_path
+        self._catalog: Catalog | None = None
+        self._catalog_version: str | None = None
+        self.catalog_loads: Counter[str] = Counter()
+        # Threads share one catalog; the first to miss loads it while the rest wait.
+        self._catalog_lock = threading.Lock()
 
     def resolve(self, question: str) -> ResolvedContext:
-        catalog = self._load_catalog()
+        return self._resolve_with_catalog(question, self._load_catalog(question))
+
+    async def resolve_async(self, question: str) -> ResolvedContext:
+        return self._resolve_with_catalog(question, await self._load_catalog_async(question))
 
+    def _resolve_with_catalog(self, question: str, catalog: Catalog) -> ResolvedContext:
         context = ResolvedContext()
         context.teams = self._resolve_teams(question, catalog)
         context.players = self._resolve_players(question, catalog, context.teams)
@@ -91,7 +131,63 @@ class EntityResolver:
 
         return context
 
-    def _load_catalog(self) -> Catalog:
+    def reload(self) -> None:
+        """Forget the in-memory catalog; the next question reads the snapshot or database."""
+        with self._catalog_lock:
+            self._catalog = None
+            self._catalog_version = None
+
+    def _load_catalog(self, question: str) -> Catalog:
+        """The catalog for the current data version, from memory, the snapshot or the database.
+
+        Without a data version (no local ETL run yet) the catalog is kept in memory
+        only, until `reload`, since a stale snapshot could not be detected.
+        """
+        version = self._data_version()
+        with self._catalog_lock:
+            if self._catalog is not None and self._catalog_version == version:
+                self.catalog_loads["memory"] += 1
+                return self._catalog
+
+            catalog = load_catalog_snapshot(version, self.snapshot_path) if version else None
+            if catalog is None:
+                catalog = self._fetch_catalog()
+                self.catalog_loads["database"] += 1
+                if version:
+                    save_catalog_snapshot(catalog, version, self.snapshot_path)
+            else:
+                self.catalog_loads["snapshot"] += 1
+            self._catalog, self._catalog_version = catalog, version
+            return catalog
+
+    async def _load_catalog_async(self, question: str) -> Catalog:
+        # A memory hit is answered on the event loop. Anything else (a miss, a load in
+        # progress, or the trigram backend's per-question queries) runs in the default
+        # executor, whose few threads also bound the connections opened at once.
+        version = self._data_version()
+        if self._catalog_lock.acquire(blocking=False):
+            try:
+                if self._catalog is not None and self._catalog_version == version:
+                    self.catalog_loads["memory"] += 1
+                    return self._catalog
+            finally:
+                self._catalog_lock.release()
+        return await asyncio.to_thread(self._load_catalog, question)
+
+    def _data_version(self) -> str | None:
+        return read_data_version(self.data_version_path) if self.snapshot_path else None
+
+    def catalog_stats(self) -> dict[str, object]:
+        with self._catalog_lock:
+            catalog = self._catalog
+            return {
+                "players": len(catalog.players) if catalog else 0,
+                "teams": len(catalog.teams) if catalog else 0,
+                "data_version": self._catalog_version,
+                "loads": dict(self.catalog_loads),
+            }
+
+    def _fetch_catalog(self) -> Catalog:
         with psycopg.connect(self.database_url) as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT team_id, team_name, abbreviation FROM teams")
@@ -109,8 +205,8 @@ class EntityResolver:
         lower_q = question.lower()
         matches: list[ResolvedEntity] = []
 
-        for team_id, team_name, abbreviation in catalog.teams:
-            if team_name and team_name.lower() in lower_q:
+        for (team_id, team_name, abbreviation), lowered in zip(catalog.teams, catalog.team_names_lower):
+            if lowered and lowered in lower_q:
                 matches.append(ResolvedEntity(id=team_id, name=team_name, score=1.0))
                 continue
 
@@ -120,8 +216,7 @@ class EntityResolver:
         if matches:
             return self._dedupe_entities(matches)
 
-        choices = [team_name for _, team_name, _ in catalog.teams]
-        best = process.extract(question, choices, scorer=fuzz.WRatio, limit=2)
+        best = process.extract(question, catalog.team_choices, scorer=fuzz.WRatio, limit=2)
         fuzzy_matches: list[ResolvedEntity] = []
         for choice, score, idx in best:
             if score < 78:
@@ -140,8 +235,8 @@ class EntityResolver:
         lower_q = question.lower()
         matches: list[ResolvedEntity] = []
 
-        for player_id, player_name in catalog.players:
-            if player_name and player_name.lower() in lower_q:
+        for (player_id, player_name), lowered in zip(catalog.players, catalog.player_names_lower):
+            if lowered and lowered in lower_q:
                 matches.append(ResolvedEntity(id=player_id, name=player_name, score=1.0))
 
         if matches:
@@ -150,8 +245,7 @@ class EntityResolver:
         if self._should_skip_fuzzy_player_resolution(question, matched_teams or []):
             return []
 
-        choices = [player_name for _, player_name in catalog.players]
-        best = process.extract(question, choices, scorer=fuzz.WRatio, limit=2)
+        best = process.extract(question, catalog.player_choices, scorer=fuzz.WRatio, limit=2)
         fuzzy_matches: list[ResolvedEntity] = []
         for choice, score, idx in best:
             if score < 82:
@@ -313,3 +407,56 @@ class EntityResolver:
             return True
 
         return False
+
+
+class TrigramEntityResolver(EntityResolver):
+    """Resolves names against pg_trgm indexes instead of an in-process catalog.
+
+    Only teams and players whose name approximately appears in the question are
+    fetched. The inherited matching then scores them exactly as the catalog
+    backend does, with the same thresholds.
+    """
+
+    def _load_catalog(self, question: str) -> Catalog:
+        tokens = re.findall(r"[a-z0-9]+", question.lower())
+        try:
+            with psycopg.connect(self.database_url) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT set_config('pg_trgm.word_similarity_threshold', %s, false)",
+                        (str(TRIGRAM_CANDIDATE_THRESHOLD),),
+                    )
+                    cur.execute(
+                        """
+                        SELECT team_id, team_name, abbreviation
+                        FROM teams
+                        WHERE team_name <%% %s OR lower(abbreviation) = ANY(%s)
+                        """,
+                        (question, tokens),
+                    )
+                    teams = cur.fetchall()
+
+                    cur.execute(
+                        "SELECT player_id, player_name FROM players WHERE player_name <%% %s",
+                        (question,),
+                    )
+                    players = cur.fetchall()
+
+                    cur.execute("SELECT season_label FROM seasons ORDER BY start_year")
+                    seasons = [row[0] for row in cur.fetchall()]
+        except psycopg.errors.UndefinedFunction as exc:
+            raise RuntimeError(
+                "ENTITY_RESOLVER=trigram needs the pg_trgm extension. "
+                "Run `courtside setup-db` against a server that provides it, or use ENTITY_RESOLVER=catalog."
+            ) from exc
+
+        return Catalog(teams=teams, players=players, seasons=seasons)
+
+
+
+def build_entity_resolver(database_url: str, backend: str = "catalog") -> EntityResolver:
+    if backend == "trigram":
+        return TrigramEntityResolver(database_url)
+    if backend == "catalog":
+        return EntityResolver(database_url)
+    raise ValueError(f"Unknown entity resolver {backend!r}; expected one of {ENTITY_RESOLVER_BACKENDS}.")
@@ -17,15 +17,52 @@ class InsightGenerator:
         self.model = model
 
     def summarize(self, question: str, result: QueryResult, spec: QuerySpec | None = None) -> str:
-        if not result.rows:
-            return "No rows matched the requested criteria. Try broadening filters or clarifying the question."
+        summary = self._summary_without_llm(result, spec)
+        if summary is not None:
+            return summary
+
+        try:
+            return self.ollama.chat(
+                model=self.model,
+                messages=self._summary_messages(question, result, spec),
+                temperature=0.2,
+            )
+        except Exception:
+            return self._fallback_summary(result)
 
-        templated = self._deterministic_summary(result, spec)
-        if templated is not None:
-            return templated
+    async def summarize_async(
+        self,
+        question: str,
+        result: QueryResult,
+        spec: QuerySpec | None = None,
+    ) -> str:
+        summary = self._summary_without_llm(result, spec)
+        if summary is not None:
+            return summary
+
+        try:
+            return await self.ollama.chat_async(
+                model=self.model,
+                messages=self._summary_messages(question, result, spec),
+                temperature=0.2,
+            )
+        except Exception:
+            return self._fallback_summary(result)
 
-        sample_rows = result.rows[:10]
+    def needs_llm(self, result: QueryResult, spec: QuerySpec | None = None) -> bool:
+        return self._summary_without_llm(result, spec) is None
 
+    def _summary_without_llm(self, result: QueryResult, spec: QuerySpec | None) -> str | None:
+        if not result.rows:
+            return "No rows matched the requested criteria. Try broadening filters or clarifying the question."
+        return self._deterministic_summary(result, spec)
+
+    def _summary_messages(
+        self,
+        question: str,
+        result: QueryResult,
+        spec: QuerySpec | None,
+    ) -> list[dict[str, str]]:
         system_prompt = (
             "You are a basketball analytics writer. "
             "Write concise analyst-style insights grounded only in provided rows. "
@@ -37,27 +74,21 @@ class InsightGenerator:
                 f"Structured spec: {spec.describe_from_result(result) if spec is not None else 'none'}",
                 render_metric_context(),
                 f"Columns: {result.columns}",
-                f"Rows (sample): {json.dumps(sample_rows, default=str)}",
+                f"Rows (sample): {json.dumps(result.rows[:10], default=str)}",
                 "Write 1 short paragraph with key stats and one caveat if relevant.",
             ]
         )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-        try:
-            return self.ollama.chat(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-            )
-        except Exception:
-            first = sample_rows[0]
-            return (
-                f"Found {len(result.rows)} matching rows. "
-                f"Top row summary: {first}. "
-                "Run with a local Ollama model for richer narrative output."
-            )
+    def _fallback_summary(self, result: QueryResult) -> str:
+        return (
+            f"Found {len(result.rows)} matching rows. "
+            f"Top row summary: {result.rows[0]}. "
+            "Run with a local Ollama model for richer narrative output."
+        )
 
     def _deterministic_summary(self, result: QueryResult, spec: QuerySpec | None = None) -> str | None:
         cols = set(result.columns)
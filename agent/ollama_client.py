@@ -1,28 +1,88 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
 
-import requests
+from .single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+
+
+REQUEST_TIMEOUT_SECONDS = 90
 
 
 class OllamaClient:
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
+        # Building an httpx client costs tens of milliseconds (TLS context), so one is
+        # kept per event loop and its connections are reused across questions.
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+        # Identical prompts in flight at the same time share one Ollama call.
+        self.flights = SingleFlight()
 
     def chat(self, model: str, messages: list[dict[str, str]], temperature: float = 0.0) -> str:
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-            },
-        }
-
-        response = requests.post(f"{self.base_url}/api/chat", json=payload, timeout=90)
+        payload = _chat_payload(model, messages, temperature)
+        content, _ = self.flights.run(_prompt_key(payload), lambda: self._post(payload))
+        return content
+
+    async def chat_async(self, model: str, messages: list[dict[str, str]], temperature: float = 0.0) -> str:
+        payload = _chat_payload(model, messages, temperature)
+        content, _ = await self.flights.run_async(_prompt_key(payload), lambda: self._post_async(payload))
+        return content
+
+    def _post(self, payload: dict[str, Any]) -> str:
+        # Imported on first use: most answers never reach the LLM.
+        import requests
+
+        response = requests.post(
+            f"{self.base_url}/api/chat",
+            json=payload,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        return _message_content(response.json())
+
+    async def _post_async(self, payload: dict[str, Any]) -> str:
+        response = await self._client().post(f"{self.base_url}/api/chat", json=payload)
         response.raise_for_status()
-        data = response.json()
+        return _message_content(response.json())
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+    def _client(self) -> httpx.AsyncClient:
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS)
+            self._async_client_loop = loop
+        return self._async_client
+
+
+def _chat_payload(model: str, messages: list[dict[str, str]], temperature: float) -> dict[str, Any]:
+    return {
+        "model": model,
+        "messages": messages,
+        "stream": False,
+        "options": {
+            "temperature": temperature,
+        },
+    }
+
+
+def _prompt_key(payload: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
 
-        message = data.get("message", {})
-        content = message.get("content", "")
-        return content.strip()
+def _message_content(data: dict[str, Any]) -> str:
+    message = data.get("message", {})
+    content = message.get("content", "")
+    return content.strip()
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Any, Iterator
+
+from .admission import FAST_LANE, SLOW_LANE, AdmissionController, Lane
 from .config import AgentSettings
 from .db import QueryExecutor
-from .entities import EntityResolver
+from .entities import build_entity_resolver
 from .insight import InsightGenerator
 from .ollama_client import OllamaClient
 from .query_spec import QuerySpec
+from .result_cache import ResultCache
 from .schema_context import fetch_schema_context
+from .single_flight import SingleFlight
 from .sql_fallback import SQLFallbackGenerator
 from .spec_builder import QuerySpecBuilder
 from .spec_sql import QuerySQLBuilder
 from .sql_validator import SQLGuardrails, SQLValidationError
-from .types import AgentResponse, SQLPlan
+from .types import AgentResponse, QueryResult, ResolvedContext, SQLPlan
 
 
 ALLOWED_TABLES = {
@@ -20,6 +30,7 @@ ALLOWED_TABLES = {
     "seasons",
     "games",
     "player_game_stats",
+    "player_game_facts",
     "team_game_results",
 }
 
@@ -29,69 +40,288 @@ class AnalyticsAgent:
         self.settings = settings
 
         self.executor = QueryExecutor(settings.database_url)
-        self.resolver = EntityResolver(settings.database_url)
+        self.resolver = build_entity_resolver(settings.database_url, settings.entity_resolver)
         self.spec_builder = QuerySpecBuilder()
         self.queries = QuerySQLBuilder()
 
-        ollama = OllamaClient(settings.ollama_base_url)
-        self.fallback = SQLFallbackGenerator(ollama, settings.ollama_sql_model)
-        self.insights = InsightGenerator(ollama, settings.ollama_summary_model)
-
         self.guardrails = SQLGuardrails(
             allowed_tables=ALLOWED_TABLES,
             max_rows=settings.sql_max_rows,
         )
+        self._schema_context: str | None = None
+        self._schema_lock = threading.Lock()
+        # Identical validated queries in flight at the same time share one execution.
+        self.query_flights = SingleFlight()
+        self.result_cache = (
+            ResultCache(max_bytes=settings.result_cache_max_mb * 1024 * 1024) if settings.result_cache else None
+        )
+
+    # The LLM components are built on first use; template questions never need the fallback.
+    # Concurrent first uses may each build one, which is harmless: they hold no state.
+    @cached_property
+    def ollama(self) -> OllamaClient:
+        return OllamaClient(self.settings.ollama_base_url)
+
+    @cached_property
+    def fallback(self) -> SQLFallbackGenerator:
+        return SQLFallbackGenerator(self.ollama, self.settings.ollama_sql_model)
+
+    @cached_property
+    def insights(self) -> InsightGenerator:
+        return InsightGenerator(self.ollama, self.settings.ollama_summary_model)
+
+    def warm_up(self, pool_size: int = 1) -> None:
+        """Prepare for many questions: pooled connections with prepared statements and a loaded catalog."""
+        self.executor.open_pool(min_size=1, max_size=pool_size)
+        self.resolver.resolve("")
+
+    async def warm_up_async(self, pool_size: int = 1) -> None:
+        """`warm_up` for `answer_async`: an asyncio connection pool bound to the running loop."""
+        await self.executor.open_async_pool(min_size=1, max_size=pool_size)
+        await self.resolver.resolve_async("")
+
+    def close(self) -> None:
+        self.executor.close()
+        if self.result_cache is not None:
+            self.result_cache.close()
+
+    async def aclose(self) -> None:
+        await self.executor.aclose()
+        if self.result_cache is not None:
+            self.result_cache.close()
+        if "ollama" in self.__dict__:
+            await self.ollama.aclose()
+
+    def reload(self) -> None:
+        """Drop everything derived from the data, e.g. after an ETL run."""
+        self.resolver.reload()
+        self._schema_context = None
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {
+            "catalog": self.resolver.catalog_stats(),
+            "schema_context_cached": self._schema_context is not None,
+            "connections": self.executor.stats(),
+            "result_cache": self.result_cache.stats() if self.result_cache is not None else None,
+            "single_flight": {
+                "sql": self.query_flights.stats(),
+                "llm": self.ollama.flights.stats() if "ollama" in self.__dict__ else None,
+            },
+        }
+
+    def plan(
+        self,
+        question: str,
+        timings: dict[str, float] | None = None,
+    ) -> tuple[ResolvedContext, QuerySpec, SQLPlan | None]:
+        """Resolve and plan a question with the deterministic builders only; no LLM calls."""
+        timings = {} if timings is None else timings
+        with _timed(timings, "resolve"):
+            resolved = self.resolver.resolve(question)
+        return self._plan_resolved(question, resolved, timings)
+
+    async def plan_async(
+        self,
+        question: str,
+        timings: dict[str, float] | None = None,
+    ) -> tuple[ResolvedContext, QuerySpec, SQLPlan | None]:
+        timings = {} if timings is None else timings
+        with _timed(timings, "resolve"):
+            resolved = await self.resolver.resolve_async(question)
+        return self._plan_resolved(question, resolved, timings)
+
+    def answer(
+        self,
+        question: str,
+        admission: AdmissionController | None = None,
+        use_cache: bool = True,
+    ) -> AgentResponse:
+        """Answer one question; with `admission`, the work after planning runs inside its lanes.
 
-    def answer(self, question: str) -> AgentResponse:
-        resolved = self.resolver.resolve(question)
-        spec = self.spec_builder.build(question, resolved)
-        intent = spec.intent
-        plan = self.queries.build(spec, resolved)
+        Raises `LaneFullError` when the lane the question needs has no room.
+        `use_cache=False` executes the query even when a cached result exists.
+        """
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        resolved, spec, plan = self.plan(question, timings)
+
+        lane = _admit(admission, FAST_LANE if plan is not None else SLOW_LANE, timings)
+        try:
+            if plan is None:
+                with _timed(timings, "llm_sql"):
+                    plan = self._fallback_plan(question, resolved, spec)
+                if plan is None:
+                    return self._unmapped_response(resolved, spec, timings, started)
+
+            try:
+                with _timed(timings, "validate"):
+                    safe_sql = self.guardrails.validate_and_rewrite(plan.sql)
+            except SQLValidationError as exc:
+                return self._rejected_response(spec, plan, exc, timings, started)
+
+            with _timed(timings, "execute"):
+                result, execution = self._execute(safe_sql, plan, use_cache)
+            if lane is not None and lane.name == FAST_LANE and self.insights.needs_llm(result, spec):
+                lane.release()
+                lane = None
+                lane = _admit(admission, SLOW_LANE, timings)
+            with _timed(timings, "summarize"):
+                answer = self.insights.summarize(question, result, spec)
+            response = self._response(resolved, spec, plan, safe_sql, result, answer, timings, started)
+            response.provenance.update(execution)
+            if lane is not None:
+                response.provenance["lane"] = lane.name
+            return response
+        finally:
+            if lane is not None:
+                lane.release()
+
+    async def answer_async(self, question: str, use_cache: bool = True) -> AgentResponse:
+        """`answer` on the running event loop: database and Ollama waits yield to other questions.
+
+        Call `warm_up_async` first to pool connections; without it every query
+        opens its own connection.
+        """
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        resolved, spec, plan = await self.plan_async(question, timings)
 
         if plan is None:
-            plan = self._fallback_plan(question, resolved, spec)
+            with _timed(timings, "llm_sql"):
+                plan = await self._fallback_plan_async(question, resolved, spec)
             if plan is None:
-                clarification = ""
-                if resolved.ambiguities:
-                    clarification = f" Clarifications needed: {' '.join(resolved.ambiguities)}"
-                return AgentResponse(
-                    answer=(
-                        "Could not map the question to a safe query."
-                        " Please rephrase with a clear player/team and metric."
-                        f"{clarification}"
-                    ),
-                    intent=intent,
-                    sql="",
-                    sql_source="none",
-                    columns=[],
-                    rows=[],
-                    provenance={
-                        "intent": intent.value,
-                        "ambiguities": resolved.ambiguities,
-                    },
-                )
+                return self._unmapped_response(resolved, spec, timings, started)
 
         try:
-            safe_sql = self.guardrails.validate_and_rewrite(plan.sql)
+            with _timed(timings, "validate"):
+                safe_sql = self.guardrails.validate_and_rewrite(plan.sql)
         except SQLValidationError as exc:
-            return AgentResponse(
-                answer=f"Query rejected by guardrails: {exc}",
-                intent=intent,
-                sql=plan.sql,
-                sql_source=plan.source,
-                columns=[],
-                rows=[],
-                provenance={
-                    "intent": intent.value,
-                    "notes": plan.notes,
-                },
-            )
+            return self._rejected_response(spec, plan, exc, timings, started)
 
-        result = self.executor.run(safe_sql, plan.params)
-        answer = self.insights.summarize(question, result, spec)
+        with _timed(timings, "execute"):
+            result, execution = await self._execute_async(safe_sql, plan, use_cache)
+        with _timed(timings, "summarize"):
+            answer = await self.insights.summarize_async(question, result, spec)
+        response = self._response(resolved, spec, plan, safe_sql, result, answer, timings, started)
+        response.provenance.update(execution)
+        return response
+
+    def _execute(self, sql: str, plan: SQLPlan, use_cache: bool) -> tuple[QueryResult, dict[str, Any]]:
+        """The query's result and how it was obtained, for provenance."""
+        cache = self._cache_for(plan, use_cache)
+        if cache is not None:
+            cached = cache.get(sql, plan.params)
+            if cached is not None:
+                return cached[0], {"result_cache": f"{cached[1]}_hit", "shared_execution": False}
+
+        def run() -> QueryResult:
+            result = self.executor.run(sql, plan.params)
+            if cache is not None:
+                cache.put(sql, plan.params, result)
+            return result
+
+        result, shared = self.query_flights.run(_query_key(sql, plan.params), run)
+        return result, {"result_cache": _cache_status(cache, use_cache), "shared_execution": shared}
+
+    async def _execute_async(self, sql: str, plan: SQLPlan, use_cache: bool) -> tuple[QueryResult, dict[str, Any]]:
+        # The cache's SQLite reads and writes run in worker threads, off the event loop.
+        cache = self._cache_for(plan, use_cache)
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, sql, plan.params)
+            if cached is not None:
+                return cached[0], {"result_cache": f"{cached[1]}_hit", "shared_execution": False}
+
+        async def run() -> QueryResult:
+            result = await self.executor.run_async(sql, plan.params)
+            if cache is not None:
+                await asyncio.to_thread(cache.put, sql, plan.params, result)
+            return result
+
+        result, shared = await self.query_flights.run_async(_query_key(sql, plan.params), run)
+        return result, {"result_cache": _cache_status(cache, use_cache), "shared_execution": shared}
+
+    def _cache_for(self, plan: SQLPlan, use_cache: bool) -> ResultCache | None:
+        # LLM-written SQL may call now() or random(); only template results are reused.
+        if not use_cache or plan.source == "llm_fallback":
+            return None
+        return self.result_cache
 
+    def _plan_resolved(
+        self,
+        question: str,
+        resolved: ResolvedContext,
+        timings: dict[str, float],
+    ) -> tuple[ResolvedContext, QuerySpec, SQLPlan | None]:
+        with _timed(timings, "plan"):
+            spec = self.spec_builder.build(question, resolved)
+            plan = self.queries.build(spec, resolved)
+        return resolved, spec, plan
+
+    def _unmapped_response(
+        self,
+        resolved: ResolvedContext,
+        spec: QuerySpec,
+        timings: dict[str, float],
+        started: float,
+    ) -> AgentResponse:
+        clarification = ""
+        if resolved.ambiguities:
+            clarification = f" Clarifications needed: {' '.join(resolved.ambiguities)}"
+        return AgentResponse(
+            answer=(
+                "Could not map the question to a safe query."
+                " Please rephrase with a clear player/team and metric."
+                f"{clarification}"
+            ),
+            intent=spec.intent,
+            sql="",
+            sql_source="none",
+            columns=[],
+            rows=[],
+            provenance={
+                "intent": spec.intent.value,
+                "ambiguities": resolved.ambiguities,
+            },
+            timings_ms=_finish(timings, started),
+        )
+
+    def _rejected_response(
+        self,
+        spec: QuerySpec,
+        plan: SQLPlan,
+        exc: SQLValidationError,
+        timings: dict[str, float],
+        started: float,
+    ) -> AgentResponse:
+        return AgentResponse(
+            answer=f"Query rejected by guardrails: {exc}",
+            intent=spec.intent,
+            sql=plan.sql,
+            sql_source=plan.source,
+            columns=[],
+            rows=[],
+            provenance={
+                "intent": spec.intent.value,
+                "notes": plan.notes,
+            },
+            timings_ms=_finish(timings, started),
+        )
+
+    def _response(
+        self,
+        resolved: ResolvedContext,
+        spec: QuerySpec,
+        plan: SQLPlan,
+        safe_sql: str,
+        result: QueryResult,
+        answer: str,
+        timings: dict[str, float],
+        started: float,
+    ) -> AgentResponse:
         provenance = {
-            "intent": intent.value,
+            "intent": spec.intent.value,
             "query_family": spec.family.value,
             "source": plan.source,
             "teams": [team.name for team in resolved.teams],
@@ -116,17 +346,17 @@ class AnalyticsAgent:
 
         return AgentResponse(
             answer=answer,
-            intent=intent,
+            intent=spec.intent,
             sql=safe_sql,
             sql_source=plan.source,
             columns=result.columns,
             rows=result.rows,
             provenance=provenance,
+            timings_ms=_finish(timings, started),
         )
 
     def _fallback_plan(self, question: str, resolved, spec: QuerySpec) -> SQLPlan | None:
-        schema = fetch_schema_context(self.settings.database_url, ALLOWED_TABLES)
-
+        schema = self._load_schema_context()
         try:
             return self.fallback.build_plan(
                 question=question,
@@ -137,3 +367,61 @@ class AnalyticsAgent:
             )
         except Exception:
             return None
+
+    async def _fallback_plan_async(self, question: str, resolved, spec: QuerySpec) -> SQLPlan | None:
+        # Fetched once per process; concurrent first misses wait on the lock in worker threads.
+        schema = self._schema_context
+        if schema is None:
+            schema = await asyncio.to_thread(self._load_schema_context)
+        try:
+            return await self.fallback.build_plan_async(
+                question=question,
+                context=resolved,
+                spec=spec,
+                schema_context=schema,
+                max_rows=self.settings.sql_max_rows,
+            )
+        except Exception:
+            return None
+
+    def _load_schema_context(self) -> str:
+        with self._schema_lock:
+            if self._schema_context is None:
+                self._schema_context = fetch_schema_context(self.settings.database_url, ALLOWED_TABLES)
+            return self._schema_context
+
+
+
+def _cache_status(cache: ResultCache | None, use_cache: bool) -> str:
+    if cache is not None:
+        return "miss"
+    return "off" if use_cache else "bypassed"
+
+
+def _query_key(sql: str, params: tuple[Any, ...]) -> tuple[str, str]:
+    # repr keeps parameters hashable and tells 1, 1.0 and "1" apart.
+    return sql, repr(params)
+
+
+def _admit(admission: AdmissionController | None, lane_name: str, timings: dict[str, float]) -> Lane | None:
+    if admission is None:
+        return None
+    lane = admission.lanes[lane_name]
+    started = time.perf_counter()
+    lane.acquire()
+    timings["queue"] = round(timings.get("queue", 0.0) + (time.perf_counter() - started) * 1000, 2)
+    return lane
+
+
+@contextmanager
+def _timed(timings: dict[str, float], step: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[step] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def _finish(timings: dict[str, float], started: float) -> dict[str, float]:
+    timings["total"] = round((time.perf_counter() - started) * 1000, 2)
+    return timings
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any
+
+from data_ingestion.data_version import DEFAULT_DATA_VERSION_PATH, read_data_version
+
+from .types import QueryResult
+
+
+DEFAULT_RESULT_CACHE_PATH = Path("data/processed/result_cache.sqlite3")
+DEFAULT_RESULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Results held in process memory in front of the database file.
+MEMORY_ENTRIES = 256
+
+# Bump when the pickled payload changes shape so older entries are ignored.
+CACHE_FORMAT = 1
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    data_version TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+class ResultCache:
+    """Query results keyed by SQL, parameters and the ETL data version.
+
+    An in-memory LRU sits in front of a SQLite file shared by every process on
+    the machine. Entries from older data versions are never returned and are
+    deleted on the first write after a load; beyond `max_bytes` the least
+    recently used entries are evicted. Without a data version (no local ETL
+    run) nothing is cached, since stale results could not be detected.
+
+    Cache failures never fail a question: errors are counted and treated as misses.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_RESULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+        memory_entries: int = MEMORY_ENTRIES,
+        data_version_path: Path = DEFAULT_DATA_VERSION_PATH,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.data_version_path = data_version_path
+        self.counts: Counter[str] = Counter()
+        self._memory: OrderedDict[str, QueryResult] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._pruned_version: str | None = None
+        self._lock = threading.Lock()
+
+    def get(self, sql: str, params: tuple[Any, ...]) -> tuple[QueryResult, str] | None:
+        """The cached result and the tier it came from ("memory" or "disk"), or None."""
+        version = read_data_version(self.data_version_path)
+        if version is None:
+            return None
+        key = _cache_key(version, sql, params)
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.counts["memory_hits"] += 1
+                return result, "memory"
+
+            result = self._read(key)
+            if result is None:
+                self.counts["misses"] += 1
+                return None
+            self._remember(key, result)
+            self.counts["disk_hits"] += 1
+            return result, "disk"
+
+    def put(self, sql: str, params: tuple[Any, ...], result: QueryResult) -> None:
+        version = read_data_version(self.data_version_path)
+        if version is None:
+            return
+        key = _cache_key(version, sql, params)
+        payload = pickle.dumps((CACHE_FORMAT, result.columns, result.rows), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, result)
+            if len(payload) > self.max_bytes:
+                return
+            try:
+                conn = self._connect()
+                with conn:
+                    if self._pruned_version != version:
+                        conn.execute("DELETE FROM results WHERE data_version != ?", (version,))
+                        self._pruned_version = version
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                        (key, version, payload, len(payload), time.time()),
+                    )
+                    self._evict(conn)
+            except (sqlite3.Error, OSError):
+                self.counts["errors"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM results")
+            except (sqlite3.Error, OSError):
+                self.counts["errors"] += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            try:
+                conn = self._connect()
+                entries, size = conn.execute("SELECT count(*), coalesce(sum(size), 0) FROM results").fetchone()
+            except (sqlite3.Error, OSError):
+                entries, size = None, None
+            counts = {name: self.counts[name] for name in ("memory_hits", "disk_hits", "misses", "evictions", "errors")}
+            return {
+                "path": str(self.path),
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "memory_entries": len(self._memory),
+                **counts,
+            }
+
+    def _read(self, key: str) -> QueryResult | None:
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with conn:
+                conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            cache_format, columns, rows = pickle.loads(row[0])
+        except (sqlite3.Error, OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError):
+            self.counts["errors"] += 1
+            return None
+        if cache_format != CACHE_FORMAT:
+            return None
+        return QueryResult(columns=columns, rows=rows)
+
+    def _remember(self, key: str, result: QueryResult) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT coalesce(sum(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Oldest first, until the total fits.
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY last_used").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self.counts["evictions"] += evicted
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Request threads share the connection under self._lock; other processes
+            # use their own and SQLite's file locking, waiting up to `timeout` seconds.
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA_SQL)
+            self._conn = conn
+        return self._conn
+
+
+def _cache_key(data_version: str, sql: str, params: tuple[Any, ...]) -> str:
+    material = "\x00".join([data_version, sql, repr(params)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
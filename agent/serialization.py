@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from .types import AgentResponse, IntentType
+
+
+def json_default(value: Any) -> Any:
+    """`json.dumps` fallback for values psycopg returns in result rows."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def response_to_dict(response: AgentResponse) -> dict[str, Any]:
+    payload = asdict(response)
+    payload["intent"] = response.intent.value
+    return payload
+
+
+def response_from_dict(payload: dict[str, Any]) -> AgentResponse:
+    return AgentResponse(**{**payload, "intent": IntentType(payload["intent"])})
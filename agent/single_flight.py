@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it runs
+    wait and receive the same value (or exception). Nothing is kept once the call
+    finishes, so this is not a cache: a later call runs again.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._futures: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """`fn()` or the result of the identical call in flight; the flag is True when shared."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        self._count("executed" if leader else "shared")
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+    async def run_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """`run` for coroutines; only calls on the same event loop are coalesced."""
+        loop = asyncio.get_running_loop()
+        future = self._futures.get(key)
+        if future is not None and future.get_loop() is loop:
+            self._count("shared")
+            return await asyncio.shield(future), True
+
+        future = self._futures[key] = loop.create_future()
+        self._count("executed")
+        try:
+            value = await fn()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Marks the exception retrieved when no caller was waiting for it.
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"executed": self.counts["executed"], "shared": self.counts["shared"]}
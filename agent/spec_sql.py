@@ -4,6 +4,13 @@ from .query_spec import QueryFamily, QuerySpec
 from .types import ResolvedContext, SQLPlan
 
 
+# Resolved entities carry the natural text ids; queries filter and join on the
+# integer surrogate keys, looking each key up once per query.
+TEAM_KEY = "(SELECT team_key FROM teams WHERE team_id = %s)"
+PLAYER_KEY = "(SELECT player_key FROM players WHERE player_id = %s)"
+SEASON_ID = "(SELECT season_id FROM seasons WHERE season_label = %s)"
+
+
 class QuerySQLBuilder:
     def build(self, spec: QuerySpec, context: ResolvedContext) -> SQLPlan | None:
         if spec.family == QueryFamily.CONDITIONAL_TEAM_PERFORMANCE:
@@ -36,29 +43,26 @@ class QuerySQLBuilder:
 
         team = context.teams[0]
         player = context.players[0]
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "f.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "f.season_id")
 
         sql = f"""
         SELECT
           t.team_name,
           p.player_name,
           COUNT(*) AS games,
-          SUM(CASE WHEN tgr.is_win = 1 THEN 1 ELSE 0 END) AS wins,
-          ROUND(AVG(tgr.is_win::numeric) * 100, 2) AS win_pct,
-          ROUND(AVG(pgs.points)::numeric, 2) AS avg_player_points,
-          ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_team_points
-        FROM player_game_stats pgs
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        JOIN team_game_results tgr ON tgr.game_id = g.game_id AND tgr.team_id = pgs.team_id
-        JOIN teams t ON t.team_id = pgs.team_id
-        JOIN players p ON p.player_id = pgs.player_id
-        WHERE pgs.player_id = %s
-          AND pgs.team_id = %s
+          SUM(CASE WHEN f.is_win THEN 1 ELSE 0 END) AS wins,
+          ROUND(AVG(f.is_win::int::numeric) * 100, 2) AS win_pct,
+          ROUND(AVG(f.points)::numeric, 2) AS avg_player_points,
+          ROUND(AVG(f.team_points)::numeric, 2) AS avg_team_points
+        FROM player_game_facts f
+        JOIN teams t ON t.team_key = f.team_key
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.player_key = {PLAYER_KEY}
+          AND f.team_key = {TEAM_KEY}
           {game_scope_clause}
           {season_clause}
-          AND pgs.{spec.threshold_stat} {spec.threshold_operator} %s
+          AND f.{spec.threshold_stat} {spec.threshold_operator} %s
         GROUP BY t.team_name, p.player_name;
         """
 
@@ -81,15 +85,15 @@ class QuerySQLBuilder:
             return None
 
         player = context.players[0]
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "f.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "f.season_id")
 
         params: list[object] = [spec.threshold_value, player.id]
         team_clause = ""
         team_note = "Team scope: all teams."
         if context.teams:
             team = context.teams[0]
-            team_clause = "AND pgs.team_id = %s"
+            team_clause = f"AND f.team_key = {TEAM_KEY}"
             params.append(team.id)
             team_note = f"Team scope: {team.name}."
 
@@ -103,16 +107,14 @@ class QuerySQLBuilder:
           '{spec.threshold_operator}' AS threshold_operator,
           %s::numeric AS threshold_value,
           COUNT(*) AS games_meeting_threshold,
-          ROUND(AVG(pgs.{spec.threshold_stat})::numeric, 2) AS avg_stat_value
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+          ROUND(AVG(f.{spec.threshold_stat})::numeric, 2) AS avg_stat_value
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
-          AND pgs.{spec.threshold_stat} {spec.threshold_operator} %s
+          AND f.{spec.threshold_stat} {spec.threshold_operator} %s
         GROUP BY p.player_name;
         """
 
@@ -133,25 +135,20 @@ class QuerySQLBuilder:
             return None
 
         player = context.players[0]
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "f.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "f.season_id")
         params: list[object] = [player.id]
 
         team_clause = ""
         team_note = "Team scope: all teams."
         if context.teams and spec.against_mode:
             opponent = context.teams[0]
-            team_clause = """
-            AND (
-              (g.home_team_id = pgs.team_id AND g.away_team_id = %s)
-              OR (g.away_team_id = pgs.team_id AND g.home_team_id = %s)
-            )
-            """
-            params.extend([opponent.id, opponent.id])
+            team_clause = f"AND f.opponent_team_key = {TEAM_KEY}"
+            params.append(opponent.id)
             team_note = f"Opponent scope: {opponent.name}."
         elif context.teams:
             team = context.teams[0]
-            team_clause = "AND pgs.team_id = %s"
+            team_clause = f"AND f.team_key = {TEAM_KEY}"
             params.append(team.id)
             team_note = f"Team scope: {team.name}."
 
@@ -214,30 +211,28 @@ class QuerySQLBuilder:
         SELECT
           p.player_name,
           COUNT(*) AS games,
-          ROUND(AVG(pgs.points)::numeric, 2) AS avg_points,
-          ROUND(AVG(pgs.rebounds)::numeric, 2) AS avg_rebounds,
-          ROUND(AVG(pgs.assists)::numeric, 2) AS avg_assists,
-          ROUND(AVG(pgs.steals)::numeric, 2) AS avg_steals,
-          ROUND(AVG(pgs.blocks)::numeric, 2) AS avg_blocks,
-          ROUND(AVG(pgs.turnovers)::numeric, 2) AS avg_turnovers,
-          ROUND(AVG(pgs.minutes)::numeric, 2) AS avg_minutes,
+          ROUND(AVG(f.points)::numeric, 2) AS avg_points,
+          ROUND(AVG(f.rebounds)::numeric, 2) AS avg_rebounds,
+          ROUND(AVG(f.assists)::numeric, 2) AS avg_assists,
+          ROUND(AVG(f.steals)::numeric, 2) AS avg_steals,
+          ROUND(AVG(f.blocks)::numeric, 2) AS avg_blocks,
+          ROUND(AVG(f.turnovers)::numeric, 2) AS avg_turnovers,
+          ROUND(AVG(f.minutes)::numeric, 2) AS avg_minutes,
           ROUND(
-            (SUM(COALESCE(pgs.fg_made, 0))::numeric / NULLIF(SUM(COALESCE(pgs.fg_attempts, 0)), 0)) * 100,
+            (SUM(COALESCE(f.fg_made, 0))::numeric / NULLIF(SUM(COALESCE(f.fg_attempts, 0)), 0)) * 100,
             2
           ) AS fg_pct,
           ROUND(
-            (SUM(COALESCE(pgs.three_made, 0))::numeric / NULLIF(SUM(COALESCE(pgs.three_attempts, 0)), 0)) * 100,
+            (SUM(COALESCE(f.three_made, 0))::numeric / NULLIF(SUM(COALESCE(f.three_attempts, 0)), 0)) * 100,
             2
           ) AS three_pct,
           ROUND(
-            (SUM(COALESCE(pgs.ft_made, 0))::numeric / NULLIF(SUM(COALESCE(pgs.ft_attempts, 0)), 0)) * 100,
+            (SUM(COALESCE(f.ft_made, 0))::numeric / NULLIF(SUM(COALESCE(f.ft_attempts, 0)), 0)) * 100,
             2
           ) AS ft_pct
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
@@ -253,37 +248,35 @@ class QuerySQLBuilder:
         return f"""
         SELECT
           p.player_name,
-          s.season_label,
+          f.season_label,
           COUNT(*) AS games,
-          ROUND(AVG(pgs.points)::numeric, 2) AS avg_points,
-          ROUND(AVG(pgs.rebounds)::numeric, 2) AS avg_rebounds,
-          ROUND(AVG(pgs.assists)::numeric, 2) AS avg_assists,
-          ROUND(AVG(pgs.steals)::numeric, 2) AS avg_steals,
-          ROUND(AVG(pgs.blocks)::numeric, 2) AS avg_blocks,
-          ROUND(AVG(pgs.turnovers)::numeric, 2) AS avg_turnovers,
-          ROUND(AVG(pgs.minutes)::numeric, 2) AS avg_minutes,
+          ROUND(AVG(f.points)::numeric, 2) AS avg_points,
+          ROUND(AVG(f.rebounds)::numeric, 2) AS avg_rebounds,
+          ROUND(AVG(f.assists)::numeric, 2) AS avg_assists,
+          ROUND(AVG(f.steals)::numeric, 2) AS avg_steals,
+          ROUND(AVG(f.blocks)::numeric, 2) AS avg_blocks,
+          ROUND(AVG(f.turnovers)::numeric, 2) AS avg_turnovers,
+          ROUND(AVG(f.minutes)::numeric, 2) AS avg_minutes,
           ROUND(
-            (SUM(COALESCE(pgs.fg_made, 0))::numeric / NULLIF(SUM(COALESCE(pgs.fg_attempts, 0)), 0)) * 100,
+            (SUM(COALESCE(f.fg_made, 0))::numeric / NULLIF(SUM(COALESCE(f.fg_attempts, 0)), 0)) * 100,
             2
           ) AS fg_pct,
           ROUND(
-            (SUM(COALESCE(pgs.three_made, 0))::numeric / NULLIF(SUM(COALESCE(pgs.three_attempts, 0)), 0)) * 100,
+            (SUM(COALESCE(f.three_made, 0))::numeric / NULLIF(SUM(COALESCE(f.three_attempts, 0)), 0)) * 100,
             2
           ) AS three_pct,
           ROUND(
-            (SUM(COALESCE(pgs.ft_made, 0))::numeric / NULLIF(SUM(COALESCE(pgs.ft_attempts, 0)), 0)) * 100,
+            (SUM(COALESCE(f.ft_made, 0))::numeric / NULLIF(SUM(COALESCE(f.ft_attempts, 0)), 0)) * 100,
             2
           ) AS ft_pct
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
-        GROUP BY p.player_name, s.start_year, s.season_label
-        ORDER BY s.start_year;
+        GROUP BY p.player_name, f.start_year, f.season_label
+        ORDER BY f.start_year;
         """
 
     def _player_stat_sql(
@@ -301,18 +294,16 @@ class QuerySQLBuilder:
           %s AS metric_name,
           %s AS stat_operation,
           COUNT(*) AS games,
-          ROUND(SUM(COALESCE(pgs.{metric}, 0))::numeric, 2) AS total_value,
-          ROUND(AVG(pgs.{metric})::numeric, 2) AS avg_value,
-          ROUND(MAX(pgs.{metric})::numeric, 2) AS max_value,
-          ROUND(MIN(pgs.{metric})::numeric, 2) AS min_value,
-          COUNT(pgs.{metric}) AS non_null_games,
-          ROUND((SUM(COALESCE(pgs.{metric}, 0))::numeric / NULLIF(COUNT(*), 0))::numeric, 2) AS per_game_value,
+          ROUND(SUM(COALESCE(f.{metric}, 0))::numeric, 2) AS total_value,
+          ROUND(AVG(f.{metric})::numeric, 2) AS avg_value,
+          ROUND(MAX(f.{metric})::numeric, 2) AS max_value,
+          ROUND(MIN(f.{metric})::numeric, 2) AS min_value,
+          COUNT(f.{metric}) AS non_null_games,
+          ROUND((SUM(COALESCE(f.{metric}, 0))::numeric / NULLIF(COUNT(*), 0))::numeric, 2) AS per_game_value,
           {requested_value_expr} AS requested_value
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
@@ -331,27 +322,25 @@ class QuerySQLBuilder:
         return f"""
         SELECT
           p.player_name,
-          s.season_label,
+          f.season_label,
           %s AS metric_name,
           %s AS stat_operation,
           COUNT(*) AS games,
-          ROUND(SUM(COALESCE(pgs.{metric}, 0))::numeric, 2) AS total_value,
-          ROUND(AVG(pgs.{metric})::numeric, 2) AS avg_value,
-          ROUND(MAX(pgs.{metric})::numeric, 2) AS max_value,
-          ROUND(MIN(pgs.{metric})::numeric, 2) AS min_value,
-          COUNT(pgs.{metric}) AS non_null_games,
-          ROUND((SUM(COALESCE(pgs.{metric}, 0))::numeric / NULLIF(COUNT(*), 0))::numeric, 2) AS per_game_value,
+          ROUND(SUM(COALESCE(f.{metric}, 0))::numeric, 2) AS total_value,
+          ROUND(AVG(f.{metric})::numeric, 2) AS avg_value,
+          ROUND(MAX(f.{metric})::numeric, 2) AS max_value,
+          ROUND(MIN(f.{metric})::numeric, 2) AS min_value,
+          COUNT(f.{metric}) AS non_null_games,
+          ROUND((SUM(COALESCE(f.{metric}, 0))::numeric / NULLIF(COUNT(*), 0))::numeric, 2) AS per_game_value,
           {requested_value_expr} AS requested_value
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
-        GROUP BY p.player_name, s.start_year, s.season_label
-        ORDER BY s.start_year;
+        GROUP BY p.player_name, f.start_year, f.season_label
+        ORDER BY f.start_year;
         """
 
     def _build_player_single_game_high(self, spec: QuerySpec, context: ResolvedContext) -> SQLPlan | None:
@@ -360,25 +349,20 @@ class QuerySQLBuilder:
 
         player = context.players[0]
         metric = self._safe_player_metric(spec.metric)
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "f.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "f.season_id")
         params: list[object] = [metric, player.id]
 
         team_clause = ""
         team_note = "Team scope: all teams."
         if context.teams and spec.against_mode:
             opponent = context.teams[0]
-            team_clause = """
-            AND (
-              (g.home_team_id = pgs.team_id AND g.away_team_id = %s)
-              OR (g.away_team_id = pgs.team_id AND g.home_team_id = %s)
-            )
-            """
-            params.extend([opponent.id, opponent.id])
+            team_clause = f"AND f.opponent_team_key = {TEAM_KEY}"
+            params.append(opponent.id)
             team_note = f"Opponent scope: {opponent.name}."
         elif context.teams:
             team = context.teams[0]
-            team_clause = "AND pgs.team_id = %s"
+            team_clause = f"AND f.team_key = {TEAM_KEY}"
             params.append(team.id)
             team_note = f"Team scope: {team.name}."
 
@@ -388,27 +372,22 @@ class QuerySQLBuilder:
         SELECT
           p.player_name,
           %s AS metric_name,
-          pgs.{metric} AS metric_value,
-          g.game_date,
-          s.season_label,
+          f.{metric} AS metric_value,
+          f.game_date,
+          f.season_label,
           team.team_name,
           opp.team_name AS opponent_team,
-          g.game_type
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        JOIN teams team ON team.team_id = pgs.team_id
-        JOIN teams opp ON opp.team_id = CASE
-          WHEN g.home_team_id = pgs.team_id THEN g.away_team_id
-          ELSE g.home_team_id
-        END
-        WHERE pgs.player_id = %s
+          f.game_type
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        JOIN teams team ON team.team_key = f.team_key
+        JOIN teams opp ON opp.team_key = f.opponent_team_key
+        WHERE f.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
-          AND pgs.{metric} IS NOT NULL
-        ORDER BY pgs.{metric} DESC, g.game_date DESC
+          AND f.{metric} IS NOT NULL
+        ORDER BY f.{metric} DESC, f.game_date DESC
         LIMIT 1;
         """
 
@@ -426,19 +405,19 @@ class QuerySQLBuilder:
         )
 
     def _build_player_ranking(self, spec: QuerySpec, context: ResolvedContext) -> SQLPlan:
-        season_clause, season_params, season_note = self._season_clause(context)
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
+        season_clause, season_params, season_note = self._season_clause(context, "f.season_id")
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "f.game_type")
         ranking_limit = max(1, min(spec.ranking_limit, 50))
         metric = self._safe_player_metric(spec.metric)
 
         metric_map = {
-            "points": ("avg_points", "AVG(pgs.points)"),
-            "assists": ("avg_assists", "AVG(pgs.assists)"),
-            "rebounds": ("avg_rebounds", "AVG(pgs.rebounds)"),
-            "steals": ("avg_steals", "AVG(pgs.steals)"),
-            "blocks": ("avg_blocks", "AVG(pgs.blocks)"),
-            "turnovers": ("avg_turnovers", "AVG(pgs.turnovers)"),
-            "minutes": ("avg_minutes", "AVG(pgs.minutes)"),
+            "points": ("avg_points", "AVG(f.points)"),
+            "assists": ("avg_assists", "AVG(f.assists)"),
+            "rebounds": ("avg_rebounds", "AVG(f.rebounds)"),
+            "steals": ("avg_steals", "AVG(f.steals)"),
+            "blocks": ("avg_blocks", "AVG(f.blocks)"),
+            "turnovers": ("avg_turnovers", "AVG(f.turnovers)"),
+            "minutes": ("avg_minutes", "AVG(f.minutes)"),
         }
         order_alias, order_expr = metric_map.get(metric, metric_map["points"])
 
@@ -446,17 +425,15 @@ class QuerySQLBuilder:
         SELECT
           p.player_name,
           COUNT(*) AS games,
-          ROUND(AVG(pgs.points)::numeric, 2) AS avg_points,
-          ROUND(AVG(pgs.assists)::numeric, 2) AS avg_assists,
-          ROUND(AVG(pgs.rebounds)::numeric, 2) AS avg_rebounds,
-          ROUND(AVG(pgs.turnovers)::numeric, 2) AS avg_turnovers,
-          ROUND(AVG(pgs.minutes)::numeric, 2) AS avg_minutes,
+          ROUND(AVG(f.points)::numeric, 2) AS avg_points,
+          ROUND(AVG(f.assists)::numeric, 2) AS avg_assists,
+          ROUND(AVG(f.rebounds)::numeric, 2) AS avg_rebounds,
+          ROUND(AVG(f.turnovers)::numeric, 2) AS avg_turnovers,
+          ROUND(AVG(f.minutes)::numeric, 2) AS avg_minutes,
           ROUND(({order_expr})::numeric, 2) AS metric_value
-        FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.minutes IS NOT NULL
+        FROM player_game_facts f
+        JOIN players p ON p.player_key = f.player_key
+        WHERE f.minutes IS NOT NULL
           {game_scope_clause}
           {season_clause}
         GROUP BY p.player_name
@@ -484,8 +461,8 @@ class QuerySQLBuilder:
 
         team_a = context.teams[0]
         team_b = context.teams[1]
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "tgr.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "tgr.season_id")
 
         sql = f"""
         SELECT
@@ -496,10 +473,9 @@ class QuerySQLBuilder:
           ROUND(AVG(tgr.is_win::numeric) * 100, 2) AS win_pct,
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_points
         FROM team_game_results tgr
-        JOIN games g ON g.game_id = tgr.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        JOIN teams t ON t.team_id = tgr.team_id
-        WHERE tgr.team_id IN (%s, %s)
+        JOIN seasons s ON s.season_id = tgr.season_id
+        JOIN teams t ON t.team_key = tgr.team_key
+        WHERE tgr.team_key IN (SELECT team_key FROM teams WHERE team_id IN (%s, %s))
           {game_scope_clause}
           {season_clause}
         GROUP BY s.start_year, s.season_label, t.team_name
@@ -523,8 +499,8 @@ class QuerySQLBuilder:
             return None
 
         team = context.teams[0]
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "tgr.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "tgr.season_id")
 
         sql = f"""
         SELECT
@@ -535,9 +511,8 @@ class QuerySQLBuilder:
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_points,
           ROUND(AVG(tgr.opponent_points)::numeric, 2) AS avg_points_allowed
         FROM team_game_results tgr
-        JOIN games g ON g.game_id = tgr.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        WHERE tgr.team_id = %s
+        JOIN seasons s ON s.season_id = tgr.season_id
+        WHERE tgr.team_key = {TEAM_KEY}
           {game_scope_clause}
           {season_clause}
         GROUP BY s.start_year, s.season_label
@@ -561,8 +536,8 @@ class QuerySQLBuilder:
             return None
 
         team = context.teams[0]
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "tgr.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "tgr.season_id")
 
         sql = f"""
         SELECT
@@ -574,10 +549,9 @@ class QuerySQLBuilder:
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_points,
           ROUND(AVG(tgr.opponent_points)::numeric, 2) AS avg_points_allowed
         FROM team_game_results tgr
-        JOIN games g ON g.game_id = tgr.game_id
-        JOIN seasons s ON s.season_id = g.season_id
-        JOIN teams t ON t.team_id = tgr.team_id
-        WHERE tgr.team_id = %s
+        JOIN seasons s ON s.season_id = tgr.season_id
+        JOIN teams t ON t.team_key = tgr.team_key
+        WHERE tgr.team_key = {TEAM_KEY}
           {game_scope_clause}
           {season_clause}
         GROUP BY t.team_name;
@@ -602,35 +576,24 @@ class QuerySQLBuilder:
         team_a = context.teams[0]
         team_b = context.teams[1]
         game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
-        params: list[object] = [
-            team_a.id,
-            team_b.id,
-            team_a.id,
-            team_a.id,
-            team_b.id,
-            team_a.id,
-            team_b.id,
-            team_b.id,
-            team_a.id,
-        ]
-        params.extend(season_params)
+        season_clause, season_params, season_note = self._season_clause(context, "g.season_id")
+        params: list[object] = [team_a.id, team_b.id, *season_params]
 
         sql = f"""
         SELECT
           ta.team_name AS team_a,
           tb.team_name AS team_b,
           COUNT(*) AS games,
-          SUM(CASE WHEN g.winner_team_id = %s THEN 1 ELSE 0 END) AS team_a_wins,
-          SUM(CASE WHEN g.winner_team_id = %s THEN 1 ELSE 0 END) AS team_b_wins,
-          ROUND(AVG(CASE WHEN g.winner_team_id = %s THEN 1 ELSE 0 END)::numeric * 100, 2)
+          SUM(CASE WHEN g.winner_team_key = ta.team_key THEN 1 ELSE 0 END) AS team_a_wins,
+          SUM(CASE WHEN g.winner_team_key = tb.team_key THEN 1 ELSE 0 END) AS team_b_wins,
+          ROUND(AVG(CASE WHEN g.winner_team_key = ta.team_key THEN 1 ELSE 0 END)::numeric * 100, 2)
             AS team_a_win_pct
         FROM games g
         JOIN teams ta ON ta.team_id = %s
         JOIN teams tb ON tb.team_id = %s
         WHERE (
-            (g.home_team_id = %s AND g.away_team_id = %s)
-            OR (g.home_team_id = %s AND g.away_team_id = %s)
+            (g.home_team_key = ta.team_key AND g.away_team_key = tb.team_key)
+            OR (g.home_team_key = tb.team_key AND g.away_team_key = ta.team_key)
           )
           {game_scope_clause}
           {season_clause}
@@ -650,8 +613,8 @@ class QuerySQLBuilder:
         )
 
     def _build_team_ranking(self, spec: QuerySpec, context: ResolvedContext) -> SQLPlan:
-        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope)
-        season_clause, season_params, season_note = self._season_clause(context)
+        game_scope_clause, game_scope_note = self._scope_clause(spec.game_scope, "tgr.game_type")
+        season_clause, season_params, season_note = self._season_clause(context, "tgr.season_id")
         metric_alias, metric_expr, metric_direction = self._team_ranking_metric(spec.metric)
         ranking_limit = max(1, min(spec.ranking_limit, 50))
 
@@ -665,9 +628,8 @@ class QuerySQLBuilder:
           ROUND(AVG(tgr.opponent_points)::numeric, 2) AS avg_points_allowed,
           {metric_expr} AS metric_value
         FROM team_game_results tgr
-        JOIN teams t ON t.team_id = tgr.team_id
-        JOIN games g ON g.game_id = tgr.game_id
-        JOIN seasons s ON s.season_id = g.season_id
+        JOIN teams t ON t.team_key = tgr.team_key
+        JOIN seasons s ON s.season_id = tgr.season_id
         WHERE 1=1
           {game_scope_clause}
           {season_clause}
@@ -690,25 +652,33 @@ class QuerySQLBuilder:
             ],
         )
 
-    def _scope_clause(self, game_scope: str) -> tuple[str, str]:
+    def _scope_clause(self, game_scope: str, column: str = "g.game_type") -> tuple[str, str]:
         if game_scope == "all":
             return "AND 1=1", "Game scope: all games."
         if game_scope == "playoffs":
-            return "AND g.game_type = 'playoffs'", "Game scope: playoffs."
+            return f"AND {column} = 'playoffs'", "Game scope: playoffs."
         if game_scope == "preseason":
-            return "AND g.game_type = 'preseason'", "Game scope: preseason."
-        return "AND g.game_type = 'regular'", "Game scope: regular season (default)."
+            return f"AND {column} = 'preseason'", "Game scope: preseason."
+        return f"AND {column} = 'regular'", "Game scope: regular season (default)."
 
-    def _season_clause(self, context: ResolvedContext) -> tuple[str, tuple[object, ...], str]:
+    def _season_clause(
+        self,
+        context: ResolvedContext,
+        *columns: str,
+    ) -> tuple[str, tuple[object, ...], str]:
+        # Filtering each partitioned table's own season_id on scalar subqueries lets the
+        # executor prune season partitions; a join to seasons alone would scan them all.
         if not context.seasons:
             return "", (), "Season scope: all available seasons."
         if len(context.seasons) == 1:
             season = context.seasons[0]
-            return "AND s.season_label = %s", (season,), f"Season scope: {season}."
-        placeholders = ", ".join(["%s"] * len(context.seasons))
+            clause = "\n          ".join(f"AND {column} = {SEASON_ID}" for column in columns)
+            return clause, (season,) * len(columns), f"Season scope: {season}."
+        season_ids = ", ".join([SEASON_ID] * len(context.seasons))
+        clause = "\n          ".join(f"AND {column} IN ({season_ids})" for column in columns)
         return (
-            f"AND s.season_label IN ({placeholders})",
-            tuple(context.seasons),
+            clause,
+            tuple(context.seasons) * len(columns),
             f"Season scope: {context.seasons[0]} to {context.seasons[-1]} ({len(context.seasons)} seasons).",
         )
 
@@ -722,14 +692,14 @@ class QuerySQLBuilder:
 
     def _player_operation_expression(self, metric: str, operation: str) -> str:
         if operation == "sum":
-            return f"ROUND(SUM(COALESCE(pgs.{metric}, 0))::numeric, 2)"
+            return f"ROUND(SUM(COALESCE(f.{metric}, 0))::numeric, 2)"
         if operation == "max":
-            return f"ROUND(MAX(pgs.{metric})::numeric, 2)"
+            return f"ROUND(MAX(f.{metric})::numeric, 2)"
         if operation == "min":
-            return f"ROUND(MIN(pgs.{metric})::numeric, 2)"
+            return f"ROUND(MIN(f.{metric})::numeric, 2)"
         if operation == "count":
-            return f"COUNT(pgs.{metric})"
-        return f"ROUND(AVG(pgs.{metric})::numeric, 2)"
+            return f"COUNT(f.{metric})"
+        return f"ROUND(AVG(f.{metric})::numeric, 2)"
 
     def _team_ranking_metric(self, metric: str) -> tuple[str, str, str]:
         metric_map = {
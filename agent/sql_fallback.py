@@ -24,6 +24,36 @@ class SQLFallbackGenerator:
         schema_context: str,
         max_rows: int,
     ) -> SQLPlan | None:
+        content = self.ollama.chat(
+            model=self.model,
+            messages=self._plan_messages(question, context, spec, schema_context, max_rows),
+            temperature=0.0,
+        )
+        return self._plan_from_content(content)
+
+    async def build_plan_async(
+        self,
+        question: str,
+        context: ResolvedContext,
+        spec: QuerySpec,
+        schema_context: str,
+        max_rows: int,
+    ) -> SQLPlan | None:
+        content = await self.ollama.chat_async(
+            model=self.model,
+            messages=self._plan_messages(question, context, spec, schema_context, max_rows),
+            temperature=0.0,
+        )
+        return self._plan_from_content(content)
+
+    def _plan_messages(
+        self,
+        question: str,
+        context: ResolvedContext,
+        spec: QuerySpec,
+        schema_context: str,
+        max_rows: int,
+    ) -> list[dict[str, str]]:
         system_prompt = (
             "You are a PostgreSQL SQL assistant. "
             "Return one read-only SQL query only. "
@@ -49,16 +79,12 @@ class SQLFallbackGenerator:
                 "Return SQL only.",
             ]
         )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-        content = self.ollama.chat(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.0,
-        )
-
+    def _plan_from_content(self, content: str) -> SQLPlan | None:
         sql = self._extract_sql(content)
         if not sql:
             return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .spec_sql import PLAYER_KEY, TEAM_KEY
 from .types import IntentType, ResolvedContext, SQLPlan
 
 
@@ -58,13 +59,14 @@ class TemplateSQLBuilder:
           ROUND(AVG(pgs.points)::numeric, 2) AS avg_player_points,
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_team_points
         FROM player_game_stats pgs
-        JOIN games g ON g.game_id = pgs.game_id
+        JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        JOIN team_game_results tgr ON tgr.game_id = g.game_id AND tgr.team_id = pgs.team_id
-        JOIN teams t ON t.team_id = pgs.team_id
-        JOIN players p ON p.player_id = pgs.player_id
-        WHERE pgs.player_id = %s
-          AND pgs.team_id = %s
+        JOIN team_game_results tgr
+          ON tgr.season_id = g.season_id AND tgr.game_key = g.game_key AND tgr.team_key = pgs.team_key
+        JOIN teams t ON t.team_key = pgs.team_key
+        JOIN players p ON p.player_key = pgs.player_key
+        WHERE pgs.player_key = {PLAYER_KEY}
+          AND pgs.team_key = {TEAM_KEY}
           {game_scope_clause}
           {season_clause}
           AND pgs.{threshold_stat} {threshold_operator} %s
@@ -96,7 +98,7 @@ class TemplateSQLBuilder:
 
         if context.teams:
             team = context.teams[0]
-            team_clause = "AND pgs.team_id = %s"
+            team_clause = f"AND pgs.team_key = {TEAM_KEY}"
             params.append(team.id)
             team_note = f"Team scope: {team.name}."
 
@@ -114,10 +116,10 @@ class TemplateSQLBuilder:
           COUNT(*) AS games_meeting_threshold,
           ROUND(AVG(pgs.{threshold_stat})::numeric, 2) AS avg_stat_value
         FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
+        JOIN players p ON p.player_key = pgs.player_key
+        JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+        WHERE pgs.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
@@ -154,17 +156,17 @@ class TemplateSQLBuilder:
 
         if context.teams and context.against_mode:
             opponent = context.teams[0]
-            team_clause = """
+            team_clause = f"""
             AND (
-              (g.home_team_id = pgs.team_id AND g.away_team_id = %s)
-              OR (g.away_team_id = pgs.team_id AND g.home_team_id = %s)
+              (g.home_team_key = pgs.team_key AND g.away_team_key = {TEAM_KEY})
+              OR (g.away_team_key = pgs.team_key AND g.home_team_key = {TEAM_KEY})
             )
             """
             params.extend([opponent.id, opponent.id])
             team_note = f"Opponent scope: {opponent.name}."
         elif context.teams:
             team = context.teams[0]
-            team_clause = "AND pgs.team_id = %s"
+            team_clause = f"AND pgs.team_key = {TEAM_KEY}"
             params.append(team.id)
             team_note = f"Team scope: {team.name}."
 
@@ -185,10 +187,10 @@ class TemplateSQLBuilder:
           ROUND((SUM(COALESCE(pgs.{metric}, 0))::numeric / NULLIF(COUNT(*), 0))::numeric, 2) AS per_game_value,
           {requested_value_expr} AS requested_value
         FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
+        JOIN players p ON p.player_key = pgs.player_key
+        JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        WHERE pgs.player_id = %s
+        WHERE pgs.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
@@ -223,17 +225,17 @@ class TemplateSQLBuilder:
 
         if context.teams and context.against_mode:
             opponent = context.teams[0]
-            team_clause = """
+            team_clause = f"""
             AND (
-              (g.home_team_id = pgs.team_id AND g.away_team_id = %s)
-              OR (g.away_team_id = pgs.team_id AND g.home_team_id = %s)
+              (g.home_team_key = pgs.team_key AND g.away_team_key = {TEAM_KEY})
+              OR (g.away_team_key = pgs.team_key AND g.home_team_key = {TEAM_KEY})
             )
             """
             params.extend([opponent.id, opponent.id])
             team_note = f"Opponent scope: {opponent.name}."
         elif context.teams:
             team = context.teams[0]
-            team_clause = "AND pgs.team_id = %s"
+            team_clause = f"AND pgs.team_key = {TEAM_KEY}"
             params.append(team.id)
             team_note = f"Team scope: {team.name}."
 
@@ -250,15 +252,15 @@ class TemplateSQLBuilder:
           opp.team_name AS opponent_team,
           g.game_type
         FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
+        JOIN players p ON p.player_key = pgs.player_key
+        JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        JOIN teams team ON team.team_id = pgs.team_id
-        JOIN teams opp ON opp.team_id = CASE
-          WHEN g.home_team_id = pgs.team_id THEN g.away_team_id
-          ELSE g.home_team_id
+        JOIN teams team ON team.team_key = pgs.team_key
+        JOIN teams opp ON opp.team_key = CASE
+          WHEN g.home_team_key = pgs.team_key THEN g.away_team_key
+          ELSE g.home_team_key
         END
-        WHERE pgs.player_id = %s
+        WHERE pgs.player_key = {PLAYER_KEY}
           {team_clause}
           {game_scope_clause}
           {season_clause}
@@ -297,10 +299,10 @@ class TemplateSQLBuilder:
           ROUND(AVG(tgr.is_win::numeric) * 100, 2) AS win_pct,
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_points
         FROM team_game_results tgr
-        JOIN games g ON g.game_id = tgr.game_id
+        JOIN games g ON g.season_id = tgr.season_id AND g.game_key = tgr.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        JOIN teams t ON t.team_id = tgr.team_id
-        WHERE tgr.team_id IN (%s, %s)
+        JOIN teams t ON t.team_key = tgr.team_key
+        WHERE tgr.team_key IN (SELECT team_key FROM teams WHERE team_id IN (%s, %s))
           {game_scope_clause}
           {season_clause}
         GROUP BY s.start_year, s.season_label, t.team_name
@@ -331,9 +333,9 @@ class TemplateSQLBuilder:
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_points,
           ROUND(AVG(tgr.opponent_points)::numeric, 2) AS avg_points_allowed
         FROM team_game_results tgr
-        JOIN games g ON g.game_id = tgr.game_id
+        JOIN games g ON g.season_id = tgr.season_id AND g.game_key = tgr.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        WHERE tgr.team_id = %s
+        WHERE tgr.team_key = {TEAM_KEY}
           {game_scope_clause}
           {season_clause}
         GROUP BY s.start_year, s.season_label
@@ -365,10 +367,10 @@ class TemplateSQLBuilder:
           ROUND(AVG(tgr.team_points)::numeric, 2) AS avg_points,
           ROUND(AVG(tgr.opponent_points)::numeric, 2) AS avg_points_allowed
         FROM team_game_results tgr
-        JOIN games g ON g.game_id = tgr.game_id
+        JOIN games g ON g.season_id = tgr.season_id AND g.game_key = tgr.game_key
         JOIN seasons s ON s.season_id = g.season_id
-        JOIN teams t ON t.team_id = tgr.team_id
-        WHERE tgr.team_id = %s
+        JOIN teams t ON t.team_key = tgr.team_key
+        WHERE tgr.team_key = {TEAM_KEY}
           {game_scope_clause}
           {season_clause}
         GROUP BY t.team_name;
@@ -389,34 +391,23 @@ class TemplateSQLBuilder:
         team_b = context.teams[1]
         game_scope_clause, game_scope_note = self._scope_clause(context.game_scope)
         season_clause, season_params, season_note = self._season_clause(context)
-        params: list[object] = [
-            team_a.id,
-            team_b.id,
-            team_a.id,
-            team_a.id,
-            team_b.id,
-            team_a.id,
-            team_b.id,
-            team_b.id,
-            team_a.id,
-        ]
-        params.extend(season_params)
+        params: list[object] = [team_a.id, team_b.id, *season_params]
 
         sql = f"""
         SELECT
           ta.team_name AS team_a,
           tb.team_name AS team_b,
           COUNT(*) AS games,
-          SUM(CASE WHEN g.winner_team_id = %s THEN 1 ELSE 0 END) AS team_a_wins,
-          SUM(CASE WHEN g.winner_team_id = %s THEN 1 ELSE 0 END) AS team_b_wins,
-          ROUND(AVG(CASE WHEN g.winner_team_id = %s THEN 1 ELSE 0 END)::numeric * 100, 2)
+          SUM(CASE WHEN g.winner_team_key = ta.team_key THEN 1 ELSE 0 END) AS team_a_wins,
+          SUM(CASE WHEN g.winner_team_key = tb.team_key THEN 1 ELSE 0 END) AS team_b_wins,
+          ROUND(AVG(CASE WHEN g.winner_team_key = ta.team_key THEN 1 ELSE 0 END)::numeric * 100, 2)
             AS team_a_win_pct
         FROM games g
         JOIN teams ta ON ta.team_id = %s
         JOIN teams tb ON tb.team_id = %s
         WHERE (
-            (g.home_team_id = %s AND g.away_team_id = %s)
-            OR (g.home_team_id = %s AND g.away_team_id = %s)
+            (g.home_team_key = ta.team_key AND g.away_team_key = tb.team_key)
+            OR (g.home_team_key = tb.team_key AND g.away_team_key = ta.team_key)
           )
           {game_scope_clause}
           {season_clause}
@@ -450,8 +441,8 @@ class TemplateSQLBuilder:
           ROUND(AVG(tgr.opponent_points)::numeric, 2) AS avg_points_allowed,
           {metric_expr} AS metric_value
         FROM team_game_results tgr
-        JOIN teams t ON t.team_id = tgr.team_id
-        JOIN games g ON g.game_id = tgr.game_id
+        JOIN teams t ON t.team_key = tgr.team_key
+        JOIN games g ON g.season_id = tgr.season_id AND g.game_key = tgr.game_key
         JOIN seasons s ON s.season_id = g.season_id
         WHERE 1=1
           {game_scope_clause}
@@ -501,8 +492,8 @@ class TemplateSQLBuilder:
           ROUND(AVG(pgs.minutes)::numeric, 2) AS avg_minutes,
           ROUND(({order_expr})::numeric, 2) AS metric_value
         FROM player_game_stats pgs
-        JOIN players p ON p.player_id = pgs.player_id
-        JOIN games g ON g.game_id = pgs.game_id
+        JOIN players p ON p.player_key = pgs.player_key
+        JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
         JOIN seasons s ON s.season_id = g.season_id
         WHERE pgs.minutes IS NOT NULL
           {game_scope_clause}
@@ -67,3 +67,4 @@ class AgentResponse:
     columns: list[str]
     rows: list[dict[str, Any]]
     provenance: dict[str, Any]
+    timings_ms: dict[str, float] = field(default_factory=dict)
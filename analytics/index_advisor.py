@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import psycopg
+
+from agent.db import SESSION_OPTIONS
+
+from .query_profile import QueryProfile, profile_query
+
+
+# Sequential scans over fewer rows than this are cheaper than any index lookup.
+MIN_SCANNED_ROWS = 10_000
+MAX_INDEX_COLUMNS = 3
+
+# `col = ...`, `(col)::numeric > ...` and similar comparisons in a plan's Filter.
+FILTER_COMPARISON = re.compile(r"\(*([a-z_][a-z0-9_]*)\)*(?:::[a-z ]+)?\s*(=|<>|<=|>=|<|>)\s")
+
+PARTITION_PARENTS_SQL = """
+SELECT child.relname, parent.relname
+FROM pg_inherits inh
+JOIN pg_class child ON child.oid = inh.inhrelid
+JOIN pg_class parent ON parent.oid = inh.inhparent
+WHERE child.relnamespace = current_schema()::regnamespace
+  AND child.relkind = 'r'
+"""
+
+TABLE_COLUMNS_SQL = """
+SELECT table_name, column_name
+FROM information_schema.columns
+WHERE table_schema = current_schema()
+"""
+
+INDEX_KEYS_SQL = """
+SELECT tbl.relname, array_agg(att.attname ORDER BY key.ord)
+FROM pg_index i
+JOIN pg_class tbl ON tbl.oid = i.indrelid
+CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS key(attnum, ord)
+JOIN pg_attribute att ON att.attrelid = i.indrelid AND att.attnum = key.attnum
+WHERE tbl.relnamespace = current_schema()::regnamespace
+  AND key.ord <= i.indnkeyatts
+GROUP BY i.indexrelid, tbl.relname
+"""
+
+
+@dataclass
+class FamilyFindings:
+    queries: int = 0
+    total_ms: float = 0.0
+    seq_scans: Counter[str] = field(default_factory=Counter)
+    sort_spills: int = 0
+    join_strategies: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class IndexCandidate:
+    table: str
+    columns: tuple[str, ...]
+    question_ids: set[int] = field(default_factory=set)
+    families: set[str] = field(default_factory=set)
+    scan_ms: float = 0.0
+    tested_saving_ms: float | None = None
+
+    @property
+    def definition(self) -> str:
+        return f"CREATE INDEX ON {self.table} ({', '.join(self.columns)})"
+
+    @property
+    def expected_saving_ms(self) -> float:
+        """Measured saving when tested, else the time spent in the scans it would replace."""
+        return self.scan_ms if self.tested_saving_ms is None else self.tested_saving_ms
+
+
+@dataclass
+class SchemaCatalog:
+    partition_parents: dict[str, str]
+    table_columns: dict[str, set[str]]
+    index_keys: dict[str, list[tuple[str, ...]]]
+
+    def parent_of(self, relation: str) -> str:
+        return self.partition_parents.get(relation, relation)
+
+    def is_indexed(self, table: str, columns: tuple[str, ...]) -> bool:
+        return any(keys[: len(columns)] == columns for keys in self.index_keys.get(table, []))
+
+
+
+def load_schema_catalog(conn: psycopg.Connection) -> SchemaCatalog:
+    with conn.cursor() as cur:
+        cur.execute(PARTITION_PARENTS_SQL)
+        parents = dict(cur.fetchall())
+        cur.execute(TABLE_COLUMNS_SQL)
+        columns: dict[str, set[str]] = {}
+        for table, column in cur.fetchall():
+            columns.setdefault(table, set()).add(column)
+        cur.execute(INDEX_KEYS_SQL)
+        index_keys: dict[str, list[tuple[str, ...]]] = {}
+        for table, keys in cur.fetchall():
+            index_keys.setdefault(parents.get(table, table), []).append(tuple(keys))
+    return SchemaCatalog(parents, columns, index_keys)
+
+
+
+def iter_plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+
+def summarize_plans(profiles: list[QueryProfile], catalog: SchemaCatalog) -> dict[str, FamilyFindings]:
+    """Sequential scans, sort spills and join strategies per query family."""
+    findings: dict[str, FamilyFindings] = {}
+    for profile in profiles:
+        family = findings.setdefault(profile.query.family, FamilyFindings())
+        family.queries += 1
+        family.total_ms += profile.total_ms
+        for node in iter_plan_nodes(profile.plan):
+            node_type = node["Node Type"]
+            if node_type == "Seq Scan":
+                family.seq_scans[catalog.parent_of(node["Relation Name"])] += 1
+            elif node_type in {"Hash Join", "Merge Join", "Nested Loop"}:
+                family.join_strategies[node_type] += 1
+            elif node_type == "Sort" and node.get("Sort Space Type") == "Disk":
+                family.sort_spills += 1
+    return dict(sorted(findings.items()))
+
+
+
+def propose_indexes(profiles: list[QueryProfile], catalog: SchemaCatalog) -> list[IndexCandidate]:
+    """One candidate per filtered sequential scan over a large table, ranked by scan time.
+
+    Equality columns lead and range columns follow; candidates an existing index
+    already starts with are dropped.
+    """
+    candidates: dict[tuple[str, tuple[str, ...]], IndexCandidate] = {}
+    for profile in profiles:
+        for node in iter_plan_nodes(profile.plan):
+            if node["Node Type"] != "Seq Scan" or "Filter" not in node:
+                continue
+            loops = node.get("Actual Loops", 1)
+            scanned = (node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)) * loops
+            if scanned < MIN_SCANNED_ROWS:
+                continue
+
+            table = catalog.parent_of(node["Relation Name"])
+            columns = _filter_columns(node["Filter"], catalog.table_columns.get(table, set()))
+            if not columns or catalog.is_indexed(table, columns):
+                continue
+
+            candidate = candidates.setdefault((table, columns), IndexCandidate(table, columns))
+            candidate.question_ids.add(profile.query.question_id)
+            candidate.families.add(profile.query.family)
+            candidate.scan_ms += node.get("Actual Total Time", 0.0) * loops
+    return rank_candidates(list(candidates.values()))
+
+
+
+def measure_candidates(
+    database_url: str,
+    candidates: list[IndexCandidate],
+    profiles: list[QueryProfile],
+    runs: int = 3,
+) -> list[IndexCandidate]:
+    """Build each candidate in a rolled-back transaction and re-profile the queries it targets.
+
+    The schema is left unchanged, but each build holds a SHARE lock that blocks
+    writes to its table until the rollback.
+    """
+    by_question = {profile.query.question_id: profile for profile in profiles}
+    with psycopg.connect(database_url, options=SESSION_OPTIONS) as conn:
+        for candidate in candidates:
+            baseline = [by_question[question_id] for question_id in sorted(candidate.question_ids)]
+            with conn.transaction(force_rollback=True):
+                conn.execute(candidate.definition)
+                tested = [profile_query(conn, profile.query, runs) for profile in baseline]
+            candidate.tested_saving_ms = sum(p.total_ms for p in baseline) - sum(p.total_ms for p in tested)
+    return rank_candidates(candidates)
+
+
+
+def rank_candidates(candidates: list[IndexCandidate]) -> list[IndexCandidate]:
+    return sorted(candidates, key=lambda candidate: candidate.expected_saving_ms, reverse=True)
+
+
+
+def render_index_report(
+    findings: dict[str, FamilyFindings],
+    candidates: list[IndexCandidate],
+    skipped_questions: int,
+) -> str:
+    lines = [
+        "# Index Advisor Report",
+        "",
+        "## Workload",
+        "",
+    ]
+    if skipped_questions:
+        lines.extend([f"{skipped_questions} questions could not be planned without the LLM and were not profiled.", ""])
+
+    lines.extend(
+        [
+            "| Family | Queries | Total ms | Seq scans | Sort spills | Joins |",
+            "|---|---:|---:|---|---:|---|",
+        ]
+    )
+    for family, item in findings.items():
+        lines.append(
+            f"| {family} | {item.queries} | {item.total_ms:.1f} | {_render_counts(item.seq_scans)} "
+            f"| {item.sort_spills} | {_render_counts(item.join_strategies)} |"
+        )
+
+    lines.extend(["", "## Recommended Indexes", ""])
+    if not candidates:
+        lines.append(f"No filtered sequential scans over {MIN_SCANNED_ROWS:,}+ rows lack an index.")
+        return "\n".join(lines)
+
+    lines.extend(
+        [
+            "| Rank | Index | Families | Queries | Seq scan ms | Tested saving ms |",
+            "|---:|---|---|---:|---:|---:|",
+        ]
+    )
+    for rank, candidate in enumerate(candidates, start=1):
+        tested = "-" if candidate.tested_saving_ms is None else f"{candidate.tested_saving_ms:.1f}"
+        lines.append(
+            f"| {rank} | `{candidate.definition}` | {', '.join(sorted(candidate.families))} "
+            f"| {len(candidate.question_ids)} | {candidate.scan_ms:.1f} | {tested} |"
+        )
+
+    return "\n".join(lines)
+
+
+
+def _filter_columns(filter_text: str, table_columns: set[str]) -> tuple[str, ...]:
+    equality: list[str] = []
+    ranges: list[str] = []
+    for column, operator in FILTER_COMPARISON.findall(filter_text):
+        if column not in table_columns or column in equality or column in ranges:
+            continue
+        (equality if operator == "=" else ranges).append(column)
+    return tuple((equality + ranges)[:MAX_INDEX_COLUMNS])
+
+
+
+def _render_counts(counts: Counter[str]) -> str:
+    return ", ".join(f"{name} x{count}" for name, count in counts.most_common()) or "-"
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import psycopg
+
+from agent.db import SESSION_OPTIONS
+from agent.sql_validator import SQLValidationError
+
+if TYPE_CHECKING:
+    from agent.pipeline import AnalyticsAgent
+
+
+@dataclass
+class WorkloadQuery:
+    question_id: int
+    question: str
+    family: str
+    sql: str
+    params: tuple[Any, ...]
+
+
+@dataclass
+class QueryProfile:
+    query: WorkloadQuery
+    execution_ms: float
+    planning_ms: float
+    shared_hit_blocks: int
+    shared_read_blocks: int
+    plan: dict[str, Any] = field(repr=False)
+
+    @property
+    def total_ms(self) -> float:
+        return self.execution_ms + self.planning_ms
+
+
+@dataclass
+class WorkloadSummary:
+    queries: int = 0
+    total_ms: float = 0.0
+    shared_hit_blocks: int = 0
+    shared_read_blocks: int = 0
+
+
+
+def plan_workload(agent: AnalyticsAgent, questions: list[dict[str, Any]]) -> list[WorkloadQuery]:
+    """Turn benchmark questions into the SQL the agent would run.
+
+    Only the deterministic query builders are used, so questions that would need
+    the LLM fallback (or that fail the guardrails) are left out.
+    """
+    workload: list[WorkloadQuery] = []
+    for item in questions:
+        _, spec, plan = agent.plan(item["question"])
+        if plan is None:
+            continue
+        try:
+            sql = agent.guardrails.validate_and_rewrite(plan.sql)
+        except SQLValidationError:
+            continue
+        workload.append(
+            WorkloadQuery(
+                question_id=item["id"],
+                question=item["question"],
+                family=spec.family.value,
+                sql=sql,
+                params=tuple(plan.params),
+            )
+        )
+    return workload
+
+
+
+def profile_query(conn: psycopg.Connection, query: WorkloadQuery, runs: int = 3) -> QueryProfile:
+    """EXPLAIN (ANALYZE, BUFFERS) a query `runs` times and keep the median run."""
+    explain_sql = f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query.sql.rstrip().rstrip(';')}"
+    samples: list[dict[str, Any]] = []
+    with conn.cursor() as cur:
+        for _ in range(max(1, runs)):
+            cur.execute(explain_sql, query.params)
+            samples.append(cur.fetchone()[0][0])
+
+    samples.sort(key=lambda sample: sample["Execution Time"])
+    median = samples[len(samples) // 2]
+    plan = median["Plan"]
+    return QueryProfile(
+        query=query,
+        execution_ms=median["Execution Time"],
+        planning_ms=median["Planning Time"],
+        shared_hit_blocks=plan.get("Shared Hit Blocks", 0),
+        shared_read_blocks=plan.get("Shared Read Blocks", 0),
+        plan=plan,
+    )
+
+
+
+def profile_workload(database_url: str, workload: list[WorkloadQuery], runs: int = 3) -> list[QueryProfile]:
+    with psycopg.connect(database_url, options=SESSION_OPTIONS) as conn:
+        return [profile_query(conn, query, runs) for query in workload]
+
+
+
+def summarize_by_family(profiles: list[QueryProfile]) -> dict[str, WorkloadSummary]:
+    summaries: dict[str, WorkloadSummary] = {}
+    for profile in profiles:
+        summary = summaries.setdefault(profile.query.family, WorkloadSummary())
+        summary.queries += 1
+        summary.total_ms += profile.total_ms
+        summary.shared_hit_blocks += profile.shared_hit_blocks
+        summary.shared_read_blocks += profile.shared_read_blocks
+    return dict(sorted(summaries.items()))
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent.pipeline import AnalyticsAgent
+
+
+# A question that reaches the LLM fallback may wait on two 90 s Ollama calls.
+CLIENT_TIMEOUT_SECONDS = 200.0
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+def request_daemon(
+    socket_path: Path,
+    payload: dict[str, Any],
+    timeout: float = CLIENT_TIMEOUT_SECONDS,
+) -> dict[str, Any] | None:
+    """Send one newline-delimited JSON request; None when no daemon is listening.
+
+    Only the standard library is imported here, so forwarding `courtside ask`
+    does not pay for the agent's imports.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        sock.close()
+
+    if not line:
+        raise ConnectionError("The daemon closed the connection without replying.")
+    return json.loads(line)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: AgentDaemon
+
+    def handle(self) -> None:
+        from agent.serialization import json_default
+
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            reply = self.server.dispatch(json.loads(line))
+        except Exception as exc:
+            reply = {"error": f"{type(exc).__name__}: {exc}"}
+        self.wfile.write(json.dumps(reply, default=json_default).encode("utf-8") + b"\n")
+
+
+class AgentDaemon(socketserver.UnixStreamServer):
+    """Serves one warm agent over a Unix socket, one request at a time.
+
+    Requests are JSON objects with an `op`: `ask` (with `question` and optionally
+    `no_cache`), `ping`, `stats` or `reload`. The socket is only accessible to the current user.
+    """
+
+    def __init__(self, socket_path: Path, agent: AnalyticsAgent):
+        self.socket_path = socket_path
+        self.agent = agent
+        _claim_socket_path(socket_path)
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def server_bind(self) -> None:
+        previous = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        from agent.serialization import response_to_dict
+
+        op = request.get("op", "ask")
+        if op == "ask":
+            response = self.agent.answer(str(request["question"]), use_cache=not request.get("no_cache", False))
+            return {"response": response_to_dict(response)}
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "stats":
+            return {"stats": self.agent.cache_stats()}
+        if op == "reload":
+            self.agent.reload()
+            return {"ok": True}
+        raise ValueError(f"Unknown op {op!r}.")
+
+
+def serve_daemon(daemon: AgentDaemon) -> None:
+    """Serve until SIGINT or SIGTERM, then remove the socket."""
+
+    def _stop(signum: int, frame: object) -> None:
+        raise KeyboardInterrupt
+
+    previous = signal.signal(signal.SIGTERM, _stop)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        daemon.server_close()
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+    if not stat.S_ISSOCK(socket_path.stat().st_mode):
+        raise RuntimeError(f"{socket_path} exists and is not a socket; set COURTSIDE_SOCKET to another path.")
+    try:
+        running = request_daemon(socket_path, {"op": "ping"}, timeout=2.0)
+    except OSError:
+        running = None
+    if running is not None:
+        raise RuntimeError(f"A courtside daemon (pid {running.get('pid')}) is already listening on {socket_path}.")
+    # Left behind by a daemon that did not shut down cleanly.
+    socket_path.unlink()
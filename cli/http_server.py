@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import TYPE_CHECKING, Any, Callable
+
+from agent.admission import (
+    DEFAULT_FAST_LIMITS,
+    DEFAULT_SLOW_LIMITS,
+    AdmissionController,
+    LaneFullError,
+    LaneLimits,
+)
+from agent.serialization import json_default, response_to_dict
+
+if TYPE_CHECKING:
+    from agent.pipeline import AnalyticsAgent
+
+
+MAX_BODY_BYTES = 64 * 1024
+LISTEN_BACKLOG = 128
+# Pause before replacing a worker that died, so a crash at startup cannot spin.
+RESPAWN_DELAY_SECONDS = 1.0
+# Suggested wait for a client whose question was shed; slow-lane answers take seconds.
+SHED_RETRY_AFTER_SECONDS = 5
+
+
+class AgentRequestHandler(BaseHTTPRequestHandler):
+    """JSON API: GET /health, GET /stats, POST /ask {"question": ..., "no_cache": false}, POST /reload."""
+
+    server: AgentHTTPServer
+    server_version = "courtside"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._health()
+        elif self.path == "/stats":
+            self._send(200, {**self.server.agent.cache_stats(), "admission": self.server.admission.stats()})
+        else:
+            self._send(404, {"error": f"No route for GET {self.path}."})
+
+    def do_POST(self) -> None:
+        if self.path == "/ask":
+            self._ask()
+        elif self.path == "/reload":
+            self.server.agent.reload()
+            self._send(200, {"ok": True})
+        else:
+            self._send(404, {"error": f"No route for POST {self.path}."})
+
+    def _ask(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(413, {"error": f"Request body exceeds {MAX_BODY_BYTES} bytes."})
+            return
+        try:
+            body = json.loads(self.rfile.read(length))
+            question = body["question"]
+            use_cache = not body.get("no_cache", False)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._send(400, {"error": 'Expected a JSON body like {"question": "..."}.'})
+            return
+        if not isinstance(question, str) or not question.strip():
+            self._send(400, {"error": "question must be a non-empty string."})
+            return
+
+        try:
+            response = self.server.agent.answer(question, admission=self.server.admission, use_cache=use_cache)
+        except LaneFullError as exc:
+            self._send(
+                503,
+                {"error": str(exc), "lane": exc.lane},
+                headers={"Retry-After": str(SHED_RETRY_AFTER_SECONDS)},
+            )
+            return
+        except Exception as exc:
+            self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        self._send(200, response_to_dict(response))
+
+    def _health(self) -> None:
+        try:
+            self.server.agent.executor.run("SELECT 1", ())
+        except Exception as exc:
+            self._send(503, {"status": "unavailable", "pid": os.getpid(), "error": str(exc)})
+            return
+        self._send(200, {"status": "ok", "pid": os.getpid()})
+
+    def _send(self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload, default=json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class AgentHTTPServer(HTTPServer):
+    """Serves one shared agent from a fixed pool of request threads.
+
+    Questions are admitted through the fast and slow lanes of `admission`, and the
+    pool has a thread for every question the lanes can hold, running or queued.
+    Connections close after each response (HTTP/1.0), so an idle client never
+    holds a worker thread. `server_close` waits for in-flight requests.
+    """
+
+    # socketserver's default backlog of 5 resets connections during a burst.
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        agent: AnalyticsAgent,
+        admission: AdmissionController | None = None,
+        listener: socket.socket | None = None,
+    ):
+        self.agent = agent
+        self.admission = admission or AdmissionController()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.admission.capacity,
+            thread_name_prefix="courtside-http",
+        )
+        super().__init__(address, AgentRequestHandler, bind_and_activate=listener is None)
+        if listener is not None:
+            # Pre-forked worker: accept on the listening socket the parent bound.
+            self.socket.close()
+            self.socket = listener
+            self.server_name, self.server_port = listener.getsockname()[:2]
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        request, client_address = super().get_request()
+        request.setblocking(True)
+        return request, client_address
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:
+        self.executor.submit(self._process, request, client_address)
+
+    def _process(self, request: socket.socket, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def serve_http(
+    agent_factory: Callable[[], AnalyticsAgent],
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    fast: LaneLimits = DEFAULT_FAST_LIMITS,
+    slow: LaneLimits = DEFAULT_SLOW_LIMITS,
+) -> None:
+    """Serve until SIGINT/SIGTERM with `workers` processes.
+
+    Every worker process builds its own agent (and connection pool) after the
+    fork and admits questions through its own `fast` and `slow` lanes; they share
+    the catalog through the on-disk snapshot.
+    """
+    if workers <= 1:
+        _serve_worker(agent_factory, (host, port), fast, slow)
+        return
+
+    listener = socket.create_server((host, port), backlog=LISTEN_BACKLOG)
+    # Every worker wakes for each connection and all but one lose the accept();
+    # non-blocking, the losers return to their loop instead of blocking in accept().
+    listener.setblocking(False)
+    children: dict[int, None] = {}
+    stopping = False
+
+    def _spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _serve_worker(agent_factory, (host, port), fast, slow, listener)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = None
+
+    def _stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            os.kill(pid, signal.SIGTERM)
+
+    previous = {sig: signal.signal(sig, _stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        for _ in range(workers):
+            _spawn()
+        while children:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+            children.pop(pid, None)
+            if not stopping:
+                print(f"[serve] worker {pid} exited; starting a replacement", file=sys.stderr)
+                time.sleep(RESPAWN_DELAY_SECONDS)
+                if not stopping:
+                    _spawn()
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        listener.close()
+
+
+def _serve_worker(
+    agent_factory: Callable[[], AnalyticsAgent],
+    address: tuple[str, int],
+    fast: LaneLimits,
+    slow: LaneLimits,
+    listener: socket.socket | None = None,
+) -> None:
+    if listener is not None:
+        # The parent handles Ctrl-C for the group and forwards SIGTERM.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    agent = agent_factory()
+    server = AgentHTTPServer(address, agent, AdmissionController(fast, slow), listener)
+
+    def _stop(signum: int, frame: object) -> None:
+        # shutdown() blocks until serve_forever returns, so it cannot run on this thread.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    if listener is None:
+        signal.signal(signal.SIGINT, _stop)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        agent.close()
@@ -2,41 +2,164 @@ from __future__ import annotations
 
 import json
 import subprocess
+from dataclasses import replace
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from analytics.evaluation import evaluate_results, render_markdown_report
-from analytics.visualization import build_chart_plan, save_line_chart
 from agent.config import load_agent_settings
-from agent.pipeline import AnalyticsAgent
-from data_ingestion.file_discovery import DATASET_FILE_CANDIDATES, find_existing_file
-from data_ingestion.profile_source import profile_raw_source
 
 
+# Each command imports what it needs when it runs: pandas, psycopg, sqlglot and
+# requests together take most of a second to import, and `ask` needs only some of them.
 app = typer.Typer(help="Courtside Analytics CLI")
 console = Console()
 
 
 @app.command()
-def ask(question: str) -> None:
-    """Answer a natural-language analytics question."""
+def ask(question: str, daemon: bool = True, cache: bool = True) -> None:
+    """Answer a natural-language analytics question (through `courtside daemon` when it is running).
+
+    --no-cache runs the query even when a cached result for the current data exists.
+    """
     settings = load_agent_settings()
+    if daemon:
+        response = _ask_daemon(settings.daemon_socket, question, cache)
+        if response is not None:
+            _print_response(response)
+            return
+
+    from agent.pipeline import AnalyticsAgent
+
     agent = AnalyticsAgent(settings)
+    try:
+        response = agent.answer(question, use_cache=cache)
+    finally:
+        agent.close()
+    _print_response(response)
+
+
+@app.command("daemon")
+def run_daemon(stats: bool = False, reload: bool = False, cache: bool = True) -> None:
+    """Keep a warm agent on a Unix socket for `courtside ask`. --stats/--reload talk to a running one."""
+    from cli.daemon import AgentDaemon, request_daemon, serve_daemon
+
+    settings = load_agent_settings()
+    if stats or reload:
+        reply = request_daemon(settings.daemon_socket, {"op": "stats" if stats else "reload"})
+        if reply is None:
+            console.print(f"[red]No daemon is listening on {settings.daemon_socket}.[/red]")
+            raise typer.Exit(code=1)
+        if stats:
+            console.print_json(data=reply["stats"])
+        else:
+            console.print("[green]Daemon dropped its cached catalog, schema context and results.[/green]")
+        return
+
+    from agent.pipeline import AnalyticsAgent
+
+    agent = AnalyticsAgent(settings if cache else replace(settings, result_cache=False))
+    agent.warm_up()
+    try:
+        server = AgentDaemon(settings.daemon_socket, agent)
+    except RuntimeError as exc:
+        agent.close()
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"[green]Listening on {settings.daemon_socket}[/green] (Ctrl-C to stop)")
+    try:
+        serve_daemon(server)
+    finally:
+        agent.close()
+
+
+@app.command()
+def shell(cache: bool = True) -> None:
+    """Interactive session: one warm agent answers many questions, with per-step timings."""
+    from agent.pipeline import AnalyticsAgent
+    from cli.shell import run_shell
+
+    settings = load_agent_settings()
+    agent = AnalyticsAgent(settings if cache else replace(settings, result_cache=False))
+    agent.warm_up()
+    try:
+        run_shell(agent, console, render=lambda response, show_sql: _print_response(response, show_sql, False))
+    finally:
+        agent.close()
+
+
+@app.command()
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    fast_concurrency: int = 4,
+    fast_queue: int = 16,
+    slow_concurrency: int = 1,
+    slow_queue: int = 4,
+    cache: bool = True,
+) -> None:
+    """HTTP JSON API: POST /ask, GET /health, GET /stats, POST /reload.
+
+    Per worker, template answers run in a fast lane and answers that need Ollama in a
+    slow lane, each with its own concurrency and queue; a full lane sheds with a 503.
+    """
+    from agent.admission import LaneLimits
+    from agent.pipeline import AnalyticsAgent
+    from cli.http_server import serve_http
+
+    settings = load_agent_settings()
+    if not cache:
+        settings = replace(settings, result_cache=False)
+    fast = LaneLimits(fast_concurrency, fast_queue)
+    slow = LaneLimits(slow_concurrency, slow_queue)
+
+    def build_agent() -> AnalyticsAgent:
+        agent = AnalyticsAgent(settings)
+        agent.warm_up(pool_size=fast.concurrency + slow.concurrency)
+        return agent
+
+    console.print(
+        f"[green]Serving on http://{host}:{port}[/green] "
+        f"({workers} worker process(es); fast lane {fast_concurrency}+{fast_queue} queued, "
+        f"slow lane {slow_concurrency}+{slow_queue} queued; Ctrl-C to stop)"
+    )
+    serve_http(build_agent, host=host, port=port, workers=workers, fast=fast, slow=slow)
+
+
+def _ask_daemon(socket_path: Path, question: str, use_cache: bool = True):
+    from cli.daemon import request_daemon
+
+    try:
+        reply = request_daemon(socket_path, {"op": "ask", "question": question, "no_cache": not use_cache})
+    except (OSError, ValueError) as exc:
+        console.print(f"[yellow]Daemon request failed ({exc}); answering in process.[/yellow]")
+        return None
+    if reply is None:
+        return None
+    if "error" in reply:
+        console.print(f"[red]Daemon error:[/red] {reply['error']}")
+        raise typer.Exit(code=1)
+
+    from agent.serialization import response_from_dict
+
+    return response_from_dict(reply["response"])
 
-    response = agent.answer(question)
 
+def _print_response(response, show_sql: bool = True, show_provenance: bool = True) -> None:
     console.print("\n[bold cyan]Answer[/bold cyan]")
     console.print(response.answer)
 
-    if response.sql:
+    if show_sql and response.sql:
         console.print("\n[bold cyan]SQL[/bold cyan]")
         console.print(response.sql)
 
-    console.print("\n[bold cyan]Provenance[/bold cyan]")
-    console.print_json(data=response.provenance)
+    if show_provenance:
+        console.print("\n[bold cyan]Provenance[/bold cyan]")
+        console.print_json(data=response.provenance)
 
     if response.rows:
         table = Table(title="Top Rows")
@@ -57,15 +180,24 @@ def setup_db() -> None:
 
 
 @app.command("load-data")
-def load_data() -> None:
-    """Run ETL against CSVs in data/raw."""
-    subprocess.run(["python3", "-m", "data_ingestion.run_etl"], check=True)
+def load_data(bulk: bool = False, season: list[str] | None = None) -> None:
+    """Run ETL against CSVs in data/raw. --bulk rebuilds indexes after; --season reloads one season."""
+    command = ["python3", "-m", "data_ingestion.run_etl"]
+    if bulk:
+        command.append("--bulk")
+    for label in season or []:
+        command.extend(["--season", label])
+    subprocess.run(command, check=True)
     console.print("[green]ETL run completed.[/green]")
 
 
 @app.command("check-data")
 def check_data(raw_dir: str = "data/raw") -> None:
     """Validate required raw CSVs exist and print source coverage."""
+    from data_ingestion.config import DEFAULT_SOURCE_CACHE_DIR
+    from data_ingestion.file_discovery import DATASET_FILE_CANDIDATES, find_existing_file
+    from data_ingestion.profile_source import profile_raw_source
+
     raw_path = Path(raw_dir)
     games_path = find_existing_file(raw_path, "games")
     stats_path = find_existing_file(raw_path, "player_game_stats")
@@ -88,7 +220,7 @@ def check_data(raw_dir: str = "data/raw") -> None:
     console.print(f"[green]Found games file:[/green] {games_path.name}")
     console.print(f"[green]Found player stats file:[/green] {stats_path.name}")
 
-    profile = profile_raw_source(raw_path)
+    profile = profile_raw_source(raw_path, source_cache_dir=DEFAULT_SOURCE_CACHE_DIR)
     console.print_json(
         data={
             "games_rows": profile.games_rows,
@@ -106,12 +238,100 @@ def audit_db() -> None:
     subprocess.run(["python3", "database/audit_db.py"], check=True)
 
 
+@app.command("optimize-db")
+def optimize_db(
+    benchmark_path: str = "data/benchmarks/questions.json",
+    cluster: bool = True,
+    runs: int = 3,
+) -> None:
+    """Cluster tables and add BRIN/covering indexes; report benchmark buffers and latency."""
+    import psycopg
+
+    from agent.pipeline import AnalyticsAgent
+    from analytics.query_profile import plan_workload, profile_workload, summarize_by_family
+    from data_ingestion.physical_layout import optimize_physical_layout
+
+    settings = load_agent_settings()
+    agent = AnalyticsAgent(settings)
+
+    questions = json.loads(Path(benchmark_path).read_text(encoding="utf-8"))
+    workload = plan_workload(agent, questions)
+    console.print(f"Profiling {len(workload)} of {len(questions)} benchmark questions.")
+    before = summarize_by_family(profile_workload(settings.database_url, workload, runs))
+
+    with psycopg.connect(settings.database_url, autocommit=True) as conn:
+        for action in optimize_physical_layout(conn, cluster=cluster):
+            console.print(f"[green]{action.step}[/green] {action.target}: {action.detail}")
+
+    after = summarize_by_family(profile_workload(settings.database_url, workload, runs))
+
+    table = Table(title="Benchmark workload before / after")
+    for col in ("Family", "Queries", "Buffer hits", "Buffer reads", "Latency ms"):
+        table.add_column(col)
+    for family, old in before.items():
+        new = after[family]
+        table.add_row(
+            family,
+            str(old.queries),
+            f"{old.shared_hit_blocks} -> {new.shared_hit_blocks}",
+            f"{old.shared_read_blocks} -> {new.shared_read_blocks}",
+            f"{old.total_ms:.1f} -> {new.total_ms:.1f}",
+        )
+    console.print(table)
+
+
+@app.command("advise-indexes")
+def advise_indexes(
+    benchmark_path: str = "data/benchmarks/questions.json",
+    output_path: str = "data/benchmarks/results/index_advice.md",
+    test: bool = False,
+    runs: int = 3,
+) -> None:
+    """Profile the benchmark workload and rank missing indexes. --test builds each in a rolled-back transaction."""
+    import psycopg
+
+    from agent.pipeline import AnalyticsAgent
+    from analytics.index_advisor import (
+        load_schema_catalog,
+        measure_candidates,
+        propose_indexes,
+        render_index_report,
+        summarize_plans,
+    )
+    from analytics.query_profile import plan_workload, profile_workload
+
+    settings = load_agent_settings()
+    agent = AnalyticsAgent(settings)
+
+    questions = json.loads(Path(benchmark_path).read_text(encoding="utf-8"))
+    workload = plan_workload(agent, questions)
+    profiles = profile_workload(settings.database_url, workload, runs)
+
+    with psycopg.connect(settings.database_url) as conn:
+        catalog = load_schema_catalog(conn)
+    findings = summarize_plans(profiles, catalog)
+    candidates = propose_indexes(profiles, catalog)
+    if test and candidates:
+        candidates = measure_candidates(settings.database_url, candidates, profiles, runs)
+
+    report = render_index_report(findings, candidates, skipped_questions=len(questions) - len(workload))
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(report, encoding="utf-8")
+
+    console.print(f"Profiled {len(workload)} of {len(questions)} benchmark questions.")
+    console.print(f"{len(candidates)} index candidates; saved report to: {output}")
+
+
 @app.command()
 def evaluate(
     benchmark_path: str = "data/benchmarks/questions.json",
     output_path: str = "data/benchmarks/results/latest.json",
 ) -> None:
     """Run the 30-question benchmark and save outputs."""
+    from agent.pipeline import AnalyticsAgent
+    from analytics.evaluation import evaluate_results, render_markdown_report
+
     settings = load_agent_settings()
     agent = AnalyticsAgent(settings)
 
@@ -168,6 +388,9 @@ def chart(
     output_path: str = "data/processed/latest_chart.png",
 ) -> None:
     """Run a supported query and save a chart for trend/comparison style outputs."""
+    from agent.pipeline import AnalyticsAgent
+    from analytics.visualization import build_chart_plan, save_line_chart
+
     settings = load_agent_settings()
     agent = AnalyticsAgent(settings)
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from agent.pipeline import AnalyticsAgent
+    from agent.types import AgentResponse
+
+
+SHELL_HELP = """Type a question, or one of:
+  :stats   show catalog, schema context and connection cache state
+  :reload  drop cached catalog, schema context and results (run after `courtside load-data`)
+  :sql     toggle printing the SQL of each answer
+  :quit    leave the shell (also Ctrl-D)"""
+
+TIMING_STEPS = ("resolve", "plan", "queue", "llm_sql", "validate", "execute", "summarize")
+
+
+def run_shell(
+    agent: AnalyticsAgent,
+    console: Console,
+    render: Callable[[AgentResponse, bool], None],
+    prompt: str = "courtside> ",
+) -> int:
+    """Answer questions from stdin with one warm agent; returns the number answered."""
+    answered = 0
+    show_sql = False
+    console.print(SHELL_HELP)
+    while True:
+        try:
+            line = console.input(f"\n[bold]{prompt}[/bold]").strip()
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            return answered
+
+        if not line:
+            continue
+        if line in {":quit", ":q", "exit", "quit"}:
+            return answered
+        if line == ":help":
+            console.print(SHELL_HELP)
+        elif line == ":stats":
+            console.print_json(data=agent.cache_stats())
+        elif line == ":reload":
+            agent.reload()
+            console.print("[green]Cached catalog, schema context and results dropped.[/green]")
+        elif line == ":sql":
+            show_sql = not show_sql
+            console.print(f"SQL output {'on' if show_sql else 'off'}.")
+        elif line.startswith(":"):
+            console.print(f"[yellow]Unknown command {line}.[/yellow] Type :help for commands.")
+        else:
+            response = agent.answer(line)
+            render(response, show_sql)
+            console.print(f"[dim]{format_timings(response.timings_ms)}[/dim]")
+            answered += 1
+
+
+def format_timings(timings: dict[str, float]) -> str:
+    steps = [f"{step} {timings[step]:.1f}" for step in TIMING_STEPS if step in timings]
+    return " | ".join(steps + [f"total {timings.get('total', 0.0):.1f} ms"])
@@ -44,6 +44,7 @@ COLUMN_ALIASES = {
         "first_name": ["first_name", "firstname", "firstName"],
         "last_name": ["last_name", "lastname", "lastName"],
         "team_id": ["team_id", "team", "teamid", "playerteamId"],
+        "player_team_id": ["player_team_id"],
         "player_team_name": ["playerteamName", "player_team_name"],
         "player_team_city": ["playerteamCity", "player_team_city"],
         "is_home": ["home", "is_home"],
@@ -67,3 +68,52 @@ COLUMN_ALIASES = {
         "defensive_rebounds": ["defensive_rebounds", "dreb", "reboundsDefensive"],
     },
 }
+
+# Compact in-memory dtypes for canonical columns, applied while reading raw inputs.
+#   "id":       categorical identifier; integral ids keep their integer spelling.
+#   "category": low-cardinality text, parsed straight into a categorical.
+#   "count":    box-score counter, downcast to nullable Int16 (Int32 when out of range).
+#   "float32":  fractional measure such as minutes played.
+COLUMN_DTYPES = {
+    "games": {
+        "game_id": "id",
+        "home_team_id": "id",
+        "away_team_id": "id",
+        "game_type": "category",
+        "home_team_name": "category",
+        "away_team_name": "category",
+        "home_team_city": "category",
+        "away_team_city": "category",
+        "home_points": "count",
+        "away_points": "count",
+    },
+    "player_game_stats": {
+        "game_id": "id",
+        "player_id": "id",
+        "team_id": "id",
+        "player_team_id": "id",
+        "player_name": "category",
+        "first_name": "category",
+        "last_name": "category",
+        "player_team_name": "category",
+        "player_team_city": "category",
+        "is_home": "count",
+        "minutes": "float32",
+        "points": "count",
+        "rebounds": "count",
+        "assists": "count",
+        "steals": "count",
+        "blocks": "count",
+        "turnovers": "count",
+        "fouls": "count",
+        "plus_minus": "count",
+        "fg_made": "count",
+        "fg_attempts": "count",
+        "three_made": "count",
+        "three_attempts": "count",
+        "ft_made": "count",
+        "ft_attempts": "count",
+        "offensive_rebounds": "count",
+        "defensive_rebounds": "count",
+    },
+}
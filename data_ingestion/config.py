@@ -6,11 +6,19 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from .index_lifecycle import DEFAULT_INDEX_BUILD_WORKERS, DEFAULT_MAINTENANCE_WORK_MEM
+
+
+DEFAULT_SOURCE_CACHE_DIR = Path("data/processed/source_cache")
+
 
 @dataclass(frozen=True)
 class IngestionSettings:
     database_url: str
     raw_data_dir: Path
+    source_cache_dir: Path
+    maintenance_work_mem: str = DEFAULT_MAINTENANCE_WORK_MEM
+    index_build_workers: int = DEFAULT_INDEX_BUILD_WORKERS
 
 
 
@@ -21,4 +29,11 @@ def load_settings() -> IngestionSettings:
         raise RuntimeError("DATABASE_URL is not set. Configure it in .env.")
 
     raw_dir = Path(os.getenv("RAW_DATA_DIR", "data/raw")).resolve()
-    return IngestionSettings(database_url=database_url, raw_data_dir=raw_dir)
+    cache_dir = Path(os.getenv("SOURCE_CACHE_DIR", str(DEFAULT_SOURCE_CACHE_DIR))).resolve()
+    return IngestionSettings(
+        database_url=database_url,
+        raw_data_dir=raw_dir,
+        source_cache_dir=cache_dir,
+        maintenance_work_mem=os.getenv("ETL_MAINTENANCE_WORK_MEM", DEFAULT_MAINTENANCE_WORK_MEM),
+        index_build_workers=int(os.getenv("ETL_INDEX_BUILD_WORKERS", str(DEFAULT_INDEX_BUILD_WORKERS))),
+    )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+
+# Written after every successful ETL run. Anything cached from the database
+# (e.g. the entity catalog snapshot) is only trusted while this token matches.
+DEFAULT_DATA_VERSION_PATH = Path("data/processed/data_version")
+
+
+def write_data_version(path: Path = DEFAULT_DATA_VERSION_PATH) -> str:
+    version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%fZ}-{uuid4().hex[:8]}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staged = path.with_name(f".{path.name}.tmp")
+    staged.write_text(version + "\n", encoding="utf-8")
+    os.replace(staged, path)
+    return version
+
+
+def read_data_version(path: Path = DEFAULT_DATA_VERSION_PATH) -> str | None:
+    try:
+        version = path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return version or None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import psycopg
+
+
+FACT_TABLE = "player_game_facts"
+
+FACT_COLUMNS = (
+    "game_date",
+    "game_key",
+    "player_key",
+    "season_id",
+    "start_year",
+    "team_key",
+    "opponent_team_key",
+    "team_points",
+    "opponent_points",
+    "points",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fg_made",
+    "fg_attempts",
+    "three_made",
+    "three_attempts",
+    "ft_made",
+    "ft_attempts",
+    "is_home",
+    "is_win",
+    "minutes",
+    "game_type",
+    "season_label",
+)
+
+# Rows are written in covering-index order so each player's games share pages.
+FACT_SELECT_SQL = """
+SELECT
+  g.game_date,
+  pgs.game_key,
+  pgs.player_key,
+  pgs.season_id,
+  s.start_year,
+  pgs.team_key,
+  CASE WHEN g.home_team_key = pgs.team_key THEN g.away_team_key ELSE g.home_team_key END,
+  CASE WHEN g.home_team_key = pgs.team_key THEN g.home_points ELSE g.away_points END,
+  CASE WHEN g.home_team_key = pgs.team_key THEN g.away_points ELSE g.home_points END,
+  pgs.points,
+  pgs.rebounds,
+  pgs.assists,
+  pgs.steals,
+  pgs.blocks,
+  pgs.turnovers,
+  pgs.fg_made,
+  pgs.fg_attempts,
+  pgs.three_made,
+  pgs.three_attempts,
+  pgs.ft_made,
+  pgs.ft_attempts,
+  g.home_team_key = pgs.team_key,
+  COALESCE(
+    CASE WHEN g.home_team_key = pgs.team_key THEN g.home_points > g.away_points
+         ELSE g.away_points > g.home_points END,
+    FALSE
+  ),
+  pgs.minutes,
+  g.game_type,
+  s.season_label
+FROM player_game_stats pgs
+JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
+JOIN seasons s ON s.season_id = pgs.season_id
+{where}
+ORDER BY pgs.player_key, pgs.season_id, g.game_type, g.game_date
+"""
+
+
+def refresh_player_game_facts(
+    conn: psycopg.Connection,
+    season_ids: Iterable[int] | None = None,
+) -> int:
+    """Rebuild the fact table from games and stats; only `season_ids` when given.
+
+    Runs in the caller's transaction so readers never see a half-built season.
+    Returns the number of rows written.
+    """
+    columns = ", ".join(FACT_COLUMNS)
+    with conn.cursor() as cur:
+        if season_ids is None:
+            cur.execute(f"TRUNCATE {FACT_TABLE}")
+            cur.execute(f"INSERT INTO {FACT_TABLE} ({columns}) {FACT_SELECT_SQL.format(where='')}")
+        else:
+            ids = [int(season_id) for season_id in season_ids]
+            cur.execute(f"DELETE FROM {FACT_TABLE} WHERE season_id = ANY(%s)", (ids,))
+            cur.execute(
+                f"INSERT INTO {FACT_TABLE} ({columns}) "
+                f"{FACT_SELECT_SQL.format(where='WHERE pgs.season_id = ANY(%s)')}",
+                (ids,),
+            )
+        return cur.rowcount
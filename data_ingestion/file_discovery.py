@@ -15,11 +15,23 @@ DATASET_FILE_CANDIDATES: dict[str, list[str]] = {
     "players": ["players.csv", "Players.csv"],
 }
 
+# Raw drops may arrive compressed; readers stream-decompress them in place.
+COMPRESSED_SUFFIXES: tuple[str, ...] = (".gz", ".zst")
+
+# Columnar exports are read natively instead of through the CSV parser.
+COLUMNAR_SUFFIXES: tuple[str, ...] = (".parquet", ".arrow", ".feather")
+
 
 
 def find_existing_file(raw_data_dir: Path, dataset_key: str) -> Path | None:
     for candidate in DATASET_FILE_CANDIDATES[dataset_key]:
-        path = raw_data_dir / candidate
-        if path.exists():
-            return path
+        for suffix in ("", *COMPRESSED_SUFFIXES):
+            path = raw_data_dir / f"{candidate}{suffix}"
+            if path.exists():
+                return path
+        stem = candidate.removesuffix(".csv")
+        for suffix in COLUMNAR_SUFFIXES:
+            path = raw_data_dir / f"{stem}{suffix}"
+            if path.exists():
+                return path
     return None
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable
+
+import psycopg
+
+
+# Tables whose secondary indexes are dropped during a bulk load, and tables
+# re-analyzed after every load. VACUUM_TABLES are vacuumed as well, so the
+# visibility map lets their covering indexes answer with index-only scans.
+BULK_LOAD_TABLES = ("games", "player_game_stats", "player_game_facts")
+ANALYZE_TABLES = ("seasons", "teams", "players", "games", "player_game_stats", "player_game_facts")
+VACUUM_TABLES = ("games", "player_game_facts")
+
+DEFAULT_MAINTENANCE_WORK_MEM = "512MB"
+DEFAULT_INDEX_BUILD_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class SecondaryIndex:
+    name: str
+    table: str
+    definition: str
+
+
+def list_secondary_indexes(conn: psycopg.Connection, tables: Iterable[str]) -> list[SecondaryIndex]:
+    """Non-unique, non-constraint indexes on `tables`, with their CREATE INDEX statements."""
+    sql = """
+    SELECT idx.relname, tbl.relname, pg_get_indexdef(idx.oid)
+    FROM pg_index i
+    JOIN pg_class idx ON idx.oid = i.indexrelid
+    JOIN pg_class tbl ON tbl.oid = i.indrelid
+    WHERE tbl.relnamespace = current_schema()::regnamespace
+      AND tbl.relname = ANY(%s)
+      AND NOT i.indisprimary
+      AND NOT i.indisunique
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+    ORDER BY tbl.relname, idx.relname
+    """
+    with conn.cursor() as cur:
+        cur.execute(sql, (list(tables),))
+        rows = cur.fetchall()
+    # Partitioned parents report `ON ONLY`, which would rebuild the parent index
+    # without building it on any partition.
+    return [
+        SecondaryIndex(name, table, definition.replace(" ON ONLY ", " ON ", 1))
+        for name, table, definition in rows
+    ]
+
+
+def drop_indexes(conn: psycopg.Connection, indexes: Iterable[SecondaryIndex]) -> None:
+    with conn.cursor() as cur:
+        for index in indexes:
+            cur.execute(f'DROP INDEX IF EXISTS "{index.name}"')
+
+
+def rebuild_indexes(
+    database_url: str,
+    indexes: list[SecondaryIndex],
+    maintenance_work_mem: str = DEFAULT_MAINTENANCE_WORK_MEM,
+    workers: int = DEFAULT_INDEX_BUILD_WORKERS,
+) -> None:
+    """Recreate dropped indexes concurrently, one connection per build."""
+    if not indexes:
+        return
+
+    def build(index: SecondaryIndex) -> None:
+        with psycopg.connect(database_url, autocommit=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT set_config('maintenance_work_mem', %s, false)", (maintenance_work_mem,))
+                cur.execute(index.definition)
+        print(f"[ETL] Rebuilt index {index.name} on {index.table}")
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(indexes)))) as pool:
+        futures = {index.name: pool.submit(build, index) for index in indexes}
+
+    failed = [name for name, future in futures.items() if future.exception() is not None]
+    if failed:
+        raise RuntimeError(
+            f"Failed to rebuild indexes {failed}; re-run `courtside setup-db` to recreate them."
+        ) from next(futures[name].exception() for name in failed)
+
+
+def analyze_tables(conn: psycopg.Connection, tables: Iterable[str]) -> None:
+    with conn.cursor() as cur:
+        for table in tables:
+            command = "VACUUM (ANALYZE)" if table in VACUUM_TABLES else "ANALYZE"
+            cur.execute(f'{command} "{table}"')
@@ -4,14 +4,74 @@ from dataclasses import dataclass
 from datetime import datetime
 from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import pandas as pd
 import psycopg
 
 from .column_aliases import COLUMN_ALIASES
+from .data_version import DEFAULT_DATA_VERSION_PATH, write_data_version
+from .facts import refresh_player_game_facts
 from .file_discovery import DATASET_FILE_CANDIDATES, find_existing_file
-from .normalize import apply_aliases, normalize_columns
+from .index_lifecycle import (
+    ANALYZE_TABLES,
+    BULK_LOAD_TABLES,
+    DEFAULT_INDEX_BUILD_WORKERS,
+    DEFAULT_MAINTENANCE_WORK_MEM,
+    analyze_tables,
+    drop_indexes,
+    list_secondary_indexes,
+    rebuild_indexes,
+)
+from .normalize import recode_categories
+from .partitions import create_staging_partitions, ensure_season_partitions, swap_season_partitions
+from .readers import read_dataset
+from .source_cache import SourceCache
+
+
+# The prepare steps rely on copy-on-write: frames derived from the raw input share
+# column buffers until a column is reassigned. It is always on from pandas 3.0.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+SQL_BATCH_ROWS = 10_000
+
+GAME_COLUMNS = [
+    "game_id",
+    "season_id",
+    "game_date",
+    "game_type",
+    "home_team_key",
+    "away_team_key",
+    "home_points",
+    "away_points",
+    "winner_team_key",
+]
+
+PLAYER_GAME_STAT_COLUMNS = [
+    "game_key",
+    "player_key",
+    "season_id",
+    "team_key",
+    "starter",
+    "minutes",
+    "points",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fouls",
+    "plus_minus",
+    "fg_made",
+    "fg_attempts",
+    "three_made",
+    "three_attempts",
+    "ft_made",
+    "ft_attempts",
+    "offensive_rebounds",
+    "defensive_rebounds",
+]
 
 
 @dataclass
@@ -21,12 +81,31 @@ class ETLReport:
     seasons_loaded: int = 0
     games_loaded: int = 0
     player_game_stats_loaded: int = 0
+    player_game_facts_loaded: int = 0
+    indexes_rebuilt: int = 0
+    data_version: str | None = None
 
 
 class ETLLoader:
-    def __init__(self, database_url: str, raw_data_dir: Path):
+    def __init__(
+        self,
+        database_url: str,
+        raw_data_dir: Path,
+        source_cache_dir: Path | None = None,
+        bulk: bool = False,
+        maintenance_work_mem: str = DEFAULT_MAINTENANCE_WORK_MEM,
+        index_build_workers: int = DEFAULT_INDEX_BUILD_WORKERS,
+        seasons: list[str] | None = None,
+        data_version_path: Path = DEFAULT_DATA_VERSION_PATH,
+    ):
         self.database_url = database_url
         self.raw_data_dir = raw_data_dir
+        self.source_cache = SourceCache(source_cache_dir) if source_cache_dir is not None else None
+        self.bulk = bulk
+        self.maintenance_work_mem = maintenance_work_mem
+        self.index_build_workers = index_build_workers
+        self.seasons = seasons
+        self.data_version_path = data_version_path
 
     def run(self) -> ETLReport:
         report = ETLReport()
@@ -47,8 +126,18 @@ class ETLLoader:
             players_df = self._prepare_players(players_df)
 
             stats_df = self._prepare_player_stats(stats_df, teams_df, games_df)
+            if self.seasons:
+                games_df, stats_df = self._select_seasons(games_df, stats_df)
             seasons_df = self._derive_seasons(games_df)
 
+            # Bulk mode: drop secondary indexes in the load transaction, so a failed
+            # load rolls the drop back, and rebuild them once the rows are committed.
+            dropped_indexes = []
+            if self.bulk:
+                dropped_indexes = list_secondary_indexes(conn, BULK_LOAD_TABLES)
+                drop_indexes(conn, dropped_indexes)
+                print(f"[ETL] Bulk mode: dropped {len(dropped_indexes)} secondary indexes for the load")
+
             self._upsert_teams(conn, teams_df)
             report.teams_loaded = len(teams_df)
 
@@ -58,17 +147,79 @@ class ETLLoader:
             self._upsert_seasons(conn, seasons_df)
             report.seasons_loaded = len(seasons_df)
 
-            games_with_season = self._attach_season_ids(conn, games_df)
-            self._upsert_games(conn, games_with_season)
-            report.games_loaded = len(games_with_season)
+            games_with_keys = self._attach_team_keys(conn, self._attach_season_ids(conn, games_df))
+            self._ensure_partitions(conn)
+            report.games_loaded = len(games_with_keys)
 
-            self._upsert_player_game_stats(conn, stats_df)
-            report.player_game_stats_loaded = len(stats_df)
+            if self.seasons:
+                conn.commit()
+                stats_loaded, facts_loaded = self._reload_seasons(conn, games_with_keys, stats_df)
+                report.player_game_stats_loaded = stats_loaded
+                report.player_game_facts_loaded = facts_loaded
+            else:
+                self._upsert_games(conn, games_with_keys)
+                stats_with_keys = self._attach_stat_keys(conn, stats_df)
+                self._upsert_player_game_stats(conn, stats_with_keys)
+                report.player_game_stats_loaded = len(stats_with_keys)
+                report.player_game_facts_loaded = refresh_player_game_facts(conn)
+                conn.commit()
+
+        rebuild_indexes(
+            self.database_url,
+            dropped_indexes,
+            maintenance_work_mem=self.maintenance_work_mem,
+            workers=self.index_build_workers,
+        )
+        report.indexes_rebuilt = len(dropped_indexes)
 
-            conn.commit()
+        with psycopg.connect(self.database_url, autocommit=True) as conn:
+            analyze_tables(conn, ANALYZE_TABLES)
 
+        report.data_version = write_data_version(self.data_version_path)
         return report
 
+    def _reload_seasons(
+        self,
+        conn: psycopg.Connection,
+        games_df: pd.DataFrame,
+        stats_df: pd.DataFrame,
+    ) -> tuple[int, int]:
+        """Load each season into staging tables and swap them in, one transaction per season."""
+        stats_loaded = 0
+        facts_loaded = 0
+        for season_id, season_games in games_df.groupby("season_id"):
+            season_label = str(season_games["season_label"].iloc[0])
+            season_stats = stats_df[stats_df["game_id"].isin(season_games["game_id"])]
+
+            staged = create_staging_partitions(conn, season_id, season_label)
+            self._upsert_games(conn, season_games, table=staged["games"])
+            stats_with_keys = self._attach_stat_keys(conn, season_stats, games_table=staged["games"])
+            self._upsert_player_game_stats(conn, stats_with_keys, table=staged["player_game_stats"])
+            swap_season_partitions(conn, season_id, season_label)
+            facts_loaded += refresh_player_game_facts(conn, [season_id])
+            conn.commit()
+
+            print(
+                f"[ETL] Swapped in season {season_label}: "
+                f"{len(season_games)} games, {len(stats_with_keys)} player stat rows"
+            )
+            stats_loaded += len(stats_with_keys)
+        return stats_loaded, facts_loaded
+
+    def _select_seasons(
+        self,
+        games_df: pd.DataFrame,
+        stats_df: pd.DataFrame,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        selected = games_df["season_label"].astype(str).isin(self.seasons)
+        found = set(games_df.loc[selected, "season_label"].astype(str))
+        missing = sorted(set(self.seasons) - found)
+        if missing:
+            raise ValueError(f"No games found for seasons: {missing}")
+
+        games_df = games_df[selected]
+        return games_df, stats_df[stats_df["game_id"].isin(games_df["game_id"])]
+
     def _maybe_read(self, dataset_key: str) -> pd.DataFrame:
         path = find_existing_file(self.raw_data_dir, dataset_key)
         if path is None:
@@ -86,16 +237,18 @@ class ETLLoader:
         return self._read_with_aliases(path, dataset_key)
 
     def _read_with_aliases(self, path: Path, alias_key: str) -> pd.DataFrame:
-        df = pd.read_csv(path, low_memory=False)
-        df = normalize_columns(df)
-        df = apply_aliases(df, COLUMN_ALIASES[alias_key])
-        return df
+        return read_dataset(
+            path,
+            alias_key,
+            columns=list(COLUMN_ALIASES[alias_key]),
+            cache=self.source_cache,
+        )
 
     def _prepare_games(self, games_df: pd.DataFrame) -> pd.DataFrame:
         required = ["game_id", "game_date", "home_team_id", "away_team_id"]
         self._ensure_columns(games_df, required, "games")
 
-        df = games_df.copy()
+        df = games_df.copy(deep=False)
         df["game_id"] = df["game_id"].astype(str)
         df["home_team_id"] = df["home_team_id"].astype(str)
         df["away_team_id"] = df["away_team_id"].astype(str)
@@ -111,7 +264,7 @@ class ETLLoader:
 
         if "game_type" not in df.columns:
             df["game_type"] = "regular"
-        df["game_type"] = df["game_type"].apply(self._normalize_game_type)
+        df["game_type"] = df["game_type"].astype(object).map(self._normalize_game_type).astype("category")
 
         if "home_points" in df.columns:
             df["home_points"] = pd.to_numeric(df["home_points"], errors="coerce")
@@ -124,10 +277,9 @@ class ETLLoader:
         missing_winner = df["winner_team_id"].isna() | (df["winner_team_id"].astype(str).str.strip() == "")
         can_infer = df["home_points"].notna() & df["away_points"].notna()
         infer_mask = missing_winner & can_infer
-        df.loc[infer_mask, "winner_team_id"] = df.loc[infer_mask].apply(
-            lambda row: row["home_team_id"] if row["home_points"] > row["away_points"] else row["away_team_id"],
-            axis=1,
-        )
+        home_won = (df["home_points"] > df["away_points"]).fillna(False).astype(bool)
+        inferred = df["home_team_id"].where(home_won, df["away_team_id"])
+        df["winner_team_id"] = df["winner_team_id"].astype(object).where(~infer_mask, inferred)
 
         if "winner_team_id" in df.columns:
             winner = df["winner_team_id"].astype(str)
@@ -141,7 +293,7 @@ class ETLLoader:
         required = ["team_id", "team_name"]
         self._ensure_columns(teams_df, required, "teams")
 
-        df = teams_df.copy()
+        df = teams_df.copy(deep=False)
         for optional_col in ["abbreviation", "city", "conference", "division"]:
             if optional_col not in df.columns:
                 df[optional_col] = None
@@ -149,7 +301,7 @@ class ETLLoader:
         df["team_id"] = self._sanitize_string_series(df["team_id"])
         df["team_name"] = self._sanitize_string_series(df["team_name"])
         before = len(df)
-        df = df.dropna(subset=["team_id"]).copy()
+        df = df.dropna(subset=["team_id"])
         dropped = before - len(df)
         if dropped:
             print(f"[ETL] Dropping {dropped} team rows with missing team_id")
@@ -189,7 +341,7 @@ class ETLLoader:
         required = ["player_id", "player_name"]
         self._ensure_columns(players_df, required, "players")
 
-        df = players_df.copy()
+        df = players_df.copy(deep=False)
         for optional_col in ["first_name", "last_name", "position"]:
             if optional_col not in df.columns:
                 df[optional_col] = None
@@ -197,7 +349,7 @@ class ETLLoader:
         df["player_id"] = self._sanitize_string_series(df["player_id"])
         df["player_name"] = self._sanitize_string_series(df["player_name"])
         before = len(df)
-        df = df.dropna(subset=["player_id"]).copy()
+        df = df.dropna(subset=["player_id"])
         dropped = before - len(df)
         if dropped:
             print(f"[ETL] Dropping {dropped} player rows with missing player_id")
@@ -206,20 +358,15 @@ class ETLLoader:
         return df
 
     def _derive_players_from_stats(self, stats_df: pd.DataFrame) -> pd.DataFrame:
-        df = stats_df.copy()
+        # Deduplicate first so names are composed once per player rather than per stat row.
+        df = stats_df.drop_duplicates(subset=["player_id"], keep="first")
         if "player_name" not in df.columns:
             if "first_name" in df.columns and "last_name" in df.columns:
-                full_name = df["first_name"].fillna("").astype(str).str.strip() + " "
-                full_name += df["last_name"].fillna("").astype(str).str.strip()
-                df["player_name"] = full_name.str.strip()
+                df["player_name"] = self._compose_player_name(df)
             else:
                 df["player_name"] = df["player_id"].astype(str)
 
-        players = (
-            df[["player_id", "player_name", "first_name", "last_name"]]
-            .drop_duplicates(subset=["player_id"], keep="first")
-            .copy()
-        )
+        players = df[["player_id", "player_name", "first_name", "last_name"]]
         players["player_id"] = players["player_id"].astype(str)
         players["position"] = None
         return players
@@ -233,11 +380,11 @@ class ETLLoader:
         required = ["game_id", "player_id"]
         self._ensure_columns(stats_df, required, "player_game_stats")
 
-        df = stats_df.copy()
+        df = stats_df.copy(deep=False)
         df["game_id"] = self._sanitize_string_series(df["game_id"])
         df["player_id"] = self._sanitize_string_series(df["player_id"])
         before_required = len(df)
-        df = df.dropna(subset=["game_id", "player_id"]).copy()
+        df = df.dropna(subset=["game_id", "player_id"])
         dropped_required = before_required - len(df)
         if dropped_required:
             print(
@@ -247,7 +394,7 @@ class ETLLoader:
         # Keep only stats rows that can join to a known game.
         game_ids = set(games_df["game_id"].astype(str))
         before_join_filter = len(df)
-        df = df[df["game_id"].isin(game_ids)].copy()
+        df = df[df["game_id"].isin(game_ids)]
         dropped_missing_games = before_join_filter - len(df)
         if dropped_missing_games:
             print(
@@ -256,9 +403,7 @@ class ETLLoader:
 
         if "player_name" not in df.columns:
             if "first_name" in df.columns and "last_name" in df.columns:
-                full_name = df["first_name"].fillna("").astype(str).str.strip() + " "
-                full_name += df["last_name"].fillna("").astype(str).str.strip()
-                df["player_name"] = full_name.str.strip()
+                df["player_name"] = self._compose_player_name(df)
             else:
                 df["player_name"] = df["player_id"]
 
@@ -266,57 +411,14 @@ class ETLLoader:
             df["team_id"] = None
 
         if "player_team_id" in df.columns:
-            mask = df["team_id"].isna()
-            df.loc[mask, "team_id"] = df.loc[mask, "player_team_id"]
+            team_ids = df["team_id"].astype(object)
+            df["team_id"] = team_ids.where(team_ids.notna(), df["player_team_id"].astype(object))
 
         if {"player_team_name", "player_team_city"}.issubset(df.columns):
-            team_map = {
-                (
-                    str(row.team_name).strip().lower(),
-                    str(row.city).strip().lower() if pd.notna(row.city) else "",
-                ): str(row.team_id)
-                for row in teams_df.itertuples(index=False)
-            }
-
-            name_only: dict[str, str] = {}
-            grouped = teams_df.groupby(teams_df["team_name"].astype(str).str.lower())["team_id"]
-            for key, values in grouped:
-                unique = values.astype(str).unique()
-                if len(unique) == 1:
-                    name_only[key] = unique[0]
-
-            def resolve_team_id(row: pd.Series) -> str | None:
-                if pd.notna(row.get("team_id")) and str(row.get("team_id")).strip() not in {"", "nan"}:
-                    return str(row.get("team_id"))
-                team_name = str(row.get("player_team_name", "")).strip().lower()
-                team_city = str(row.get("player_team_city", "")).strip().lower()
-                if not team_name:
-                    return None
-                exact = team_map.get((team_name, team_city))
-                if exact:
-                    return exact
-                return name_only.get(team_name)
-
-            df["team_id"] = df.apply(resolve_team_id, axis=1)
+            df["team_id"] = self._resolve_team_ids_from_names(df, teams_df)
 
         if "is_home" in df.columns:
-            game_side_map = games_df.set_index("game_id")[["home_team_id", "away_team_id"]].to_dict("index")
-
-            def fill_team_from_home_flag(row: pd.Series) -> str | None:
-                if pd.notna(row.get("team_id")) and str(row.get("team_id")).strip() not in {"", "nan"}:
-                    return str(row.get("team_id"))
-                game_id = str(row.get("game_id", ""))
-                side = game_side_map.get(game_id)
-                if side is None:
-                    return None
-                home_flag = pd.to_numeric(row.get("is_home"), errors="coerce")
-                if pd.isna(home_flag):
-                    return None
-                if int(home_flag) == 1:
-                    return str(side["home_team_id"])
-                return str(side["away_team_id"])
-
-            df["team_id"] = df.apply(fill_team_from_home_flag, axis=1)
+            df["team_id"] = self._resolve_team_ids_from_home_flag(df, games_df)
 
         unresolved_mask = df["team_id"].isna() | (df["team_id"].astype(str).str.strip().isin({"", "nan"}))
         unresolved_count = int(unresolved_mask.sum())
@@ -324,9 +426,9 @@ class ETLLoader:
             print(
                 f"[ETL] Dropping {unresolved_count} player stat rows with unresolved team mapping"
             )
-            df = df[~unresolved_mask].copy()
+            df = df[~unresolved_mask]
 
-        df["team_id"] = self._sanitize_string_series(df["team_id"])
+        df["team_id"] = self._sanitize_string_series(df["team_id"].astype("category"))
 
         for numeric_col in [
             "minutes",
@@ -352,6 +454,54 @@ class ETLLoader:
 
         return df
 
+    def _resolve_team_ids_from_names(self, df: pd.DataFrame, teams_df: pd.DataFrame) -> pd.Series:
+        team_map = {
+            (
+                str(row.team_name).strip().lower(),
+                str(row.city).strip().lower() if pd.notna(row.city) else "",
+            ): str(row.team_id)
+            for row in teams_df.itertuples(index=False)
+        }
+
+        name_only: dict[str, str] = {}
+        grouped = teams_df.groupby(teams_df["team_name"].astype(str).str.lower())["team_id"]
+        for key, values in grouped:
+            unique = values.astype(str).unique()
+            if len(unique) == 1:
+                name_only[key] = unique[0]
+
+        team_names = self._lookup_text(df["player_team_name"])
+        team_cities = self._lookup_text(df["player_team_city"])
+        exact = pd.Series(
+            [team_map.get(key) for key in zip(team_names, team_cities)],
+            index=df.index,
+            dtype=object,
+        )
+        resolved = exact.where(exact.notna(), team_names.astype(object).map(name_only))
+        resolved = resolved.where(team_names.astype(object) != "", None)
+        return self._keep_known_team_ids(df["team_id"], resolved)
+
+    def _resolve_team_ids_from_home_flag(self, df: pd.DataFrame, games_df: pd.DataFrame) -> pd.Series:
+        sides = games_df.drop_duplicates(subset=["game_id"], keep="last").set_index("game_id")
+        game_ids = df["game_id"].astype(str)
+        home_team_ids = game_ids.map(sides["home_team_id"].astype(str)).astype(object)
+        away_team_ids = game_ids.map(sides["away_team_id"].astype(str)).astype(object)
+
+        home_flag = pd.to_numeric(df["is_home"], errors="coerce").astype("float64")
+        is_home_side = (home_flag >= 1) & (home_flag < 2)
+        resolved = home_team_ids.where(is_home_side, away_team_ids)
+        resolved = resolved.where(home_flag.notna() & home_team_ids.notna(), None)
+        return self._keep_known_team_ids(df["team_id"], resolved)
+
+    def _keep_known_team_ids(self, team_ids: pd.Series, fallback: pd.Series) -> pd.Series:
+        text = team_ids.astype("string")
+        known = text.notna() & ~text.str.strip().isin({"", "nan"})
+        return text.astype(object).where(known, fallback)
+
+    def _lookup_text(self, series: pd.Series) -> pd.Series:
+        # Same spelling as str(value).strip().lower(); categoricals map once per category.
+        return series.map(lambda value: str(value).strip().lower())
+
     def _derive_seasons(self, games_df: pd.DataFrame) -> pd.DataFrame:
         labels = games_df["season_label"].astype(str).dropna().drop_duplicates()
         rows: list[dict[str, object]] = []
@@ -388,14 +538,71 @@ class ETLLoader:
             cur.execute("SELECT season_id, season_label FROM seasons")
             season_map = {label: season_id for season_id, label in cur.fetchall()}
 
-        df = games_df.copy()
-        df["season_id"] = df["season_label"].astype(str).map(season_map)
+        df = games_df.assign(season_id=games_df["season_label"].astype(str).map(season_map))
         if df["season_id"].isna().any():
             missing = df[df["season_id"].isna()]["season_label"].unique()
             raise ValueError(f"Unresolved season labels in games data: {missing}")
 
         return df
 
+    def _attach_team_keys(self, conn: psycopg.Connection, games_df: pd.DataFrame) -> pd.DataFrame:
+        team_keys = self._fetch_key_map(conn, "SELECT team_id, team_key FROM teams")
+        df = games_df.assign(
+            home_team_key=self._map_keys(games_df["home_team_id"], team_keys),
+            away_team_key=self._map_keys(games_df["away_team_id"], team_keys),
+            winner_team_key=self._map_keys(games_df["winner_team_id"], team_keys),
+        )
+
+        unresolved = df["home_team_key"].isna() | df["away_team_key"].isna()
+        unresolved_count = int(unresolved.sum())
+        if unresolved_count:
+            print(f"[ETL] Dropping {unresolved_count} games whose home or away team is not in teams data")
+            df = df[~unresolved]
+        return df
+
+    def _ensure_partitions(self, conn: psycopg.Connection) -> None:
+        with conn.cursor() as cur:
+            cur.execute("SELECT season_id, season_label FROM seasons")
+            seasons = cur.fetchall()
+        created = ensure_season_partitions(conn, seasons)
+        if created:
+            print(f"[ETL] Created {created} season partitions")
+
+    def _attach_stat_keys(
+        self,
+        conn: psycopg.Connection,
+        stats_df: pd.DataFrame,
+        games_table: str = "games",
+    ) -> pd.DataFrame:
+        game_keys = self._fetch_key_map(conn, f"SELECT game_id, game_key FROM {games_table}")
+        game_seasons = self._fetch_key_map(conn, f"SELECT game_id, season_id FROM {games_table}")
+        player_keys = self._fetch_key_map(conn, "SELECT player_id, player_key FROM players")
+        team_keys = self._fetch_key_map(conn, "SELECT team_id, team_key FROM teams")
+        df = stats_df.assign(
+            game_key=self._map_keys(stats_df["game_id"], game_keys),
+            season_id=self._map_keys(stats_df["game_id"], game_seasons),
+            player_key=self._map_keys(stats_df["player_id"], player_keys),
+            team_key=self._map_keys(stats_df["team_id"], team_keys),
+        )
+
+        unresolved = df["game_key"].isna() | df["player_key"].isna() | df["team_key"].isna()
+        unresolved_count = int(unresolved.sum())
+        if unresolved_count:
+            print(
+                f"[ETL] Dropping {unresolved_count} player stat rows whose game, player or team was not loaded"
+            )
+            df = df[~unresolved]
+        return df
+
+    def _fetch_key_map(self, conn: psycopg.Connection, sql: str) -> dict[str, int]:
+        with conn.cursor() as cur:
+            cur.execute(sql)
+            return dict(cur.fetchall())
+
+    def _map_keys(self, ids: pd.Series, key_map: dict[str, int]) -> pd.Series:
+        # Categorical ids map once per category rather than once per row.
+        return ids.map(key_map).astype("float64").astype("Int32")
+
     def _upsert_teams(self, conn: psycopg.Connection, teams_df: pd.DataFrame) -> None:
         required = ["team_id", "team_name"]
         self._ensure_columns(teams_df, required, "teams")
@@ -403,7 +610,6 @@ class ETLLoader:
         rows = teams_df[
             ["team_id", "team_name", "abbreviation", "city", "conference", "division"]
         ]
-        rows = self._to_sql_rows(rows)
 
         sql = """
         INSERT INTO teams (team_id, team_name, abbreviation, city, conference, division)
@@ -417,16 +623,13 @@ class ETLLoader:
           division = EXCLUDED.division;
         """
 
-        self._executemany(conn, sql, rows.itertuples(index=False, name=None))
+        self._executemany(conn, sql, self._iter_sql_rows(rows))
 
     def _upsert_players(self, conn: psycopg.Connection, players_df: pd.DataFrame) -> None:
         required = ["player_id", "player_name"]
         self._ensure_columns(players_df, required, "players")
 
-        rows = players_df[["player_id", "player_name", "first_name", "last_name", "position"]].fillna(
-            value=pd.NA
-        )
-        rows = self._to_sql_rows(rows)
+        rows = players_df[["player_id", "player_name", "first_name", "last_name", "position"]]
 
         sql = """
         INSERT INTO players (player_id, player_name, first_name, last_name, position)
@@ -439,14 +642,13 @@ class ETLLoader:
           position = EXCLUDED.position;
         """
 
-        self._executemany(conn, sql, rows.itertuples(index=False, name=None))
+        self._executemany(conn, sql, self._iter_sql_rows(rows))
 
     def _upsert_seasons(self, conn: psycopg.Connection, seasons_df: pd.DataFrame) -> None:
         required = ["season_label", "start_year", "end_year"]
         self._ensure_columns(seasons_df, required, "seasons")
 
         rows = seasons_df[["season_label", "start_year", "end_year"]]
-        rows = self._to_sql_rows(rows)
 
         sql = """
         INSERT INTO seasons (season_label, start_year, end_year)
@@ -457,126 +659,65 @@ class ETLLoader:
           end_year = EXCLUDED.end_year;
         """
 
-        self._executemany(conn, sql, rows.itertuples(index=False, name=None))
+        self._executemany(conn, sql, self._iter_sql_rows(rows))
 
-    def _upsert_games(self, conn: psycopg.Connection, games_df: pd.DataFrame) -> None:
-        required = ["game_id", "season_id", "game_date", "home_team_id", "away_team_id"]
+    def _upsert_games(
+        self,
+        conn: psycopg.Connection,
+        games_df: pd.DataFrame,
+        table: str = "games",
+    ) -> None:
+        required = ["game_id", "season_id", "game_date", "home_team_key", "away_team_key"]
         self._ensure_columns(games_df, required, "games")
 
-        df = games_df.copy()
-        if "game_type" not in df.columns:
-            df["game_type"] = "regular"
-        if "winner_team_id" not in df.columns:
-            df["winner_team_id"] = None
-        if "home_points" not in df.columns:
-            df["home_points"] = None
-        if "away_points" not in df.columns:
-            df["away_points"] = None
-
-        df["game_date"] = df["game_date"].apply(self._normalize_date)
-
-        rows = df[
-            [
-                "game_id",
-                "season_id",
-                "game_date",
-                "game_type",
-                "home_team_id",
-                "away_team_id",
-                "home_points",
-                "away_points",
-                "winner_team_id",
-            ]
-        ]
-        rows = self._to_sql_rows(rows)
+        rows = games_df.reindex(columns=GAME_COLUMNS)
+        if "game_type" not in games_df.columns:
+            rows["game_type"] = "regular"
+        rows["game_date"] = rows["game_date"].map(self._normalize_date)
 
-        sql = """
-        INSERT INTO games (
+        sql = f"""
+        INSERT INTO {table} (
           game_id,
           season_id,
           game_date,
           game_type,
-          home_team_id,
-          away_team_id,
+          home_team_key,
+          away_team_key,
           home_points,
           away_points,
-          winner_team_id
+          winner_team_key
         )
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (game_id)
+        ON CONFLICT (game_id, season_id)
         DO UPDATE SET
-          season_id = EXCLUDED.season_id,
           game_date = EXCLUDED.game_date,
           game_type = EXCLUDED.game_type,
-          home_team_id = EXCLUDED.home_team_id,
-          away_team_id = EXCLUDED.away_team_id,
+          home_team_key = EXCLUDED.home_team_key,
+          away_team_key = EXCLUDED.away_team_key,
           home_points = EXCLUDED.home_points,
           away_points = EXCLUDED.away_points,
-          winner_team_id = EXCLUDED.winner_team_id;
+          winner_team_key = EXCLUDED.winner_team_key;
         """
 
-        self._executemany(conn, sql, rows.itertuples(index=False, name=None))
+        self._executemany(conn, sql, self._iter_sql_rows(rows))
 
-    def _upsert_player_game_stats(self, conn: psycopg.Connection, stats_df: pd.DataFrame) -> None:
-        required = ["game_id", "player_id", "team_id"]
+    def _upsert_player_game_stats(
+        self,
+        conn: psycopg.Connection,
+        stats_df: pd.DataFrame,
+        table: str = "player_game_stats",
+    ) -> None:
+        required = ["game_key", "player_key", "season_id", "team_key"]
         self._ensure_columns(stats_df, required, "player_game_stats")
 
-        df = stats_df.copy()
-        for optional_col in [
-            "starter",
-            "minutes",
-            "points",
-            "rebounds",
-            "assists",
-            "steals",
-            "blocks",
-            "turnovers",
-            "fouls",
-            "plus_minus",
-            "fg_made",
-            "fg_attempts",
-            "three_made",
-            "three_attempts",
-            "ft_made",
-            "ft_attempts",
-            "offensive_rebounds",
-            "defensive_rebounds",
-        ]:
-            if optional_col not in df.columns:
-                df[optional_col] = None
-
-        rows = df[
-            [
-                "game_id",
-                "player_id",
-                "team_id",
-                "starter",
-                "minutes",
-                "points",
-                "rebounds",
-                "assists",
-                "steals",
-                "blocks",
-                "turnovers",
-                "fouls",
-                "plus_minus",
-                "fg_made",
-                "fg_attempts",
-                "three_made",
-                "three_attempts",
-                "ft_made",
-                "ft_attempts",
-                "offensive_rebounds",
-                "defensive_rebounds",
-            ]
-        ]
-        rows = self._to_sql_rows(rows)
+        rows = stats_df.reindex(columns=PLAYER_GAME_STAT_COLUMNS)
 
-        sql = """
-        INSERT INTO player_game_stats (
-          game_id,
-          player_id,
-          team_id,
+        sql = f"""
+        INSERT INTO {table} (
+          game_key,
+          player_key,
+          season_id,
+          team_key,
           starter,
           minutes,
           points,
@@ -596,10 +737,10 @@ class ETLLoader:
           offensive_rebounds,
           defensive_rebounds
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (game_id, player_id)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (game_key, player_key, season_id)
         DO UPDATE SET
-          team_id = EXCLUDED.team_id,
+          team_key = EXCLUDED.team_key,
           starter = EXCLUDED.starter,
           minutes = EXCLUDED.minutes,
           points = EXCLUDED.points,
@@ -620,7 +761,7 @@ class ETLLoader:
           defensive_rebounds = EXCLUDED.defensive_rebounds;
         """
 
-        self._executemany(conn, sql, rows.itertuples(index=False, name=None))
+        self._executemany(conn, sql, self._iter_sql_rows(rows))
 
     def _ensure_columns(self, df: pd.DataFrame, required_cols: list[str], dataset_name: str) -> None:
         missing = [col for col in required_cols if col not in df.columns]
@@ -656,11 +797,32 @@ class ETLLoader:
             return "preseason"
         return text.replace(" ", "_")
 
-    def _to_sql_rows(self, frame: pd.DataFrame) -> pd.DataFrame:
-        # psycopg cannot adapt pandas NA/NaN scalar types directly.
-        return frame.astype(object).where(pd.notna(frame), None)
+    def _iter_sql_rows(self, frame: pd.DataFrame) -> Iterator[tuple]:
+        # Convert one batch of column slices at a time to Python values; psycopg cannot
+        # adapt pandas NA/NaN scalars, and no object-dtype copy of the frame is built.
+        for start in range(0, len(frame), SQL_BATCH_ROWS):
+            chunk = frame.iloc[start : start + SQL_BATCH_ROWS]
+            columns = [self._sql_values(chunk.iloc[:, position]) for position in range(chunk.shape[1])]
+            yield from zip(*columns)
+
+    def _sql_values(self, series: pd.Series) -> list[object]:
+        values = series.tolist()
+        missing = series.isna().to_numpy()
+        if missing.any():
+            values = [None if is_missing else value for value, is_missing in zip(values, missing)]
+        return values
+
+    def _compose_player_name(self, df: pd.DataFrame) -> pd.Series:
+        full_name = df["first_name"].astype("string").fillna("").str.strip() + " "
+        full_name += df["last_name"].astype("string").fillna("").str.strip()
+        return full_name.str.strip()
 
     def _sanitize_string_series(self, series: pd.Series) -> pd.Series:
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Clean the category labels once instead of every row.
+            labels = self._sanitize_string_series(pd.Series(series.cat.categories.astype(str)))
+            return recode_categories(series, labels)
+
         cleaned = series.astype("string").str.strip().str.lower()
         invalid = {"", "nan", "none", "null", "<na>", "na"}
         mask_invalid = cleaned.isna() | cleaned.isin(invalid)
@@ -672,7 +834,7 @@ class ETLLoader:
         iterator = iter(rows)
         with conn.cursor() as cur:
             while True:
-                batch = list(islice(iterator, 10_000))
+                batch = list(islice(iterator, SQL_BATCH_ROWS))
                 if not batch:
                     break
                 cur.executemany(sql, batch)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Mapping
+from typing import Iterable, Mapping
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,9 +23,9 @@ def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 
 
-def apply_aliases(df: pd.DataFrame, aliases: Mapping[str, list[str]]) -> pd.DataFrame:
+def alias_rename_map(columns: Iterable[str], aliases: Mapping[str, list[str]]) -> dict[str, str]:
     rename_map: dict[str, str] = {}
-    cols = set(df.columns)
+    cols = set(columns)
 
     for canonical, candidates in aliases.items():
         for candidate in candidates:
@@ -33,4 +34,77 @@ def apply_aliases(df: pd.DataFrame, aliases: Mapping[str, list[str]]) -> pd.Data
                 rename_map[candidate_snake] = canonical
                 break
 
-    return df.rename(columns=rename_map)
+    return rename_map
+
+
+
+def apply_aliases(df: pd.DataFrame, aliases: Mapping[str, list[str]]) -> pd.DataFrame:
+    return df.rename(columns=alias_rename_map(df.columns, aliases))
+
+
+
+def resolve_source_columns(
+    raw_columns: Iterable[str],
+    aliases: Mapping[str, list[str]],
+) -> dict[str, str]:
+    """Map raw source column names to the names they get after normalization and aliasing."""
+    normalized = {raw: to_snake_case(str(raw)) for raw in raw_columns}
+    rename_map = alias_rename_map(normalized.values(), aliases)
+    return {raw: rename_map.get(snake, snake) for raw, snake in normalized.items()}
+
+
+
+def apply_column_dtypes(df: pd.DataFrame, dtypes: Mapping[str, str]) -> pd.DataFrame:
+    """Convert canonical columns to the compact dtypes declared in COLUMN_DTYPES."""
+    for col, kind in dtypes.items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+        if kind in {"id", "category"}:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype("category")
+            df[col] = canonicalize_id_categories(series) if kind == "id" else series
+        elif kind == "count":
+            df[col] = downcast_count(pd.to_numeric(series, errors="coerce"))
+        elif kind == "float32":
+            df[col] = pd.to_numeric(series, errors="coerce").astype("float32")
+    return df
+
+
+
+def canonicalize_id_categories(series: pd.Series) -> pd.Series:
+    """Render integral identifiers as integers ("1610612747", not "1610612747.0" or "01610612747")."""
+    categories = series.cat.categories
+    if categories.empty:
+        return series
+    numeric = pd.to_numeric(pd.Series(categories), errors="coerce")
+    if numeric.isna().any() or not (numeric % 1 == 0).all():
+        return series
+    return recode_categories(series, numeric.astype("int64").astype(str))
+
+
+
+def recode_categories(series: pd.Series, labels: pd.Series) -> pd.Series:
+    """Replace each category of `series` with the matching entry of `labels`.
+
+    Only the category table is rewritten; labels may collide (merging categories)
+    or be missing (turning those rows into NA).
+    """
+    categories = pd.Index(labels.dropna().unique())
+    remap = np.append(categories.get_indexer(labels), -1)
+    codes = remap[series.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories),
+        index=series.index,
+        name=series.name,
+    )
+
+
+
+def downcast_count(series: pd.Series) -> pd.Series:
+    values = series.dropna()
+    if not (values % 1 == 0).all():
+        return series.astype("float32")
+    if values.empty or (values.min() >= -32_768 and values.max() <= 32_767):
+        return series.astype("Int16")
+    return series.astype("Int32")
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+import psycopg
+
+
+# Season-partitioned tables, parents before children: player_game_stats references games.
+PARTITIONED_TABLES = ("games", "player_game_stats")
+
+
+def partition_name(table: str, season_label: str) -> str:
+    suffix = re.sub(r"[^0-9a-z]+", "_", season_label.lower()).strip("_")
+    return f"{table}_{suffix}"
+
+
+def staging_name(table: str, season_label: str) -> str:
+    return f"{partition_name(table, season_label)}_staging"
+
+
+def ensure_season_partitions(conn: psycopg.Connection, seasons: Iterable[tuple[int, str]]) -> int:
+    """Create missing per-season partitions; returns how many were created."""
+    created = 0
+    with conn.cursor() as cur:
+        for season_id, season_label in seasons:
+            for table in PARTITIONED_TABLES:
+                name = partition_name(table, season_label)
+                cur.execute("SELECT to_regclass(%s)", (name,))
+                if cur.fetchone()[0] is not None:
+                    continue
+                cur.execute(f'CREATE TABLE "{name}" PARTITION OF {table} FOR VALUES IN ({int(season_id)})')
+                created += 1
+                if table == "player_game_stats":
+                    _add_game_foreign_key(cur, name, partition_name("games", season_label), season_label)
+    return created
+
+
+def create_staging_partitions(conn: psycopg.Connection, season_id: int, season_label: str) -> dict[str, str]:
+    """Empty, indexed copies of each season partition to load a replacement into."""
+    staged = {table: staging_name(table, season_label) for table in PARTITIONED_TABLES}
+    with conn.cursor() as cur:
+        for table in reversed(PARTITIONED_TABLES):
+            cur.execute(f'DROP TABLE IF EXISTS "{staged[table]}"')
+
+        for table in PARTITIONED_TABLES:
+            name = staged[table]
+            cur.execute(
+                f'CREATE TABLE "{name}" (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES)'
+            )
+            # A constraint matching the partition bound lets ATTACH skip its validation scan.
+            cur.execute(
+                f'ALTER TABLE "{name}" ADD CONSTRAINT "{partition_name(table, season_label)}_season" '
+                f"CHECK (season_id = {int(season_id)})"
+            )
+
+        _add_game_foreign_key(cur, staged["player_game_stats"], staged["games"], season_label)
+    return staged
+
+
+def swap_season_partitions(conn: psycopg.Connection, season_id: int, season_label: str) -> None:
+    """Replace a season's live partitions with their staged copies.
+
+    Runs in the caller's transaction; the parents are locked only from the first
+    DETACH until commit.
+    """
+    with conn.cursor() as cur:
+        for table in reversed(PARTITIONED_TABLES):
+            name = partition_name(table, season_label)
+            cur.execute("SELECT to_regclass(%s)", (name,))
+            if cur.fetchone()[0] is not None:
+                cur.execute(f'ALTER TABLE {table} DETACH PARTITION "{name}"')
+                cur.execute(f'DROP TABLE "{name}"')
+
+        for table in PARTITIONED_TABLES:
+            name = partition_name(table, season_label)
+            staged = staging_name(table, season_label)
+            cur.execute(f'ALTER TABLE "{staged}" RENAME TO "{name}"')
+            _rename_staged_indexes(cur, name, staged)
+            cur.execute(f'ALTER TABLE {table} ATTACH PARTITION "{name}" FOR VALUES IN ({int(season_id)})')
+
+
+def _add_game_foreign_key(cur: psycopg.Cursor, stats_table: str, games_table: str, season_label: str) -> None:
+    constraint = f"{partition_name('player_game_stats', season_label)}_game_fkey"
+    cur.execute(
+        f'ALTER TABLE "{stats_table}" ADD CONSTRAINT "{constraint}" '
+        f'FOREIGN KEY (game_key, season_id) REFERENCES "{games_table}" (game_key, season_id)'
+    )
+
+
+def _rename_staged_indexes(cur: psycopg.Cursor, table: str, staged: str) -> None:
+    cur.execute("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s", (table,))
+    for (index_name,) in cur.fetchall():
+        if index_name.startswith(staged):
+            cur.execute(f'ALTER INDEX "{index_name}" RENAME TO "{table}{index_name[len(staged):]}"')
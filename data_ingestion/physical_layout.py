@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import psycopg
+
+from .index_lifecycle import analyze_tables
+
+
+# Tables rewritten in player order so a player's games share pages. Loads append
+# in source order and season reloads append at the end, so re-run after loading.
+CLUSTER_TARGETS = (
+    ("player_game_stats", "idx_player_stats_player"),
+    ("player_game_facts", "idx_player_facts_player"),
+)
+
+# BRIN indexes only pay off on columns stored close to sorted order, so each
+# candidate is created only when the planner's correlation statistic agrees.
+BRIN_CANDIDATES = (
+    ("idx_games_date_brin", "games", "game_date"),
+    ("idx_player_facts_date_brin", "player_game_facts", "game_date"),
+)
+BRIN_MIN_CORRELATION = 0.9
+
+# The team families read team_game_results, i.e. games by home or away team and
+# game type; these let each branch of the view answer from the index alone.
+COVERING_INDEXES = (
+    (
+        "idx_games_home_team_covering",
+        "CREATE INDEX IF NOT EXISTS idx_games_home_team_covering ON games "
+        "(home_team_key, game_type) INCLUDE (away_team_key, home_points, away_points, season_id)",
+    ),
+    (
+        "idx_games_away_team_covering",
+        "CREATE INDEX IF NOT EXISTS idx_games_away_team_covering ON games "
+        "(away_team_key, game_type) INCLUDE (home_team_key, home_points, away_points, season_id)",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class LayoutAction:
+    step: str
+    target: str
+    detail: str
+
+
+def optimize_physical_layout(conn: psycopg.Connection, cluster: bool = True) -> list[LayoutAction]:
+    """Cluster, then add covering and BRIN indexes, then refresh statistics.
+
+    Needs an autocommit connection: CLUSTER on a partitioned table cannot run in a
+    transaction block. CLUSTER holds an exclusive lock on each table while it runs.
+    """
+    actions: list[LayoutAction] = []
+    with conn.cursor() as cur:
+        if cluster:
+            for table, index in CLUSTER_TARGETS:
+                cur.execute(f'CLUSTER "{table}" USING "{index}"')
+                actions.append(LayoutAction("cluster", table, f"rewritten in {index} order"))
+
+        for name, statement in COVERING_INDEXES:
+            cur.execute(statement)
+            actions.append(LayoutAction("covering index", name, "created or already present"))
+
+        # Fresh statistics first: CLUSTER changes the correlations BRIN depends on.
+        analyze_tables(conn, sorted({table for _, table, _ in BRIN_CANDIDATES}))
+        for name, table, column in BRIN_CANDIDATES:
+            correlation = _column_correlation(cur, table, column)
+            if correlation is None or abs(correlation) < BRIN_MIN_CORRELATION:
+                cur.execute(f'DROP INDEX IF EXISTS "{name}"')
+                actions.append(
+                    LayoutAction("skip brin", f"{table}.{column}", f"correlation {_format(correlation)}")
+                )
+                continue
+            cur.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING brin ("{column}")')
+            actions.append(LayoutAction("brin index", name, f"correlation {_format(correlation)}"))
+
+    analyze_tables(conn, [table for table, _ in CLUSTER_TARGETS] + ["games"])
+    return actions
+
+
+def _column_correlation(cur: psycopg.Cursor, table: str, column: str) -> float | None:
+    # Partitioned parents only carry inherited statistics.
+    cur.execute(
+        """
+        SELECT correlation
+        FROM pg_stats
+        WHERE schemaname = current_schema() AND tablename = %s AND attname = %s
+        ORDER BY inherited DESC
+        LIMIT 1
+        """,
+        (table, column),
+    )
+    row = cur.fetchone()
+    return None if row is None else row[0]
+
+
+def _format(correlation: float | None) -> str:
+    return "unknown" if correlation is None else f"{correlation:.2f}"
@@ -5,11 +5,10 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
-
-from .column_aliases import COLUMN_ALIASES
+from .config import DEFAULT_SOURCE_CACHE_DIR
 from .file_discovery import DATASET_FILE_CANDIDATES, find_existing_file
-from .normalize import apply_aliases, normalize_columns
+from .readers import count_dataset_rows, read_dataset
+from .source_cache import SourceCache
 
 
 @dataclass
@@ -32,7 +31,7 @@ def _derive_season_label(game_date: str) -> str:
 
 
 
-def profile_raw_source(raw_data_dir: Path) -> SourceProfile:
+def profile_raw_source(raw_data_dir: Path, source_cache_dir: Path | None = None) -> SourceProfile:
     games_path = find_existing_file(raw_data_dir, "games")
     pgs_path = find_existing_file(raw_data_dir, "player_game_stats")
 
@@ -43,11 +42,11 @@ def profile_raw_source(raw_data_dir: Path) -> SourceProfile:
             f"Expected one games file ({game_names}) and one stats file ({stats_names}) in {raw_data_dir}."
         )
 
-    games_df = pd.read_csv(games_path, low_memory=False)
-    games_df = normalize_columns(games_df)
-    games_df = apply_aliases(games_df, COLUMN_ALIASES["games"])
+    cache = SourceCache(source_cache_dir) if source_cache_dir is not None else None
+    games_df = read_dataset(games_path, "games", columns=["game_date", "season_label"], cache=cache)
 
-    pgs_df = pd.read_csv(pgs_path, low_memory=False)
+    # Only the row count is needed, so the stats file is never materialized here.
+    player_game_stats_rows = count_dataset_rows(pgs_path, "player_game_stats", cache=cache)
 
     if "game_date" not in games_df.columns:
         raise ValueError("Games file must contain game date (or alias).")
@@ -65,7 +64,7 @@ def profile_raw_source(raw_data_dir: Path) -> SourceProfile:
 
     return SourceProfile(
         games_rows=len(games_df),
-        player_game_stats_rows=len(pgs_df),
+        player_game_stats_rows=player_game_stats_rows,
         distinct_seasons=seasons,
         first_game_date=date_series.min() if not date_series.empty else None,
         last_game_date=date_series.max() if not date_series.empty else None,
@@ -76,5 +75,5 @@ def profile_raw_source(raw_data_dir: Path) -> SourceProfile:
 
 if __name__ == "__main__":
     raw_dir = Path("data/raw")
-    profile = profile_raw_source(raw_dir)
+    profile = profile_raw_source(raw_dir, source_cache_dir=DEFAULT_SOURCE_CACHE_DIR)
     print(json.dumps(asdict(profile), indent=2))
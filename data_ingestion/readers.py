@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import gzip
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+import pandas as pd
+
+from .column_aliases import COLUMN_ALIASES, COLUMN_DTYPES
+from .file_discovery import COLUMNAR_SUFFIXES
+from .normalize import apply_column_dtypes, resolve_source_columns
+from .source_cache import SourceCache
+
+
+CSV_CHUNK_ROWS = 250_000
+
+PARSE_DTYPES = {"id": "category", "category": "category", "count": "float32", "float32": "float32"}
+
+
+
+@contextmanager
+def open_source(path: Path) -> Iterator[IO[bytes]]:
+    """Open a raw input file, decompressing `.gz`/`.zst` on the fly."""
+    suffix = path.suffix.lower()
+
+    if suffix == ".gz":
+        with gzip.open(path, "rb") as handle:
+            yield handle
+        return
+
+    if suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError(
+                f"Reading {path.name} requires zstandard. "
+                "Install it with `python -m pip install -e '.[zstd]'`."
+            ) from exc
+
+        with path.open("rb") as raw, zstandard.ZstdDecompressor().stream_reader(raw) as handle:
+            yield handle
+        return
+
+    with path.open("rb") as handle:
+        yield handle
+
+
+
+def read_csv_source(path: Path, **read_kwargs: Any) -> pd.DataFrame:
+    read_kwargs.setdefault("low_memory", False)
+    with open_source(path) as handle:
+        return pd.read_csv(handle, **read_kwargs)
+
+
+
+def iter_csv_chunks(
+    path: Path,
+    chunksize: int = CSV_CHUNK_ROWS,
+    **read_kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    with open_source(path) as handle:
+        with pd.read_csv(handle, chunksize=chunksize, **read_kwargs) as reader:
+            yield from reader
+
+
+
+def count_csv_rows(path: Path) -> int:
+    return sum(len(chunk) for chunk in iter_csv_chunks(path, usecols=[0]))
+
+
+
+def read_dataset(
+    path: Path,
+    dataset_key: str,
+    columns: list[str] | None = None,
+    cache: SourceCache | None = None,
+) -> pd.DataFrame:
+    """Read a raw dataset with normalized, alias-applied column names and compact dtypes.
+
+    Columnar inputs are read natively. CSV inputs are served from the Parquet
+    source cache when a fresh copy exists, and populate it otherwise. Only the
+    requested columns are parsed, except that a cache fill keeps every
+    canonical column so later readers can share it.
+    """
+    if path.suffix.lower() in COLUMNAR_SUFFIXES:
+        return _read_columnar(path, dataset_key, columns)
+
+    if cache is not None:
+        cached = cache.load(path, dataset_key, columns)
+        if cached is not None:
+            return cached
+
+    parse_columns = list(COLUMN_ALIASES[dataset_key]) if cache is not None else columns
+    df = _read_typed_csv(path, dataset_key, parse_columns)
+    if cache is not None:
+        cache.store(path, dataset_key, df)
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+    return df
+
+
+
+def count_dataset_rows(path: Path, dataset_key: str, cache: SourceCache | None = None) -> int:
+    if path.suffix.lower() in COLUMNAR_SUFFIXES:
+        return _arrow_row_count(path)
+
+    if cache is not None:
+        cached_rows = cache.row_count(path, dataset_key)
+        if cached_rows is not None:
+            return cached_rows
+
+    return count_csv_rows(path)
+
+
+
+def _read_typed_csv(path: Path, dataset_key: str, columns: list[str] | None) -> pd.DataFrame:
+    header = read_csv_source(path, nrows=0).columns
+    resolved = resolve_source_columns(header, COLUMN_ALIASES[dataset_key])
+    usecols = [raw for raw, name in resolved.items() if columns is None or name in columns]
+    dtypes = COLUMN_DTYPES.get(dataset_key, {})
+    parse_dtypes = {
+        raw: PARSE_DTYPES[dtypes[name]]
+        for raw, name in resolved.items()
+        if raw in usecols and dtypes.get(name) in PARSE_DTYPES
+    }
+
+    # Typed columns make chunked tokenizing safe, which keeps peak memory near the final frame size.
+    try:
+        df = read_csv_source(path, usecols=usecols, dtype=parse_dtypes, low_memory=True)
+    except ValueError as exc:
+        # Non-numeric text in a numeric column; parse it untyped and coerce below.
+        print(f"[ETL] Falling back to untyped numeric parse for {path.name}: {exc}")
+        text_dtypes = {raw: dtype for raw, dtype in parse_dtypes.items() if dtype == "category"}
+        df = read_csv_source(path, usecols=usecols, dtype=text_dtypes)
+
+    df = df.rename(columns=resolved)
+    return apply_column_dtypes(df, dtypes)
+
+
+
+def _read_columnar(path: Path, dataset_key: str, columns: list[str] | None) -> pd.DataFrame:
+    resolved = resolve_source_columns(_arrow_schema_names(path), COLUMN_ALIASES[dataset_key])
+    selected = [raw for raw, name in resolved.items() if columns is None or name in columns]
+    table = _open_arrow_table(path, columns=selected)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    df = df.rename(columns=resolved)
+    return apply_column_dtypes(df, COLUMN_DTYPES.get(dataset_key, {}))
+
+
+
+def _arrow_schema_names(path: Path) -> list[str]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if path.suffix.lower() == ".parquet":
+        return list(pq.read_schema(path).names)
+    with pa.memory_map(str(path)) as source:
+        return list(pa.ipc.open_file(source).schema.names)
+
+
+
+def _arrow_row_count(path: Path) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if path.suffix.lower() == ".parquet":
+        return pq.ParquetFile(path).metadata.num_rows
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        return sum(reader.get_batch(index).num_rows for index in range(reader.num_record_batches))
+
+
+
+def _open_arrow_table(path: Path, columns: list[str] | None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if path.suffix.lower() == ".parquet":
+        return pq.read_table(path, columns=columns, memory_map=True)
+
+    # Arrow IPC / Feather v2 files are memory-mapped, so column buffers are not copied.
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table
@@ -1,12 +1,39 @@
 from __future__ import annotations
 
+import argparse
+
 from .config import load_settings
 from .loaders import ETLLoader
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Load raw NBA CSVs into PostgreSQL.")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Drop secondary indexes during the load and rebuild them in parallel afterwards.",
+    )
+    parser.add_argument(
+        "--season",
+        dest="seasons",
+        action="append",
+        metavar="LABEL",
+        help="Reload only this season (e.g. 2023-24) by swapping its partitions. Repeatable.",
+    )
+    args = parser.parse_args()
+    if args.bulk and args.seasons:
+        parser.error("--bulk reloads every season; it cannot be combined with --season")
+
     settings = load_settings()
-    loader = ETLLoader(database_url=settings.database_url, raw_data_dir=settings.raw_data_dir)
+    loader = ETLLoader(
+        database_url=settings.database_url,
+        raw_data_dir=settings.raw_data_dir,
+        source_cache_dir=settings.source_cache_dir,
+        bulk=args.bulk,
+        maintenance_work_mem=settings.maintenance_work_mem,
+        index_build_workers=settings.index_build_workers,
+        seasons=args.seasons,
+    )
     report = loader.run()
 
     print("ETL complete")
@@ -15,6 +42,10 @@ def main() -> None:
     print(f"  seasons: {report.seasons_loaded}")
     print(f"  games: {report.games_loaded}")
     print(f"  player_game_stats: {report.player_game_stats_loaded}")
+    print(f"  player_game_facts: {report.player_game_facts_loaded}")
+    if args.bulk:
+        print(f"  indexes rebuilt: {report.indexes_rebuilt}")
+    print(f"  data version: {report.data_version}")
 
 
 if __name__ == "__main__":
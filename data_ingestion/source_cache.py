@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from .column_aliases import COLUMN_ALIASES
+
+
+# Bump when the cached frame layout changes so stale caches are ignored.
+CACHE_FORMAT_VERSION = 2
+
+
+class SourceCache:
+    """Normalized, typed Parquet copies of raw inputs keyed by source fingerprint."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.enabled = importlib.util.find_spec("pyarrow") is not None
+        if not self.enabled:
+            print("[ETL] pyarrow is not installed; Parquet source cache disabled")
+
+    def fingerprint(self, source: Path, dataset_key: str) -> str:
+        stat = source.stat()
+        payload = json.dumps(
+            {
+                "format": CACHE_FORMAT_VERSION,
+                "source": str(source.resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "aliases": COLUMN_ALIASES[dataset_key],
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def cache_path(self, source: Path, dataset_key: str) -> Path:
+        return self.cache_dir / f"{dataset_key}-{self.fingerprint(source, dataset_key)}.parquet"
+
+    def load(
+        self,
+        source: Path,
+        dataset_key: str,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        if not self.enabled:
+            return None
+        path = self.cache_path(source, dataset_key)
+        if not path.exists():
+            return None
+
+        import pyarrow.parquet as pq
+
+        if columns is not None:
+            available = set(pq.read_schema(path).names)
+            columns = [col for col in columns if col in available]
+
+        # Memory-mapped read; string and null-free numeric columns reach pandas without copying.
+        table = pq.read_table(path, columns=columns, memory_map=True)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def row_count(self, source: Path, dataset_key: str) -> int | None:
+        if not self.enabled:
+            return None
+        path = self.cache_path(source, dataset_key)
+        if not path.exists():
+            return None
+
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(path).metadata.num_rows
+
+    def store(self, source: Path, dataset_key: str, df: pd.DataFrame) -> Path | None:
+        if not self.enabled:
+            return None
+
+        path = self.cache_path(source, dataset_key)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            df.to_parquet(tmp_path, index=False)
+        except Exception as exc:
+            tmp_path.unlink(missing_ok=True)
+            print(f"[ETL] Skipping source cache for {source.name}: {exc}")
+            return None
+
+        os.replace(tmp_path, path)
+        for stale in self.cache_dir.glob(f"{dataset_key}-*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        return path
@@ -72,8 +72,8 @@ def run_audit(database_url: str) -> AuditReport:
                 """
                 SELECT COUNT(*)
                 FROM player_game_stats pgs
-                LEFT JOIN games g ON g.game_id = pgs.game_id
-                WHERE g.game_id IS NULL
+                LEFT JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
+                WHERE g.game_key IS NULL
                 """
             )
             orphan_player_game_stats = cur.fetchone()[0]
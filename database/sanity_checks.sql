@@ -23,26 +23,30 @@ JOIN seasons s ON s.season_id = g.season_id;
 -- 3) Games with identical home/away team (should be 0)
 SELECT COUNT(*) AS invalid_same_team_games
 FROM games
-WHERE home_team_id = away_team_id;
+WHERE home_team_key = away_team_key;
 
 -- 4) Stats rows with team not in game participants (should be 0)
 SELECT COUNT(*) AS stats_team_not_in_game
 FROM player_game_stats pgs
-JOIN games g ON g.game_id = pgs.game_id
-WHERE pgs.team_id NOT IN (g.home_team_id, g.away_team_id);
+JOIN games g ON g.season_id = pgs.season_id AND g.game_key = pgs.game_key
+WHERE pgs.team_key NOT IN (g.home_team_key, g.away_team_key);
 
--- 5) Stats rows with null/blank IDs (should be 0)
-SELECT COUNT(*) AS stats_missing_required_ids
+-- 5) Stats rows with null keys (should be 0)
+SELECT COUNT(*) AS stats_missing_required_keys
 FROM player_game_stats
-WHERE game_id IS NULL OR player_id IS NULL OR team_id IS NULL
-   OR TRIM(game_id) = '' OR TRIM(player_id) = '' OR TRIM(team_id) = '';
+WHERE game_key IS NULL OR player_key IS NULL OR season_id IS NULL OR team_key IS NULL;
 
 -- 6) Games missing points (helps spot partial loads)
 SELECT COUNT(*) AS games_missing_score
 FROM games
 WHERE home_points IS NULL OR away_points IS NULL;
 
--- 7) team_game_results consistency check (should equal games * 2)
+-- 7) player_game_facts in step with player_game_stats (difference should be 0)
+SELECT
+  (SELECT COUNT(*) FROM player_game_stats) - (SELECT COUNT(*) FROM player_game_facts)
+    AS stats_missing_from_facts;
+
+-- 8) team_game_results consistency check (should equal games * 2)
 SELECT
   (SELECT COUNT(*) FROM games) AS game_count,
   (SELECT COUNT(*) FROM team_game_results) AS team_game_results_count,
@@ -8,8 +8,11 @@ CREATE TABLE IF NOT EXISTS seasons (
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Teams, players and games have compact integer surrogate keys used by every join;
+-- the source ids are kept as unique natural keys for lookups and upserts.
 CREATE TABLE IF NOT EXISTS teams (
-  team_id TEXT PRIMARY KEY,
+  team_key SMALLSERIAL PRIMARY KEY,
+  team_id TEXT NOT NULL UNIQUE,
   team_name TEXT NOT NULL,
   abbreviation TEXT,
   city TEXT,
@@ -19,7 +22,8 @@ CREATE TABLE IF NOT EXISTS teams (
 );
 
 CREATE TABLE IF NOT EXISTS players (
-  player_id TEXT PRIMARY KEY,
+  player_key SERIAL PRIMARY KEY,
+  player_id TEXT NOT NULL UNIQUE,
   player_name TEXT NOT NULL,
   first_name TEXT,
   last_name TEXT,
@@ -27,62 +31,110 @@ CREATE TABLE IF NOT EXISTS players (
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- games and player_game_stats are list-partitioned by season, one partition per
+-- season created by the ETL, so season filters prune and seasons reload by swap.
+-- Keys and unique constraints include season_id, as partitioning requires.
 CREATE TABLE IF NOT EXISTS games (
-  game_id TEXT PRIMARY KEY,
+  game_key SERIAL,
+  game_id TEXT NOT NULL,
   season_id INTEGER NOT NULL REFERENCES seasons(season_id),
   game_date DATE NOT NULL,
+  home_team_key SMALLINT NOT NULL REFERENCES teams(team_key),
+  away_team_key SMALLINT NOT NULL REFERENCES teams(team_key),
+  winner_team_key SMALLINT REFERENCES teams(team_key),
+  home_points SMALLINT,
+  away_points SMALLINT,
   game_type TEXT NOT NULL DEFAULT 'regular',
-  home_team_id TEXT NOT NULL REFERENCES teams(team_id),
-  away_team_id TEXT NOT NULL REFERENCES teams(team_id),
-  home_points INTEGER,
-  away_points INTEGER,
-  winner_team_id TEXT REFERENCES teams(team_id),
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-  CHECK (home_team_id <> away_team_id)
-);
+  PRIMARY KEY (game_key, season_id),
+  UNIQUE (game_id, season_id),
+  CHECK (home_team_key <> away_team_key)
+) PARTITION BY LIST (season_id);
 
+-- Fixed-width columns first, widest to narrowest, to avoid alignment padding.
 CREATE TABLE IF NOT EXISTS player_game_stats (
-  game_id TEXT NOT NULL REFERENCES games(game_id),
-  player_id TEXT NOT NULL REFERENCES players(player_id),
-  team_id TEXT NOT NULL REFERENCES teams(team_id),
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  game_key INTEGER NOT NULL,
+  player_key INTEGER NOT NULL REFERENCES players(player_key),
+  season_id INTEGER NOT NULL,
+  team_key SMALLINT NOT NULL REFERENCES teams(team_key),
+  points SMALLINT,
+  rebounds SMALLINT,
+  assists SMALLINT,
+  steals SMALLINT,
+  blocks SMALLINT,
+  turnovers SMALLINT,
+  fouls SMALLINT,
+  plus_minus SMALLINT,
+  fg_made SMALLINT,
+  fg_attempts SMALLINT,
+  three_made SMALLINT,
+  three_attempts SMALLINT,
+  ft_made SMALLINT,
+  ft_attempts SMALLINT,
+  offensive_rebounds SMALLINT,
+  defensive_rebounds SMALLINT,
   starter BOOLEAN,
   minutes NUMERIC(6,2),
-  points INTEGER,
-  rebounds INTEGER,
-  assists INTEGER,
-  steals INTEGER,
-  blocks INTEGER,
-  turnovers INTEGER,
-  fouls INTEGER,
-  plus_minus INTEGER,
-  fg_made INTEGER,
-  fg_attempts INTEGER,
-  three_made INTEGER,
-  three_attempts INTEGER,
-  ft_made INTEGER,
-  ft_attempts INTEGER,
-  offensive_rebounds INTEGER,
-  defensive_rebounds INTEGER,
-  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-  PRIMARY KEY (game_id, player_id)
-);
+  PRIMARY KEY (game_key, player_key, season_id)
+) PARTITION BY LIST (season_id);
+-- Each stats partition references its own season's games partition; the ETL adds
+-- that key with the partition, since checks against the partitioned parent cost
+-- several times more per inserted row.
 
-CREATE INDEX IF NOT EXISTS idx_games_season ON games(season_id);
 CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date);
-CREATE INDEX IF NOT EXISTS idx_games_teams ON games(home_team_id, away_team_id);
-CREATE INDEX IF NOT EXISTS idx_player_stats_team ON player_game_stats(team_id);
-CREATE INDEX IF NOT EXISTS idx_player_stats_player ON player_game_stats(player_id);
+CREATE INDEX IF NOT EXISTS idx_games_teams ON games(home_team_key, away_team_key);
+CREATE INDEX IF NOT EXISTS idx_player_stats_team ON player_game_stats(team_key);
+CREATE INDEX IF NOT EXISTS idx_player_stats_player ON player_game_stats(player_key);
 CREATE INDEX IF NOT EXISTS idx_player_stats_points ON player_game_stats(points);
 
+-- One wide row per player-game with the game, season and team context the player
+-- queries need, so they read a single table. Derived from games, seasons and
+-- player_game_stats and rebuilt by the ETL after every load; never written directly.
+CREATE TABLE IF NOT EXISTS player_game_facts (
+  game_date DATE NOT NULL,
+  game_key INTEGER NOT NULL,
+  player_key INTEGER NOT NULL,
+  season_id INTEGER NOT NULL,
+  start_year SMALLINT NOT NULL,
+  team_key SMALLINT NOT NULL,
+  opponent_team_key SMALLINT NOT NULL,
+  team_points SMALLINT,
+  opponent_points SMALLINT,
+  points SMALLINT,
+  rebounds SMALLINT,
+  assists SMALLINT,
+  steals SMALLINT,
+  blocks SMALLINT,
+  turnovers SMALLINT,
+  fg_made SMALLINT,
+  fg_attempts SMALLINT,
+  three_made SMALLINT,
+  three_attempts SMALLINT,
+  ft_made SMALLINT,
+  ft_attempts SMALLINT,
+  is_home BOOLEAN NOT NULL,
+  is_win BOOLEAN NOT NULL,
+  minutes NUMERIC(6,2),
+  game_type TEXT NOT NULL,
+  season_label TEXT NOT NULL
+);
+
+-- Covering indexes: per-player lookups and per-season leaderboards are index-only.
+CREATE INDEX IF NOT EXISTS idx_player_facts_player ON player_game_facts(player_key, season_id, game_type)
+  INCLUDE (points, rebounds, assists, steals, blocks, turnovers, minutes);
+CREATE INDEX IF NOT EXISTS idx_player_facts_season ON player_game_facts(season_id, game_type)
+  INCLUDE (player_key, points, rebounds, assists, steals, blocks, turnovers, minutes);
+
 -- View to simplify team-level game outcomes.
 CREATE OR REPLACE VIEW team_game_results AS
 SELECT
-  g.game_id,
+  g.game_key,
   g.season_id,
   g.game_date,
   g.game_type,
-  g.home_team_id AS team_id,
-  g.away_team_id AS opponent_team_id,
+  g.home_team_key AS team_key,
+  g.away_team_key AS opponent_team_key,
   g.home_points AS team_points,
   g.away_points AS opponent_points,
   CASE
@@ -93,12 +145,12 @@ SELECT
 FROM games g
 UNION ALL
 SELECT
-  g.game_id,
+  g.game_key,
   g.season_id,
   g.game_date,
   g.game_type,
-  g.away_team_id AS team_id,
-  g.home_team_id AS opponent_team_id,
+  g.away_team_key AS team_key,
+  g.home_team_key AS opponent_team_key,
   g.away_points AS team_points,
   g.home_points AS opponent_points,
   CASE
@@ -8,9 +8,28 @@ from dotenv import load_dotenv
 
 
 DEFAULT_SCHEMA_PATH = Path(__file__).with_name("schema.sql")
+TRIGRAM_SEARCH_PATH = Path(__file__).with_name("trigram_search.sql")
 
+LEGACY_LAYOUT_SQL = """
+SELECT (
+    to_regclass('teams') IS NOT NULL
+    AND NOT EXISTS (
+      SELECT 1 FROM information_schema.columns
+      WHERE table_schema = current_schema() AND table_name = 'teams' AND column_name = 'team_key'
+    )
+  ) OR (
+    to_regclass('games') IS NOT NULL
+    AND NOT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('games'))
+  )
+"""
 
-def apply_schema(schema_path: Path = DEFAULT_SCHEMA_PATH) -> None:
+
+def apply_schema(schema_path: Path = DEFAULT_SCHEMA_PATH) -> bool:
+    """Apply the schema, then the optional pg_trgm search indexes.
+
+    Returns whether the trigram indexes were created; servers without the
+    pg_trgm extension (or roles that may not create it) keep the catalog resolver.
+    """
     load_dotenv()
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
@@ -20,7 +39,29 @@ def apply_schema(schema_path: Path = DEFAULT_SCHEMA_PATH) -> None:
 
     with psycopg.connect(database_url, autocommit=True) as conn:
         with conn.cursor() as cur:
+            cur.execute(LEGACY_LAYOUT_SQL)
+            if cur.fetchone()[0]:
+                raise RuntimeError(
+                    "Existing tables predate the keyed, season-partitioned layout. "
+                    "Recreate the schema with `DROP SCHEMA public CASCADE; CREATE SCHEMA public;`, "
+                    "then run `courtside setup-db` and `courtside load-data`."
+                )
             cur.execute(schema_sql)
+            return apply_trigram_search(cur)
+
+
+
+def apply_trigram_search(cur: psycopg.Cursor) -> bool:
+    try:
+        cur.execute(TRIGRAM_SEARCH_PATH.read_text(encoding="utf-8"))
+    except (
+        psycopg.errors.FeatureNotSupported,
+        psycopg.errors.UndefinedFile,
+        psycopg.errors.InsufficientPrivilege,
+    ) as exc:
+        print(f"pg_trgm is not available ({exc.diag.message_primary}); ENTITY_RESOLVER=trigram will not work.")
+        return False
+    return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,7 @@
+-- Optional: database-side fuzzy name search for ENTITY_RESOLVER=trigram.
+-- Applied by setup_db.py after schema.sql; skipped when pg_trgm is unavailable.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Serve `name <% question` (word similarity) without scanning every name.
+CREATE INDEX IF NOT EXISTS idx_players_name_trgm ON players USING gin (player_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_teams_name_trgm ON teams USING gin (team_name gin_trgm_ops);
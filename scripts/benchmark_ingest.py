@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import multiprocessing
+import resource
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from data_ingestion.column_aliases import COLUMN_ALIASES
+from data_ingestion.readers import count_csv_rows, read_csv_source, read_dataset
+
+
+def compress_variants(source: Path, work_dir: Path) -> list[Path]:
+    variants = [source]
+
+    gz_path = work_dir / f"{source.name}.gz"
+    with source.open("rb") as src, gzip.open(gz_path, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+    variants.append(gz_path)
+
+    try:
+        import zstandard
+    except ImportError:
+        print("zstandard not installed; skipping .zst variant")
+    else:
+        zst_path = work_dir / f"{source.name}.zst"
+        with source.open("rb") as src, zst_path.open("wb") as dst:
+            zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+        variants.append(zst_path)
+
+    return variants
+
+
+def measure(path: Path, uncompressed_bytes: int) -> dict[str, float]:
+    started = time.perf_counter()
+    rows = count_csv_rows(path)
+    count_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    frame = read_csv_source(path)
+    parse_seconds = time.perf_counter() - started
+
+    return {
+        "rows": float(rows),
+        "file_mb": path.stat().st_size / 1_000_000,
+        "count_seconds": count_seconds,
+        "parse_seconds": parse_seconds,
+        "parse_mb_per_s": uncompressed_bytes / 1_000_000 / parse_seconds,
+        "parse_rows_per_s": len(frame) / parse_seconds,
+    }
+
+
+def _current_rss_kb() -> int:
+    with open("/proc/self/statm", encoding="utf-8") as handle:
+        resident_pages = int(handle.read().split()[1])
+    return resident_pages * resource.getpagesize() // 1024
+
+
+def _peak_memory_child(path: Path, dataset_key: str, queue: multiprocessing.Queue) -> None:
+    baseline_kb = _current_rss_kb()
+    started = time.perf_counter()
+    frame = read_dataset(path, dataset_key, columns=list(COLUMN_ALIASES[dataset_key]))
+    seconds = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put(
+        {
+            "seconds": seconds,
+            "peak_mb": (peak_kb - baseline_kb) / 1024,
+            "frame_mb": frame.memory_usage(deep=True).sum() / 1_000_000,
+            "columns": len(frame.columns),
+        }
+    )
+
+
+def report_peak_memory(source: Path, dataset_key: str) -> None:
+    # Each measurement runs in a fresh interpreter so ru_maxrss reflects only this read.
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_peak_memory_child, args=(source, dataset_key, queue))
+    process.start()
+    stats = queue.get()
+    process.join()
+    print(
+        f"{source.name}: read {stats['seconds']:.2f} s, peak RSS +{stats['peak_mb']:.0f} MB, "
+        f"frame {stats['frame_mb']:.0f} MB across {stats['columns']} columns"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report raw CSV read throughput for plain and compressed inputs.")
+    parser.add_argument("csv_path", type=Path, help="Uncompressed source CSV, e.g. data/raw/PlayerStatistics.csv")
+    parser.add_argument(
+        "--memory",
+        metavar="DATASET",
+        choices=sorted(COLUMN_ALIASES),
+        help="Instead of throughput, report peak memory of the ETL read for this dataset key.",
+    )
+    args = parser.parse_args()
+
+    source: Path = args.csv_path
+    if args.memory:
+        report_peak_memory(source, args.memory)
+        return
+
+    uncompressed_bytes = source.stat().st_size
+
+    with tempfile.TemporaryDirectory(prefix="courtside-ingest-") as tmp:
+        variants = compress_variants(source, Path(tmp))
+
+        print(f"{'input':<32} {'size MB':>9} {'rows':>10} {'count s':>8} {'parse s':>8} {'MB/s':>8} {'rows/s':>11}")
+        for path in variants:
+            stats = measure(path, uncompressed_bytes)
+            print(
+                f"{path.name:<32} {stats['file_mb']:>9.1f} {int(stats['rows']):>10} "
+                f"{stats['count_seconds']:>8.2f} {stats['parse_seconds']:>8.2f} "
+                f"{stats['parse_mb_per_s']:>8.1f} {stats['parse_rows_per_s']:>11,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
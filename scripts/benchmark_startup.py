@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+
+# What a CLI process imports before it can start each kind of work.
+STARTUP_IMPORTS = {
+    "cli": "import cli.main",
+    "ask": "import cli.main, agent.pipeline",
+}
+
+# Heavy modules the `ask` path must not pull in; the LLM client and charting load on demand.
+ASK_FORBIDDEN_MODULES = ("pandas", "requests", "matplotlib")
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| ( *)\S+$")
+
+
+def import_time_ms(statement: str) -> float:
+    """Cumulative import time of `statement` in a fresh interpreter, from -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        # Top-level entries (no indentation) add up to the whole statement.
+        if match and not match.group(2):
+            total_us += int(match.group(1))
+    return total_us / 1000
+
+
+def loaded_modules(statement: str, candidates: tuple[str, ...]) -> list[str]:
+    probe = f"{statement}; import sys; print(' '.join(m for m in {candidates!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return completed.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report CLI import time and guard against startup regressions.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--max-ask-ms",
+        type=float,
+        default=None,
+        help="Exit non-zero when the median `ask` import time exceeds this budget.",
+    )
+    args = parser.parse_args()
+
+    medians: dict[str, float] = {}
+    print(f"{'path':<6} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for name, statement in STARTUP_IMPORTS.items():
+        samples = [import_time_ms(statement) for _ in range(max(1, args.runs))]
+        medians[name] = statistics.median(samples)
+        print(f"{name:<6} {medians[name]:>10.1f} {min(samples):>8.1f} {max(samples):>8.1f}")
+
+    failures: list[str] = []
+    leaked = loaded_modules(STARTUP_IMPORTS["ask"], ASK_FORBIDDEN_MODULES)
+    if leaked:
+        failures.append(f"`ask` imports {', '.join(leaked)} at startup")
+    if args.max_ask_ms is not None and medians["ask"] > args.max_ask_ms:
+        failures.append(f"`ask` import time {medians['ask']:.1f} ms exceeds {args.max_ask_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+import data_ingestion
+from data_ingestion.loaders import ETLLoader
+
+
+PACKAGE_ROOT = str(Path(data_ingestion.__file__).resolve().parent)
+REPO_ROOT = str(Path(PACKAGE_ROOT).parent)
+
+
+class _DiscardCursor:
+    def __enter__(self) -> _DiscardCursor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def executemany(self, sql: str, rows: list[tuple]) -> None:
+        for _ in rows:
+            pass
+
+
+class _DiscardConnection:
+    """Stands in for psycopg so row emission is profiled without a database."""
+
+    def cursor(self) -> _DiscardCursor:
+        return _DiscardCursor()
+
+
+def _surrogate_keys(ids: pd.Series) -> dict[str, int]:
+    return {value: key for key, value in enumerate(ids.astype(str), start=1)}
+
+
+def run_phase(name: str, func: Callable[[], object], top: int) -> object:
+    tracemalloc.reset_peak()
+    before_current, _ = tracemalloc.get_traced_memory()
+    before_snapshot = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+
+    result = func()
+
+    seconds = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    print(
+        f"{name:<10} {seconds:>7.2f} s  peak +{(peak - before_current) / 1_000_000:>8.1f} MB  "
+        f"retained +{(current - before_current) / 1_000_000:>8.1f} MB"
+    )
+    if top:
+        print_top_sites(tracemalloc.take_snapshot().compare_to(before_snapshot, "traceback"), top)
+    return result
+
+
+def print_top_sites(stats: list[tracemalloc.StatisticDiff], top: int) -> None:
+    # Attribute each retained block to the innermost data_ingestion frame that caused it.
+    by_site: dict[str, int] = {}
+    for stat in stats:
+        site = next(
+            (
+                f"{frame.filename}:{frame.lineno}"
+                for frame in reversed(stat.traceback)
+                if frame.filename.startswith(PACKAGE_ROOT)
+            ),
+            "<outside data_ingestion>",
+        )
+        by_site[site] = by_site.get(site, 0) + stat.size_diff
+    for site, size in sorted(by_site.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {size / 1_000_000:>8.1f} MB  {site.replace(REPO_ROOT, '').lstrip('/')}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Profile ETL read/prepare/emit allocations with tracemalloc (no database needed)."
+    )
+    parser.add_argument("raw_dir", type=Path, help="Raw data directory, laid out as for the ETL")
+    parser.add_argument("--top", type=int, default=0, help="Also list the top N data_ingestion lines by retained memory per phase (slow)")
+    args = parser.parse_args()
+
+    loader = ETLLoader(database_url="", raw_data_dir=args.raw_dir)
+    conn = _DiscardConnection()
+
+    tracemalloc.start(25 if args.top else 1)
+    teams_raw, players_raw, games_raw, stats_raw = run_phase(
+        "read",
+        lambda: (
+            loader._maybe_read("teams"),
+            loader._maybe_read("players"),
+            loader._required_read("games"),
+            loader._required_read("player_game_stats"),
+        ),
+        args.top,
+    )
+
+    def prepare() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        games = loader._prepare_games(games_raw)
+        teams = teams_raw if not teams_raw.empty else loader._derive_teams_from_games(games)
+        players = players_raw if not players_raw.empty else loader._derive_players_from_stats(stats_raw)
+        teams = loader._prepare_teams(teams)
+        players = loader._prepare_players(players)
+        stats = loader._prepare_player_stats(stats_raw, teams, games)
+        return games, teams, players, stats
+
+    games, teams, players, stats = run_phase("prepare", prepare, args.top)
+
+    def emit() -> None:
+        # Surrogate keys normally come from the database; any stable integers work here.
+        team_keys = _surrogate_keys(teams["team_id"])
+        player_keys = _surrogate_keys(players["player_id"])
+        game_keys = _surrogate_keys(games["game_id"])
+        games_with_keys = games.assign(
+            season_id=pd.factorize(games["season_label"])[0] + 1,
+            home_team_key=loader._map_keys(games["home_team_id"], team_keys),
+            away_team_key=loader._map_keys(games["away_team_id"], team_keys),
+            winner_team_key=loader._map_keys(games["winner_team_id"], team_keys),
+        )
+        game_seasons = dict(zip(games_with_keys["game_id"], games_with_keys["season_id"]))
+        stats_with_keys = stats.assign(
+            game_key=loader._map_keys(stats["game_id"], game_keys),
+            season_id=loader._map_keys(stats["game_id"], game_seasons),
+            player_key=loader._map_keys(stats["player_id"], player_keys),
+            team_key=loader._map_keys(stats["team_id"], team_keys),
+        )
+        loader._upsert_teams(conn, teams)
+        loader._upsert_players(conn, players)
+        loader._upsert_games(conn, games_with_keys)
+        loader._upsert_player_game_stats(conn, stats_with_keys)
+
+    run_phase("emit", emit, args.top)
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
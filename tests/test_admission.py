@@ -0,0 +1,137 @@
+import threading
+import time
+
+import pytest
+
+from agent.admission import AdmissionController, Lane, LaneFullError, LaneLimits
+from agent.config import AgentSettings
+from agent.entities import Catalog, EntityResolver
+from agent.pipeline import AnalyticsAgent
+from agent.types import QueryResult
+
+TEMPLATE_QUESTION = "What was the average points of LeBron James in 2023-24?"
+FALLBACK_QUESTION = "Tell me something interesting about the league."
+
+# Columns the insight generator summarizes without the LLM.
+DETERMINISTIC_RESULT = QueryResult(
+    columns=["team_name", "player_name", "games", "wins", "win_pct", "avg_player_points", "avg_team_points"],
+    rows=[
+        {
+            "team_name": "Lakers",
+            "player_name": "LeBron James",
+            "games": 10,
+            "wins": 6,
+            "win_pct": 60.0,
+            "avg_player_points": 28.1,
+            "avg_team_points": 115.2,
+        }
+    ],
+)
+NARRATIVE_RESULT = QueryResult(columns=["team_name"], rows=[{"team_name": "Los Angeles Lakers"}])
+
+
+class FakeExecutor:
+    def __init__(self, result: QueryResult):
+        self.result = result
+
+    def run(self, sql: str, params: tuple) -> QueryResult:
+        return self.result
+
+
+class FakeOllama:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat(self, model: str, messages: list[dict[str, str]], temperature: float = 0.0) -> str:
+        self.calls += 1
+        if model == "sql-model":
+            return "```sql\nSELECT team_name FROM teams\n```"
+        return "The Lakers lead the list."
+
+
+def _agent(result: QueryResult) -> AnalyticsAgent:
+    agent = AnalyticsAgent(
+        AgentSettings(
+            database_url="postgresql://unused",
+            ollama_base_url="http://unused",
+            ollama_sql_model="sql-model",
+            ollama_summary_model="summary-model",
+            sql_max_rows=50,
+        )
+    )
+    agent.resolver = EntityResolver("postgresql://unused", snapshot_path=None)
+    agent.resolver._catalog = Catalog(
+        teams=[(1, "Los Angeles Lakers", "LAL")],
+        players=[(1, "LeBron James")],
+        seasons=["2023-24"],
+    )
+    agent.executor = FakeExecutor(result)
+    agent.ollama = FakeOllama()
+    agent._schema_context = "Schema context:\n- teams: team_name (text)"
+    return agent
+
+
+def _admitted(admission: AdmissionController) -> dict[str, int]:
+    return {name: lane.admitted for name, lane in admission.lanes.items()}
+
+
+def test_lane_queues_up_to_its_depth_then_sheds() -> None:
+    lane = Lane("slow", LaneLimits(concurrency=1, queue_depth=1))
+    lane.acquire()
+    waiter = threading.Thread(target=lambda: (lane.acquire(), lane.release()))
+    waiter.start()
+    while lane.waiting == 0:
+        time.sleep(0.01)
+
+    with pytest.raises(LaneFullError, match="slow lane is full") as excinfo:
+        lane.acquire()
+    lane.release()
+    waiter.join()
+
+    assert excinfo.value.lane == "slow"
+    assert lane.stats() == {
+        "concurrency": 1,
+        "queue_depth": 1,
+        "running": 0,
+        "waiting": 0,
+        "admitted": 2,
+        "shed": 1,
+    }
+
+
+def test_template_answer_with_deterministic_summary_stays_in_fast_lane() -> None:
+    agent = _agent(DETERMINISTIC_RESULT)
+    admission = AdmissionController()
+
+    response = agent.answer(TEMPLATE_QUESTION, admission=admission)
+
+    assert response.provenance["lane"] == "fast"
+    assert "queue" in response.timings_ms
+    assert _admitted(admission) == {"fast": 1, "slow": 0}
+    assert agent.ollama.calls == 0
+
+
+def test_answers_needing_ollama_run_in_slow_lane() -> None:
+    agent = _agent(NARRATIVE_RESULT)
+    admission = AdmissionController()
+
+    narrative = agent.answer(TEMPLATE_QUESTION, admission=admission)
+    assert narrative.provenance["lane"] == "slow"
+    assert _admitted(admission) == {"fast": 1, "slow": 1}
+
+    fallback = agent.answer(FALLBACK_QUESTION, admission=admission)
+    assert fallback.sql_source == "llm_fallback"
+    assert fallback.provenance["lane"] == "slow"
+    assert _admitted(admission) == {"fast": 1, "slow": 2}
+
+
+def test_full_slow_lane_sheds_and_releases_the_fast_slot() -> None:
+    agent = _agent(NARRATIVE_RESULT)
+    admission = AdmissionController(fast=LaneLimits(1, 0), slow=LaneLimits(1, 0))
+    admission.lanes["slow"].acquire()
+
+    with pytest.raises(LaneFullError):
+        agent.answer(TEMPLATE_QUESTION, admission=admission)
+
+    assert admission.lanes["fast"].running == 0
+    assert agent.ollama.calls == 0
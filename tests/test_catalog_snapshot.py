@@ -0,0 +1,87 @@
+from agent.catalog_snapshot import load_catalog_snapshot, save_catalog_snapshot
+from agent.entities import Catalog, EntityResolver
+from data_ingestion.data_version import read_data_version, write_data_version
+
+
+def _catalog() -> Catalog:
+    return Catalog(
+        teams=[("1610612747", "Los Angeles Lakers", "LAL")],
+        players=[("2544", "LeBron James")],
+        seasons=["2023-24", "2024-25"],
+    )
+
+
+def test_snapshot_round_trips_prepared_catalog_for_its_version(tmp_path) -> None:
+    path = tmp_path / "catalog.pkl"
+
+    assert save_catalog_snapshot(_catalog(), "v1", path)
+    loaded = load_catalog_snapshot("v1", path)
+
+    assert loaded == _catalog()
+    assert loaded.player_names_lower == ["lebron james"]
+    assert load_catalog_snapshot("v2", path) is None
+
+
+def test_corrupt_or_missing_snapshot_is_ignored(tmp_path) -> None:
+    path = tmp_path / "catalog.pkl"
+    assert load_catalog_snapshot("v1", path) is None
+
+    path.write_bytes(b"not a snapshot")
+    assert load_catalog_snapshot("v1", path) is None
+
+
+def test_data_version_changes_on_every_write(tmp_path) -> None:
+    path = tmp_path / "data_version"
+    assert read_data_version(path) is None
+
+    first = write_data_version(path)
+    second = write_data_version(path)
+
+    assert read_data_version(path) == second
+    assert first != second
+
+
+def test_resolver_reuses_snapshot_until_data_version_changes(tmp_path, monkeypatch) -> None:
+    version_path = tmp_path / "data_version"
+    snapshot_path = tmp_path / "catalog.pkl"
+    write_data_version(version_path)
+    fetches: list[int] = []
+
+    def fetch(self) -> Catalog:
+        fetches.append(1)
+        return _catalog()
+
+    monkeypatch.setattr(EntityResolver, "_fetch_catalog", fetch)
+
+    def resolver() -> EntityResolver:
+        return EntityResolver("postgresql://unused", snapshot_path, version_path)
+
+    resolver().resolve("How many points did LeBron James score?")
+    context = resolver().resolve("How many points did LeBron James score?")
+    assert len(fetches) == 1
+    assert [player.name for player in context.players] == ["LeBron James"]
+
+    write_data_version(version_path)
+    resolver().resolve("How many points did LeBron James score?")
+    assert len(fetches) == 2
+
+
+def test_resolver_without_data_version_keeps_catalog_in_memory_only(tmp_path, monkeypatch) -> None:
+    fetches: list[int] = []
+
+    def fetch(self) -> Catalog:
+        fetches.append(1)
+        return _catalog()
+
+    monkeypatch.setattr(EntityResolver, "_fetch_catalog", fetch)
+    resolver = EntityResolver("postgresql://unused", tmp_path / "catalog.pkl", tmp_path / "data_version")
+
+    resolver.resolve("LeBron James points")
+    resolver.resolve("LeBron James assists")
+    assert len(fetches) == 1
+    assert not (tmp_path / "catalog.pkl").exists()
+
+    resolver.reload()
+    resolver.resolve("LeBron James rebounds")
+    assert len(fetches) == 2
+    assert resolver.catalog_stats()["loads"] == {"database": 2, "memory": 1}
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -39,9 +41,9 @@ def test_chart_command_saves_supported_chart(monkeypatch, tmp_path: Path) -> Non
     )
 
     monkeypatch.setattr("cli.main.load_agent_settings", lambda: object())
-    monkeypatch.setattr("cli.main.AnalyticsAgent", lambda settings: DummyAgent(response))
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: DummyAgent(response))
     monkeypatch.setattr(
-        "cli.main.save_line_chart",
+        "analytics.visualization.save_line_chart",
         lambda df, x, y, title, output_path, kind="line", y_label="Value": output_path,
     )
 
@@ -61,7 +63,7 @@ def test_chart_command_reports_unsupported_shape(monkeypatch) -> None:
     )
 
     monkeypatch.setattr("cli.main.load_agent_settings", lambda: object())
-    monkeypatch.setattr("cli.main.AnalyticsAgent", lambda settings: DummyAgent(response))
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: DummyAgent(response))
 
     result = runner.invoke(app, ["chart", "What is the Lakers record this season?"])
 
@@ -80,9 +82,9 @@ def test_chart_command_reports_missing_plot_dependency(monkeypatch) -> None:
     )
 
     monkeypatch.setattr("cli.main.load_agent_settings", lambda: object())
-    monkeypatch.setattr("cli.main.AnalyticsAgent", lambda settings: DummyAgent(response))
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: DummyAgent(response))
     monkeypatch.setattr(
-        "cli.main.save_line_chart",
+        "analytics.visualization.save_line_chart",
         lambda df, x, y, title, output_path, kind="line", y_label="Value": (_ for _ in ()).throw(
             RuntimeError("Visualization requires matplotlib and valid chart data.")
         ),
@@ -93,3 +95,36 @@ def test_chart_command_reports_missing_plot_dependency(monkeypatch) -> None:
     assert result.exit_code == 1
     assert "Visualization requires matplotlib and valid chart data." in result.stdout
     assert "Install chart dependencies" in result.stdout
+
+
+def test_load_data_forwards_bulk_flag(monkeypatch) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr("cli.main.subprocess.run", lambda command, check: calls.append(command))
+
+    result = runner.invoke(app, ["load-data", "--bulk"])
+
+    assert result.exit_code == 0
+    assert calls == [["python3", "-m", "data_ingestion.run_etl", "--bulk"]]
+
+
+def test_load_data_forwards_season_reloads(monkeypatch) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr("cli.main.subprocess.run", lambda command, check: calls.append(command))
+
+    result = runner.invoke(app, ["load-data", "--season", "2022-23", "--season", "2023-24"])
+
+    assert result.exit_code == 0
+    assert calls == [
+        ["python3", "-m", "data_ingestion.run_etl", "--season", "2022-23", "--season", "2023-24"]
+    ]
+
+
+def test_ask_startup_does_not_import_pandas_or_llm_client() -> None:
+    # A fresh interpreter: this test process has already imported everything.
+    probe = (
+        "import cli.main, agent.pipeline, sys; "
+        "print(' '.join(m for m in ('pandas', 'requests') if m in sys.modules))"
+    )
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+    assert completed.stdout.split() == []
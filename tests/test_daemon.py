@@ -0,0 +1,108 @@
+import socket
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from agent.types import AgentResponse, IntentType
+from cli.daemon import AgentDaemon, request_daemon
+from cli.main import app
+
+
+runner = CliRunner()
+
+
+class FakeAgent:
+    def __init__(self):
+        self.reloads = 0
+
+    def answer(self, question: str) -> AgentResponse:
+        if question == "boom":
+            raise RuntimeError("database unavailable")
+        return AgentResponse(
+            answer=f"answered: {question}",
+            intent=IntentType.PLAYER_PROFILE_SUMMARY,
+            sql="SELECT 1",
+            sql_source="query_spec",
+            columns=["avg_points"],
+            rows=[{"avg_points": Decimal("20.45")}],
+            provenance={"query_family": "player_stat"},
+            timings_ms={"total": 3.0},
+        )
+
+    def cache_stats(self) -> dict[str, object]:
+        return {"catalog": {"players": 2}}
+
+    def reload(self) -> None:
+        self.reloads += 1
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = AgentDaemon(tmp_path / "courtside.sock", FakeAgent())
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_daemon_answers_and_serves_control_ops(daemon) -> None:
+    reply = request_daemon(daemon.socket_path, {"op": "ask", "question": "LeBron points"})
+
+    assert reply["response"]["answer"] == "answered: LeBron points"
+    assert reply["response"]["intent"] == "player_profile_summary"
+    assert reply["response"]["rows"] == [{"avg_points": 20.45}]
+    assert request_daemon(daemon.socket_path, {"op": "stats"}) == {"stats": {"catalog": {"players": 2}}}
+    assert request_daemon(daemon.socket_path, {"op": "reload"}) == {"ok": True}
+    assert daemon.agent.reloads == 1
+
+
+def test_daemon_reports_errors_without_stopping(daemon) -> None:
+    assert request_daemon(daemon.socket_path, {"op": "ask", "question": "boom"}) == {
+        "error": "RuntimeError: database unavailable"
+    }
+    assert "error" in request_daemon(daemon.socket_path, {"op": "drop tables"})
+    assert request_daemon(daemon.socket_path, {"op": "ping"})["ok"] is True
+
+
+def test_second_daemon_refuses_a_live_socket_but_replaces_a_stale_one(daemon, tmp_path) -> None:
+    with pytest.raises(RuntimeError, match="already listening"):
+        AgentDaemon(daemon.socket_path, FakeAgent())
+
+    stale_path = tmp_path / "stale.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(stale_path))
+    stale.close()
+
+    replacement = AgentDaemon(stale_path, FakeAgent())
+    replacement.server_close()
+    assert not stale_path.exists()
+
+
+def test_request_daemon_returns_none_without_daemon(tmp_path) -> None:
+    assert request_daemon(tmp_path / "missing.sock", {"op": "ping"}) is None
+
+
+def test_ask_forwards_to_running_daemon(daemon, monkeypatch) -> None:
+    monkeypatch.setattr("cli.main.load_agent_settings", lambda: SimpleNamespace(daemon_socket=daemon.socket_path))
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: pytest.fail("agent built in process"))
+
+    result = runner.invoke(app, ["ask", "LeBron points"])
+
+    assert result.exit_code == 0
+    assert "answered: LeBron points" in result.stdout
+
+
+def test_ask_falls_back_to_in_process_agent(tmp_path, monkeypatch) -> None:
+    settings = SimpleNamespace(daemon_socket=tmp_path / "missing.sock")
+    monkeypatch.setattr("cli.main.load_agent_settings", lambda: settings)
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: FakeAgent())
+
+    result = runner.invoke(app, ["ask", "LeBron points"])
+
+    assert result.exit_code == 0
+    assert "answered: LeBron points" in result.stdout
@@ -1,4 +1,6 @@
-from agent.entities import Catalog, EntityResolver
+import pytest
+
+from agent.entities import Catalog, EntityResolver, TrigramEntityResolver, build_entity_resolver
 from agent.types import ResolvedEntity
 
 
@@ -93,3 +95,66 @@ def test_resolve_players_skips_fuzzy_boston_match_for_team_comparison() -> None:
     )
 
     assert resolved == []
+
+
+class ScriptedCursor:
+    def __init__(self, log: list[tuple[str, object]], results: list[list[tuple]]):
+        self._log = log
+        self._results = results
+        self._rows: list[tuple] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        self._log.append((sql, params))
+        self._rows = self._results.pop(0)
+
+    def fetchall(self):
+        return self._rows
+
+
+class ScriptedConnection:
+    def __init__(self, results: list[list[tuple]]):
+        self.log: list[tuple[str, object]] = []
+        self._results = results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def cursor(self) -> ScriptedCursor:
+        return ScriptedCursor(self.log, self._results)
+
+
+def test_trigram_resolver_scores_database_candidates_like_catalog(monkeypatch) -> None:
+    conn = ScriptedConnection(
+        [
+            [("0.5",)],
+            [("1610612747", "Los Angeles Lakers", "LAL")],
+            [("2544", "LeBron James")],
+            [("2023-24",), ("2024-25",)],
+        ]
+    )
+    monkeypatch.setattr("agent.entities.psycopg.connect", lambda url: conn)
+    resolver = build_entity_resolver("postgresql://unused", "trigram")
+
+    context = resolver.resolve("How many points did lebron james score for LAL in 2024-25?")
+
+    assert isinstance(resolver, TrigramEntityResolver)
+    assert "player_name <%% %s" in conn.log[2][0]
+    assert conn.log[2][1] == ("How many points did lebron james score for LAL in 2024-25?",)
+    assert "lal" in conn.log[1][1][1]
+    assert [team.name for team in context.teams] == ["Los Angeles Lakers"]
+    assert [player.name for player in context.players] == ["LeBron James"]
+    assert context.seasons == ["2024-25"]
+
+
+def test_build_entity_resolver_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unknown entity resolver"):
+        build_entity_resolver("postgresql://unused", "elastic")
@@ -0,0 +1,50 @@
+from data_ingestion.facts import refresh_player_game_facts
+
+
+class RecordingCursor:
+    def __init__(self, log: list[tuple[str, object]]):
+        self._log = log
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        self._log.append((sql, params))
+        self.rowcount = 42
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.log: list[tuple[str, object]] = []
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self.log)
+
+
+def test_full_refresh_truncates_and_rebuilds_every_season() -> None:
+    conn = RecordingConnection()
+
+    written = refresh_player_game_facts(conn)
+
+    assert written == 42
+    assert conn.log[0] == ("TRUNCATE player_game_facts", None)
+    insert_sql, params = conn.log[1]
+    assert insert_sql.startswith("INSERT INTO player_game_facts (game_date, game_key, player_key, ")
+    assert "WHERE" not in insert_sql
+    assert params is None
+
+
+def test_season_refresh_replaces_only_those_seasons() -> None:
+    conn = RecordingConnection()
+
+    refresh_player_game_facts(conn, [7])
+
+    assert conn.log[0] == ("DELETE FROM player_game_facts WHERE season_id = ANY(%s)", ([7],))
+    insert_sql, params = conn.log[1]
+    assert "WHERE pgs.season_id = ANY(%s)" in insert_sql
+    assert "ORDER BY pgs.player_key, pgs.season_id" in insert_sql
+    assert params == ([7],)
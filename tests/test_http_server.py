@@ -0,0 +1,178 @@
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent.admission import AdmissionController, LaneLimits
+from agent.types import AgentResponse, IntentType
+from cli.http_server import AgentHTTPServer
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.healthy = True
+
+    def run(self, sql, params):
+        if not self.healthy:
+            raise OSError("connection refused")
+
+
+class FakeAgent:
+    def __init__(self, delay: float = 0.0):
+        self.executor = FakeExecutor()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def answer(self, question: str, admission: AdmissionController | None = None) -> AgentResponse:
+        if question == "boom":
+            raise RuntimeError("planner exploded")
+        # Questions starting with "llm" stand in for answers that need Ollama.
+        lane = admission.lanes["slow" if question.startswith("llm") else "fast"]
+        lane.acquire()
+        try:
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(self.delay)
+            with self._lock:
+                self.active -= 1
+        finally:
+            lane.release()
+        return AgentResponse(
+            answer=f"answered: {question}",
+            intent=IntentType.TEAM_RECORD_SUMMARY,
+            sql="SELECT 1",
+            sql_source="query_spec",
+            columns=["wins"],
+            rows=[{"wins": 47}],
+            provenance={},
+        )
+
+    def cache_stats(self):
+        return {"catalog": {"players": 0}}
+
+    def reload(self) -> None:
+        return None
+
+
+def _start(
+    agent: FakeAgent,
+    admission: AdmissionController | None = None,
+) -> tuple[AgentHTTPServer, threading.Thread]:
+    server = AgentHTTPServer(("127.0.0.1", 0), agent, admission)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    return server, thread
+
+
+@pytest.fixture
+def served():
+    agent = FakeAgent()
+    server, thread = _start(agent)
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _request(server: AgentHTTPServer, method: str, path: str, body: str | None = None):
+    return _request_with_headers(server, method, path, body)[:2]
+
+
+def _request_with_headers(server: AgentHTTPServer, method: str, path: str, body: str | None = None):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+    conn.request(method, path, body)
+    response = conn.getresponse()
+    payload = json.loads(response.read())
+    conn.close()
+    return response.status, payload, dict(response.getheaders())
+
+
+def test_ask_returns_agent_response_fields(served) -> None:
+    status, payload = _request(served, "POST", "/ask", json.dumps({"question": "Lakers record"}))
+
+    assert status == 200
+    assert payload["answer"] == "answered: Lakers record"
+    assert payload["intent"] == "team_record_summary"
+    assert payload["rows"] == [{"wins": 47}]
+
+
+def test_bad_requests_and_agent_errors_map_to_status_codes(served) -> None:
+    assert _request(served, "POST", "/ask", "not json")[0] == 400
+    assert _request(served, "POST", "/ask", json.dumps({"question": "  "}))[0] == 400
+    assert _request(served, "GET", "/missing")[0] == 404
+    assert _request(served, "POST", "/ask", json.dumps({"question": "boom"})) == (
+        500,
+        {"error": "RuntimeError: planner exploded"},
+    )
+
+
+def test_health_reports_database_reachability(served) -> None:
+    assert _request(served, "GET", "/health")[1]["status"] == "ok"
+
+    served.agent.executor.healthy = False
+    status, payload = _request(served, "GET", "/health")
+
+    assert status == 503
+    assert payload["status"] == "unavailable"
+
+
+def test_requests_run_concurrently_on_worker_threads() -> None:
+    agent = FakeAgent(delay=0.1)
+    server, thread = _start(agent, AdmissionController(LaneLimits(4, 4), LaneLimits(1, 0)))
+    try:
+        body = json.dumps({"question": "Lakers record"})
+        with ThreadPoolExecutor(8) as pool:
+            statuses = list(pool.map(lambda _: _request(server, "POST", "/ask", body)[0], range(8)))
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert statuses == [200] * 8
+    assert 1 < agent.peak <= 4
+
+
+def test_shutdown_drains_in_flight_requests() -> None:
+    agent = FakeAgent(delay=0.3)
+    server, thread = _start(agent)
+    with ThreadPoolExecutor(1) as pool:
+        pending = pool.submit(_request, server, "POST", "/ask", json.dumps({"question": "slow"}))
+        while agent.active == 0:
+            time.sleep(0.01)
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+        assert pending.result()[0] == 200
+
+
+def test_full_slow_lane_sheds_while_fast_lane_answers() -> None:
+    agent = FakeAgent(delay=0.3)
+    server, thread = _start(agent, AdmissionController(LaneLimits(2, 2), LaneLimits(1, 1)))
+    slow = json.dumps({"question": "llm what is interesting"})
+    try:
+        with ThreadPoolExecutor(4) as pool:
+            pending = [pool.submit(_request_with_headers, server, "POST", "/ask", slow) for _ in range(4)]
+            while server.admission.lanes["slow"].shed < 2:
+                time.sleep(0.01)
+            fast_status = _request(server, "POST", "/ask", json.dumps({"question": "Lakers record"}))[0]
+            replies = [future.result() for future in pending]
+        stats = _request(server, "GET", "/stats")[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert fast_status == 200
+    assert sorted(status for status, _, _ in replies) == [200, 200, 503, 503]
+    shed = [(payload, headers) for status, payload, headers in replies if status == 503]
+    assert all(payload["lane"] == "slow" and "retry later" in payload["error"] for payload, _ in shed)
+    assert all(headers["Retry-After"] == "5" for _, headers in shed)
+    assert stats["admission"]["slow"]["shed"] == 2
+    assert stats["admission"]["fast"]["admitted"] == 1
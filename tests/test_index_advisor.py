@@ -0,0 +1,75 @@
+from analytics.index_advisor import (
+    IndexCandidate,
+    SchemaCatalog,
+    propose_indexes,
+    render_index_report,
+    summarize_plans,
+)
+from analytics.query_profile import QueryProfile, WorkloadQuery
+
+
+CATALOG = SchemaCatalog(
+    partition_parents={"games_2023_24": "games"},
+    table_columns={
+        "games": {"game_key", "season_id", "game_type", "home_team_key", "home_points"},
+        "player_game_facts": {"player_key", "season_id", "game_type", "minutes"},
+    },
+    index_keys={"player_game_facts": [("player_key", "season_id", "game_type")]},
+)
+
+
+def _seq_scan(relation: str, filter_text: str, rows: int, removed: int, ms: float) -> dict:
+    return {
+        "Node Type": "Seq Scan",
+        "Relation Name": relation,
+        "Filter": filter_text,
+        "Actual Rows": rows,
+        "Rows Removed by Filter": removed,
+        "Actual Loops": 1,
+        "Actual Total Time": ms,
+    }
+
+
+def _profile(question_id: int, family: str, *scans: dict) -> QueryProfile:
+    plan = {"Node Type": "Hash Join", "Plans": list(scans)}
+    query = WorkloadQuery(question_id, "q", family, "SELECT 1", ())
+    return QueryProfile(query, execution_ms=10.0, planning_ms=1.0, shared_hit_blocks=0, shared_read_blocks=0, plan=plan)
+
+
+def test_propose_indexes_maps_partitions_to_parents_and_orders_equality_columns_first() -> None:
+    scan = _seq_scan(
+        "games_2023_24",
+        "(((home_points)::numeric > '100'::numeric) AND (game_type = 'regular'::text))",
+        rows=5_000,
+        removed=20_000,
+        ms=12.5,
+    )
+    profiles = [_profile(1, "team_trend", scan), _profile(2, "team_stat", scan)]
+
+    (candidate,) = propose_indexes(profiles, CATALOG)
+
+    assert candidate.definition == "CREATE INDEX ON games (game_type, home_points)"
+    assert candidate.question_ids == {1, 2}
+    assert candidate.families == {"team_trend", "team_stat"}
+    assert candidate.scan_ms == 25.0
+
+
+def test_propose_indexes_skips_small_and_already_indexed_scans() -> None:
+    profiles = [
+        _profile(1, "team_stat", _seq_scan("games", "(game_type = 'regular'::text)", 50, 100, 0.1)),
+        _profile(2, "player_stat", _seq_scan("player_game_facts", "(player_key = $0)", 40, 50_000, 30.0)),
+    ]
+
+    assert propose_indexes(profiles, CATALOG) == []
+
+
+def test_report_ranks_tested_candidates_by_measured_saving() -> None:
+    profiles = [_profile(1, "player_ranking", _seq_scan("player_game_facts", "(minutes IS NOT NULL)", 1, 1, 1.0))]
+    findings = summarize_plans(profiles, CATALOG)
+    candidate = IndexCandidate("player_game_facts", ("game_type",), {1}, {"player_ranking"}, 900.0, -12.0)
+
+    report = render_index_report(findings, [candidate], skipped_questions=2)
+
+    assert "| player_ranking | 1 | 11.0 | player_game_facts x1 | 0 | Hash Join x1 |" in report
+    assert "| 1 | `CREATE INDEX ON player_game_facts (game_type)` | player_ranking | 1 | 900.0 | -12.0 |" in report
+    assert "2 questions could not be planned" in report
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from data_ingestion import index_lifecycle
+from data_ingestion.index_lifecycle import SecondaryIndex, rebuild_indexes
+
+
+class RecordingCursor:
+    def __init__(self, log: list[tuple[str, object]]):
+        self._log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        if "fail" in sql:
+            raise RuntimeError("boom")
+        self._log.append((sql, params))
+
+
+class RecordingConnection:
+    log: list[tuple[str, object]] = []
+    lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        self._log: list[tuple[str, object]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        with self.lock:
+            RecordingConnection.log.append(tuple(self._log))
+        return None
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self._log)
+
+
+INDEXES = [
+    SecondaryIndex("idx_a", "player_game_stats", "CREATE INDEX idx_a ON player_game_stats (team_id)"),
+    SecondaryIndex("idx_b", "player_game_stats", "CREATE INDEX idx_b ON player_game_stats (points)"),
+]
+
+
+def test_rebuild_indexes_builds_each_index_on_its_own_session(monkeypatch) -> None:
+    RecordingConnection.log = []
+    monkeypatch.setattr(index_lifecycle.psycopg, "connect", RecordingConnection)
+
+    rebuild_indexes("postgresql://unused", INDEXES, maintenance_work_mem="1GB", workers=2)
+
+    sessions = sorted(RecordingConnection.log, key=lambda session: session[1][0])
+    assert [session[1][0] for session in sessions] == [index.definition for index in INDEXES]
+    assert all(session[0][1] == ("1GB",) for session in sessions)
+
+
+def test_rebuild_indexes_reports_failed_builds(monkeypatch) -> None:
+    monkeypatch.setattr(index_lifecycle.psycopg, "connect", RecordingConnection)
+    broken = SecondaryIndex("idx_fail", "games", "CREATE INDEX idx_fail ON games (game_date)")
+
+    with pytest.raises(RuntimeError, match="idx_fail"):
+        rebuild_indexes("postgresql://unused", [INDEXES[0], broken])
+
+
+class FetchingConnection:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def cursor(self):
+        rows = self._rows
+
+        class Cursor(RecordingCursor):
+            def fetchall(self):
+                return rows
+
+        return Cursor([])
+
+
+def test_list_secondary_indexes_rebuilds_partitioned_indexes_on_every_partition() -> None:
+    definition = "CREATE INDEX idx_points ON ONLY public.player_game_stats USING btree (points)"
+    conn = FetchingConnection([("idx_points", "player_game_stats", definition)])
+
+    (index,) = index_lifecycle.list_secondary_indexes(conn, ["player_game_stats"])
+
+    assert index.definition == "CREATE INDEX idx_points ON public.player_game_stats USING btree (points)"
+
+
+def test_analyze_tables_vacuums_fact_table_for_index_only_scans() -> None:
+    conn = RecordingConnection()
+
+    index_lifecycle.analyze_tables(conn, ["teams", "player_game_facts"])
+
+    assert [sql for sql, _ in conn._log] == ['ANALYZE "teams"', 'VACUUM (ANALYZE) "player_game_facts"']
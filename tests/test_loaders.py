@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pandas as pd
+
+from data_ingestion.loaders import ETLLoader
+
+
+def _loader() -> ETLLoader:
+    return ETLLoader(database_url="", raw_data_dir=Path("."))
+
+
+def _games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "game_id": [1, 2],
+            "season_label": ["2023-24", "2023-24"],
+            "game_date": ["2023-10-25 19:30:00", "2023-11-15"],
+            "home_team_id": [10, 20],
+            "away_team_id": [20, 10],
+            "home_points": pd.array([110, 118], dtype="Int16"),
+            "away_points": pd.array([115, 100], dtype="Int16"),
+        }
+    )
+
+
+def test_prepare_games_infers_winner_from_points() -> None:
+    games = _loader()._prepare_games(_games())
+
+    assert games["winner_team_id"].tolist() == ["20", "20"]
+    assert games["game_date"].tolist() == ["2023-10-25", "2023-11-15"]
+
+
+def test_prepare_player_stats_resolves_team_from_name_then_home_flag() -> None:
+    loader = _loader()
+    games = loader._prepare_games(_games())
+    teams = pd.DataFrame(
+        {
+            "team_id": ["10", "20"],
+            "team_name": ["Hawks", "Celtics"],
+            "city": ["Atlanta", "Boston"],
+        }
+    )
+    stats = pd.DataFrame(
+        {
+            "game_id": pd.Categorical(["1", "1", "2", "2"]),
+            "player_id": pd.Categorical(["a", "b", "c", "d"]),
+            "player_team_name": pd.Categorical(["Hawks ", "Unknown", None, "Unknown"]),
+            "player_team_city": pd.Categorical(["atlanta", "Nowhere", None, None]),
+            "is_home": pd.array([1, 0, 1, None], dtype="Int16"),
+            "points": pd.array([20, 10, 5, 7], dtype="Int16"),
+        }
+    )
+
+    prepared = loader._prepare_player_stats(stats, teams, games)
+
+    assert prepared["player_id"].astype(str).tolist() == ["a", "b", "c"]
+    assert prepared["team_id"].astype(str).tolist() == ["10", "20", "20"]
+
+
+def test_iter_sql_rows_emits_python_values_with_none_for_missing() -> None:
+    frame = pd.DataFrame(
+        {
+            "team_id": pd.Categorical(["10", None]),
+            "minutes": pd.array([30.5, None], dtype="float32"),
+            "points": pd.array([12, None], dtype="Int16"),
+            "name": pd.array(["A", None], dtype="string"),
+        }
+    )
+
+    rows = list(_loader()._iter_sql_rows(frame))
+
+    assert rows == [("10", 30.5, 12, "A"), (None, None, None, None)]
+    assert type(rows[0][2]) is int
+
+
+def test_map_keys_resolves_categorical_ids_and_leaves_unknown_missing() -> None:
+    ids = pd.Series(pd.Categorical(["10", "20", "99", None, "10"]))
+
+    keys = _loader()._map_keys(ids, {"10": 1, "20": 2})
+
+    assert str(keys.dtype) == "Int32"
+    assert keys.tolist() == [1, 2, pd.NA, pd.NA, 1]
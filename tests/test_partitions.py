@@ -0,0 +1,66 @@
+from data_ingestion.partitions import partition_name, swap_season_partitions
+
+
+class ScriptedCursor:
+    def __init__(self, log: list[str], existing: set[str], indexes: dict[str, list[str]]):
+        self._log = log
+        self._existing = existing
+        self._indexes = indexes
+        self._result: list[tuple[object, ...]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        if sql.startswith("SELECT to_regclass"):
+            self._result = [(params[0] if params[0] in self._existing else None,)]
+        elif sql.startswith("SELECT indexname"):
+            self._result = [(name,) for name in self._indexes.get(params[0], [])]
+        else:
+            self._log.append(sql)
+
+    def fetchone(self):
+        return self._result[0]
+
+    def fetchall(self):
+        return self._result
+
+
+class ScriptedConnection:
+    def __init__(self, existing: set[str], indexes: dict[str, list[str]]):
+        self.log: list[str] = []
+        self._existing = existing
+        self._indexes = indexes
+
+    def cursor(self) -> ScriptedCursor:
+        return ScriptedCursor(self.log, self._existing, self._indexes)
+
+
+def test_partition_name_sanitizes_season_label() -> None:
+    assert partition_name("games", "2023-24") == "games_2023_24"
+    assert partition_name("player_game_stats", " 1999 ") == "player_game_stats_1999"
+
+
+def test_swap_detaches_children_first_and_attaches_parents_first() -> None:
+    conn = ScriptedConnection(
+        existing={"games_2023_24", "player_game_stats_2023_24"},
+        indexes={"games_2023_24": ["games_2023_24_staging_pkey", "games_2023_24_staging_game_id_season_id_key"]},
+    )
+
+    swap_season_partitions(conn, 7, "2023-24")
+
+    assert conn.log == [
+        'ALTER TABLE player_game_stats DETACH PARTITION "player_game_stats_2023_24"',
+        'DROP TABLE "player_game_stats_2023_24"',
+        'ALTER TABLE games DETACH PARTITION "games_2023_24"',
+        'DROP TABLE "games_2023_24"',
+        'ALTER TABLE "games_2023_24_staging" RENAME TO "games_2023_24"',
+        'ALTER INDEX "games_2023_24_staging_pkey" RENAME TO "games_2023_24_pkey"',
+        'ALTER INDEX "games_2023_24_staging_game_id_season_id_key" RENAME TO "games_2023_24_game_id_season_id_key"',
+        'ALTER TABLE games ATTACH PARTITION "games_2023_24" FOR VALUES IN (7)',
+        'ALTER TABLE "player_game_stats_2023_24_staging" RENAME TO "player_game_stats_2023_24"',
+        'ALTER TABLE player_game_stats ATTACH PARTITION "player_game_stats_2023_24" FOR VALUES IN (7)',
+    ]
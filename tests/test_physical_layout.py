@@ -0,0 +1,58 @@
+from data_ingestion.physical_layout import optimize_physical_layout
+
+
+class ScriptedCursor:
+    def __init__(self, log: list[str], correlations: dict[tuple[str, str], float]):
+        self._log = log
+        self._correlations = correlations
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        if "FROM pg_stats" in sql:
+            correlation = self._correlations.get(params)
+            self._row = None if correlation is None else (correlation,)
+        else:
+            self._log.append(sql)
+
+    def fetchone(self):
+        return self._row
+
+
+class ScriptedConnection:
+    def __init__(self, correlations: dict[tuple[str, str], float]):
+        self.log: list[str] = []
+        self._correlations = correlations
+
+    def cursor(self) -> ScriptedCursor:
+        return ScriptedCursor(self.log, self._correlations)
+
+
+def test_optimize_clusters_first_and_only_brin_indexes_correlated_columns() -> None:
+    conn = ScriptedConnection({("games", "game_date"): 0.99, ("player_game_facts", "game_date"): 0.05})
+
+    actions = optimize_physical_layout(conn)
+
+    assert conn.log[:2] == [
+        'CLUSTER "player_game_stats" USING "idx_player_stats_player"',
+        'CLUSTER "player_game_facts" USING "idx_player_facts_player"',
+    ]
+    assert 'CREATE INDEX IF NOT EXISTS "idx_games_date_brin" ON "games" USING brin ("game_date")' in conn.log
+    assert 'DROP INDEX IF EXISTS "idx_player_facts_date_brin"' in conn.log
+    assert [(action.step, action.target) for action in actions][-2:] == [
+        ("brin index", "idx_games_date_brin"),
+        ("skip brin", "player_game_facts.game_date"),
+    ]
+
+
+def test_optimize_can_skip_clustering() -> None:
+    conn = ScriptedConnection({})
+
+    optimize_physical_layout(conn, cluster=False)
+
+    assert not any(sql.startswith("CLUSTER") for sql in conn.log)
@@ -0,0 +1,93 @@
+import asyncio
+
+from agent.config import AgentSettings
+from agent.entities import Catalog, EntityResolver
+from agent.pipeline import AnalyticsAgent
+from agent.types import QueryResult
+
+
+class FakeExecutor:
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, tuple]] = []
+
+    def run(self, sql: str, params: tuple) -> QueryResult:
+        self.queries.append((sql, params))
+        return QueryResult(columns=["team_name"], rows=[{"team_name": "Los Angeles Lakers"}])
+
+    async def run_async(self, sql: str, params: tuple) -> QueryResult:
+        await asyncio.sleep(0)
+        return self.run(sql, params)
+
+
+class FakeOllama:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def chat(self, model: str, messages: list[dict[str, str]], temperature: float = 0.0) -> str:
+        if model == "sql-model":
+            return "```sql\nSELECT team_name FROM teams ORDER BY team_name\n```"
+        return "The Lakers lead the list."
+
+    async def chat_async(self, model: str, messages: list[dict[str, str]], temperature: float = 0.0) -> str:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.chat(model, messages, temperature)
+
+
+def _agent() -> AnalyticsAgent:
+    agent = AnalyticsAgent(
+        AgentSettings(
+            database_url="postgresql://unused",
+            ollama_base_url="http://unused",
+            ollama_sql_model="sql-model",
+            ollama_summary_model="summary-model",
+            sql_max_rows=50,
+        )
+    )
+    agent.resolver = EntityResolver("postgresql://unused", snapshot_path=None)
+    agent.resolver._catalog = Catalog(
+        teams=[(1, "Los Angeles Lakers", "LAL")],
+        players=[(1, "LeBron James")],
+        seasons=["2023-24"],
+    )
+    agent.executor = FakeExecutor()
+    agent.ollama = FakeOllama()
+    agent._schema_context = "Schema context:\n- teams: team_name (text)"
+    return agent
+
+
+def _comparable(response) -> tuple:
+    return (response.answer, response.sql, response.sql_source, response.rows, response.provenance)
+
+
+def test_answer_async_matches_answer_for_template_and_fallback_questions() -> None:
+    agent = _agent()
+    questions = [
+        "What was the average points of LeBron James in 2023-24?",
+        "Tell me something interesting about the league.",
+    ]
+
+    sync_responses = [agent.answer(question) for question in questions]
+    async_responses = [asyncio.run(agent.answer_async(question)) for question in questions]
+
+    assert [response.sql_source for response in async_responses] == ["query_spec", "llm_fallback"]
+    assert [_comparable(r) for r in async_responses] == [_comparable(r) for r in sync_responses]
+    assert {"resolve", "plan", "validate", "execute", "summarize", "total"} <= set(async_responses[0].timings_ms)
+    assert "llm_sql" in async_responses[1].timings_ms
+
+
+def test_answer_async_overlaps_llm_waits_across_questions() -> None:
+    agent = _agent()
+
+    async def ask_many() -> list:
+        return await asyncio.gather(
+            *(agent.answer_async("Tell me something interesting about the league.") for _ in range(20))
+        )
+
+    responses = asyncio.run(ask_many())
+
+    assert all(response.sql_source == "llm_fallback" for response in responses)
+    assert agent.ollama.peak_in_flight == 20
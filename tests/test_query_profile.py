@@ -0,0 +1,47 @@
+from agent.query_spec import QueryFamily, QuerySpec
+from agent.sql_validator import SQLGuardrails
+from agent.types import IntentType, ResolvedContext, SQLPlan
+from analytics.query_profile import QueryProfile, WorkloadQuery, plan_workload, summarize_by_family
+
+
+class PlanningAgent:
+    guardrails = SQLGuardrails(allowed_tables={"teams"}, max_rows=50)
+
+    def __init__(self, plans: dict[str, SQLPlan | None]):
+        self._plans = plans
+
+    def plan(self, question: str):
+        spec = QuerySpec(family=QueryFamily.TEAM_STAT, intent=IntentType.TEAM_RECORD_SUMMARY)
+        return ResolvedContext(), spec, self._plans[question]
+
+
+def test_plan_workload_skips_questions_without_a_safe_deterministic_plan() -> None:
+    agent = PlanningAgent(
+        {
+            "record": SQLPlan(sql="SELECT * FROM teams WHERE team_id = %s", params=("1",), source="query_spec"),
+            "needs llm": None,
+            "unsafe": SQLPlan(sql="SELECT * FROM secrets", params=(), source="query_spec"),
+        }
+    )
+    questions = [{"id": 1, "question": "record"}, {"id": 2, "question": "needs llm"}, {"id": 3, "question": "unsafe"}]
+
+    (query,) = plan_workload(agent, questions)
+
+    assert query.question_id == 1
+    assert query.family == "team_stat"
+    assert query.sql.endswith("LIMIT 50;")
+    assert query.params == ("1",)
+
+
+def test_summarize_by_family_totals_latency_and_buffers() -> None:
+    query = WorkloadQuery(1, "q", "team_stat", "SELECT 1", ())
+    profiles = [
+        QueryProfile(query, execution_ms=2.0, planning_ms=0.5, shared_hit_blocks=10, shared_read_blocks=1, plan={}),
+        QueryProfile(query, execution_ms=1.0, planning_ms=0.5, shared_hit_blocks=5, shared_read_blocks=0, plan={}),
+    ]
+
+    summary = summarize_by_family(profiles)["team_stat"]
+
+    assert summary.queries == 2
+    assert summary.total_ms == 4.0
+    assert (summary.shared_hit_blocks, summary.shared_read_blocks) == (15, 1)
@@ -0,0 +1,152 @@
+import gzip
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data_ingestion.file_discovery import find_existing_file
+from data_ingestion.profile_source import profile_raw_source
+from data_ingestion.readers import count_csv_rows, count_dataset_rows, read_csv_source, read_dataset
+from data_ingestion.source_cache import SourceCache
+
+
+SAMPLE_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "sample"
+
+
+def _gzip_copy(src: Path, dst: Path) -> Path:
+    with src.open("rb") as raw, gzip.open(dst, "wb") as out:
+        shutil.copyfileobj(raw, out)
+    return dst
+
+
+def test_find_existing_file_accepts_compressed_candidates(tmp_path: Path) -> None:
+    _gzip_copy(SAMPLE_DIR / "games.csv", tmp_path / "Games.csv.gz")
+
+    found = find_existing_file(tmp_path, "games")
+
+    assert found == tmp_path / "Games.csv.gz"
+
+
+def test_find_existing_file_prefers_plain_file(tmp_path: Path) -> None:
+    shutil.copy2(SAMPLE_DIR / "games.csv", tmp_path / "games.csv")
+    _gzip_copy(SAMPLE_DIR / "games.csv", tmp_path / "games.csv.gz")
+
+    assert find_existing_file(tmp_path, "games") == tmp_path / "games.csv"
+
+
+def test_gzip_source_matches_plain_source(tmp_path: Path) -> None:
+    plain = SAMPLE_DIR / "player_game_stats.csv"
+    compressed = _gzip_copy(plain, tmp_path / "player_game_stats.csv.gz")
+
+    assert read_csv_source(compressed).equals(read_csv_source(plain))
+    assert count_csv_rows(compressed) == 6
+
+
+def test_zstd_source_matches_plain_source(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    plain = SAMPLE_DIR / "games.csv"
+    compressed = tmp_path / "games.csv.zst"
+    compressed.write_bytes(zstandard.ZstdCompressor().compress(plain.read_bytes()))
+
+    assert read_csv_source(compressed).equals(read_csv_source(plain))
+
+
+def test_profile_source_reads_compressed_inputs(tmp_path: Path) -> None:
+    _gzip_copy(SAMPLE_DIR / "games.csv", tmp_path / "Games.csv.gz")
+    _gzip_copy(SAMPLE_DIR / "player_game_stats.csv", tmp_path / "PlayerStatistics.csv.gz")
+
+    profile = profile_raw_source(tmp_path)
+
+    assert profile.games_rows == 2
+    assert profile.player_game_stats_rows == 6
+    assert profile.games_file == "Games.csv.gz"
+
+
+def test_read_dataset_reads_parquet_input_with_aliases(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    frame = read_csv_source(SAMPLE_DIR / "games.csv").rename(columns={"game_date": "gameDateTimeEst"})
+    frame.to_parquet(tmp_path / "Games.parquet", index=False)
+
+    path = find_existing_file(tmp_path, "games")
+    games = read_dataset(path, "games", columns=["game_id", "game_date"])
+
+    assert path == tmp_path / "Games.parquet"
+    assert list(games.columns) == ["game_id", "game_date"]
+    assert games["game_date"].tolist() == ["2023-10-25", "2023-11-15"]
+
+
+def test_source_cache_serves_later_reads(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "games.csv"
+    shutil.copy2(SAMPLE_DIR / "games.csv", source)
+    cache = SourceCache(tmp_path / "cache")
+
+    first = read_dataset(source, "games", cache=cache)
+    cached_path = cache.cache_path(source, "games")
+    cached = cache.load(source, "games", columns=["game_id", "home_points"])
+
+    assert cached_path.exists()
+    assert list(cached.columns) == ["game_id", "home_points"]
+    assert cached["home_points"].tolist() == first["home_points"].tolist()
+    assert count_dataset_rows(source, "games", cache=cache) == 2
+
+
+def test_source_cache_is_invalidated_when_source_changes(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "games.csv"
+    shutil.copy2(SAMPLE_DIR / "games.csv", source)
+    cache = SourceCache(tmp_path / "cache")
+    read_dataset(source, "games", cache=cache)
+    stale_path = cache.cache_path(source, "games")
+
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write("G3,2023-24,2023-12-01,regular,ATL,BOS,100,99,ATL\n")
+
+    assert cache.load(source, "games") is None
+    assert len(read_dataset(source, "games", cache=cache)) == 3
+    assert not stale_path.exists()
+
+
+def test_read_dataset_parses_only_requested_columns_with_compact_dtypes() -> None:
+    stats = read_dataset(
+        SAMPLE_DIR / "player_game_stats.csv",
+        "player_game_stats",
+        columns=["player_id", "team_id", "minutes", "points"],
+    )
+
+    assert list(stats.columns) == ["player_id", "team_id", "minutes", "points"]
+    assert isinstance(stats["team_id"].dtype, pd.CategoricalDtype)
+    assert str(stats["points"].dtype) == "Int16"
+    assert str(stats["minutes"].dtype) == "float32"
+    assert stats["points"].tolist()[:2] == [28, 31]
+
+
+def test_read_dataset_keeps_integer_spelling_of_ids(tmp_path: Path) -> None:
+    source = tmp_path / "PlayerStatistics.csv"
+    source.write_text(
+        "gameId,personId,playerteamName,numMinutes,points\n"
+        "0022300001,1629027,Hawks,36.5,28.0\n"
+        "22300001,,Hawks,DNP,\n",
+        encoding="utf-8",
+    )
+
+    stats = read_dataset(source, "player_game_stats")
+
+    assert stats["game_id"].astype(str).tolist() == ["22300001", "22300001"]
+    assert stats["player_id"].astype(object).tolist()[0] == "1629027"
+    assert stats["player_id"].isna().tolist() == [False, True]
+    assert stats["minutes"].isna().tolist() == [False, True]
+    assert stats["points"].astype(object).tolist() == [28, pd.NA]
+
+
+def test_source_cache_round_trips_compact_dtypes(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "player_game_stats.csv"
+    shutil.copy2(SAMPLE_DIR / "player_game_stats.csv", source)
+    cache = SourceCache(tmp_path / "cache")
+
+    first = read_dataset(source, "player_game_stats", cache=cache)
+    cached = read_dataset(source, "player_game_stats", cache=cache)
+
+    assert cached.dtypes.astype(str).tolist() == first.dtypes.astype(str).tolist()
@@ -0,0 +1,76 @@
+from typer.testing import CliRunner
+
+from agent.types import AgentResponse, IntentType
+from cli.main import app
+from cli.shell import format_timings
+
+
+runner = CliRunner()
+
+
+class WarmAgent:
+    def __init__(self):
+        self.questions: list[str] = []
+        self.reloads = 0
+        self.warmed = False
+        self.closed = False
+
+    def warm_up(self) -> None:
+        self.warmed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def reload(self) -> None:
+        self.reloads += 1
+
+    def cache_stats(self) -> dict[str, object]:
+        return {"catalog": {"players": 4500}}
+
+    def answer(self, question: str) -> AgentResponse:
+        self.questions.append(question)
+        return AgentResponse(
+            answer=f"answer {len(self.questions)}",
+            intent=IntentType.PLAYER_PROFILE_SUMMARY,
+            sql="SELECT 1",
+            sql_source="query_spec",
+            columns=[],
+            rows=[],
+            provenance={},
+            timings_ms={"resolve": 1.0, "execute": 2.5, "total": 4.0},
+        )
+
+
+def test_shell_answers_with_one_warm_agent_and_handles_commands(monkeypatch) -> None:
+    agent = WarmAgent()
+    monkeypatch.setattr("cli.main.load_agent_settings", lambda: object())
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: agent)
+
+    result = runner.invoke(
+        app,
+        ["shell"],
+        input="Who led the league in points?\n:stats\n:reload\n\nLakers record in 2023-24?\n:quit\n",
+    )
+
+    assert result.exit_code == 0
+    assert agent.warmed and agent.closed
+    assert agent.questions == ["Who led the league in points?", "Lakers record in 2023-24?"]
+    assert agent.reloads == 1
+    assert '"players": 4500' in result.stdout
+    assert "answer 2" in result.stdout
+    assert "resolve 1.0 | execute 2.5 | total 4.0 ms" in result.stdout
+
+
+def test_shell_exits_on_end_of_input(monkeypatch) -> None:
+    agent = WarmAgent()
+    monkeypatch.setattr("cli.main.load_agent_settings", lambda: object())
+    monkeypatch.setattr("agent.pipeline.AnalyticsAgent", lambda settings: agent)
+
+    result = runner.invoke(app, ["shell"], input="Who led the league in points?\n")
+
+    assert result.exit_code == 0
+    assert agent.closed
+
+
+def test_format_timings_skips_steps_that_did_not_run() -> None:
+    assert format_timings({"resolve": 0.94, "plan": 0.2, "total": 1.5}) == "resolve 0.9 | plan 0.2 | total 1.5 ms"
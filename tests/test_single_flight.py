@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent.config import AgentSettings
+from agent.entities import Catalog, EntityResolver
+from agent.ollama_client import OllamaClient
+from agent.pipeline import AnalyticsAgent
+from agent.single_flight import SingleFlight
+from agent.types import QueryResult
+
+
+class SlowCounter:
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> int:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return 42
+
+
+def _concurrently(fn, count: int) -> list:
+    with ThreadPoolExecutor(count) as pool:
+        return list(pool.map(lambda _: fn(), range(count)))
+
+
+def test_concurrent_calls_with_one_key_share_one_execution() -> None:
+    flights = SingleFlight()
+    work = SlowCounter()
+
+    results = _concurrently(lambda: flights.run("top scorers", work), 6)
+
+    assert work.calls == 1
+    assert sorted(results) == [(42, False)] + [(42, True)] * 5
+    assert flights.stats() == {"executed": 1, "shared": 5}
+    # Nothing is kept once the call finished.
+    assert flights.run("top scorers", work) == (42, False)
+    assert work.calls == 2
+
+
+def test_different_keys_run_separately_and_errors_reach_every_waiter() -> None:
+    flights = SingleFlight()
+    work = SlowCounter()
+    _concurrently(lambda: flights.run(threading.current_thread().name, work), 3)
+    assert work.calls == 3
+
+    def explode() -> int:
+        time.sleep(0.1)
+        raise RuntimeError("database went away")
+
+    def call() -> str:
+        try:
+            flights.run("broken", explode)
+        except RuntimeError as exc:
+            return str(exc)
+        return "no error"
+
+    assert _concurrently(call, 4) == ["database went away"] * 4
+
+
+def test_async_calls_on_one_loop_share_one_execution() -> None:
+    flights = SingleFlight()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "rows"
+
+    async def main() -> list:
+        return await asyncio.gather(*(flights.run_async("sql", work) for _ in range(10)))
+
+    results = asyncio.run(main())
+
+    assert calls == 1
+    assert results.count(("rows", True)) == 9
+
+
+def test_async_errors_propagate_to_waiters() -> None:
+    flights = SingleFlight()
+
+    async def explode() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("bad sql")
+
+    async def main() -> list:
+        return await asyncio.gather(*(flights.run_async("sql", explode) for _ in range(3)), return_exceptions=True)
+
+    assert [str(error) for error in asyncio.run(main())] == ["bad sql"] * 3
+
+
+class CountingOllama(OllamaClient):
+    def __init__(self) -> None:
+        super().__init__("http://unused")
+        self.posts: list[dict] = []
+        self._lock = threading.Lock()
+
+    def _post(self, payload: dict) -> str:
+        with self._lock:
+            self.posts.append(payload)
+        time.sleep(0.1)
+        return f"summary of {payload['messages'][-1]['content']}"
+
+
+def test_ollama_client_coalesces_identical_prompts() -> None:
+    client = CountingOllama()
+    same = [{"role": "user", "content": "top scorers"}]
+
+    replies = _concurrently(lambda: client.chat("llama", same), 5)
+    other = client.chat("llama", [{"role": "user", "content": "assist leaders"}])
+
+    assert replies == ["summary of top scorers"] * 5
+    assert other == "summary of assist leaders"
+    assert len(client.posts) == 2
+
+
+class SlowExecutor:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def run(self, sql: str, params: tuple) -> QueryResult:
+        self.calls += 1
+        time.sleep(0.1)
+        return QueryResult(columns=["team_name"], rows=[{"team_name": "Los Angeles Lakers"}])
+
+
+class FixedOllama:
+    def chat(self, model: str, messages: list[dict[str, str]], temperature: float = 0.0) -> str:
+        return "The Lakers lead the list."
+
+
+@pytest.fixture
+def agent() -> AnalyticsAgent:
+    agent = AnalyticsAgent(
+        AgentSettings(
+            database_url="postgresql://unused",
+            ollama_base_url="http://unused",
+            ollama_sql_model="sql-model",
+            ollama_summary_model="summary-model",
+            sql_max_rows=50,
+        )
+    )
+    agent.resolver = EntityResolver("postgresql://unused", snapshot_path=None)
+    agent.resolver._catalog = Catalog(
+        teams=[(1, "Los Angeles Lakers", "LAL")],
+        players=[(1, "LeBron James")],
+        seasons=["2023-24"],
+    )
+    agent.executor = SlowExecutor()
+    agent.ollama = FixedOllama()
+    return agent
+
+
+def test_duplicate_questions_in_flight_execute_sql_once(agent: AnalyticsAgent) -> None:
+    responses = _concurrently(lambda: agent.answer("What was the average points of LeBron James in 2023-24?"), 4)
+
+    assert agent.executor.calls == 1
+    assert sorted(response.provenance["shared_execution"] for response in responses) == [False, True, True, True]
+    assert len({(response.sql, response.answer) for response in responses}) == 1
+    assert agent.query_flights.stats() == {"executed": 1, "shared": 3}
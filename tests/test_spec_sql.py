@@ -20,9 +20,10 @@ def test_player_stat_query_by_season_groups_rows() -> None:
     plan = builder.build(spec, context)
 
     assert plan is not None
-    assert "s.season_label" in plan.sql
-    assert "GROUP BY p.player_name, s.start_year, s.season_label" in plan.sql
-    assert "IN (%s, %s, %s)" in plan.sql
+    assert "f.season_label" in plan.sql
+    assert "GROUP BY p.player_name, f.start_year, f.season_label" in plan.sql
+    assert "AND f.season_id IN ((SELECT season_id FROM seasons WHERE season_label = %s), " in plan.sql
+    assert plan.params[-3:] == ("2014-15", "2015-16", "2016-17")
 
 
 def test_player_stat_query_uses_query_spec_source() -> None:
@@ -68,3 +69,65 @@ def test_player_profile_query_returns_multi_metric_profile_shape() -> None:
     assert "avg_assists" in plan.sql
     assert "fg_pct" in plan.sql
     assert "requested_value" not in plan.sql
+
+
+def test_player_stat_query_reads_fact_table_by_surrogate_keys() -> None:
+    builder = QuerySQLBuilder()
+    context = ResolvedContext(
+        players=[ResolvedEntity(id="1629027", name="Trae Young")],
+        teams=[ResolvedEntity(id="1610612737", name="Atlanta Hawks")],
+        primary_metric="points",
+    )
+    spec = QuerySpec(
+        family=QueryFamily.PLAYER_STAT,
+        intent=IntentType.PLAYER_PROFILE_SUMMARY,
+        metric="points",
+        operation="avg",
+    )
+
+    plan = builder.build(spec, context)
+
+    assert plan is not None
+    assert "FROM player_game_facts f" in plan.sql
+    assert "JOIN games" not in plan.sql
+    assert "f.player_key = (SELECT player_key FROM players WHERE player_id = %s)" in plan.sql
+    assert "f.team_key = (SELECT team_key FROM teams WHERE team_id = %s)" in plan.sql
+    assert "1629027" in plan.params and "1610612737" in plan.params
+
+
+def test_player_opponent_scope_filters_fact_opponent_key() -> None:
+    builder = QuerySQLBuilder()
+    context = ResolvedContext(
+        players=[ResolvedEntity(id="201939", name="Stephen Curry")],
+        teams=[ResolvedEntity(id="1610612747", name="Lakers")],
+        against_mode=True,
+    )
+    spec = QuerySpec(
+        family=QueryFamily.PLAYER_SINGLE_GAME_HIGH,
+        intent=IntentType.PLAYER_PROFILE_SUMMARY,
+        metric="points",
+        against_mode=True,
+    )
+
+    plan = builder.build(spec, context)
+
+    assert plan is not None
+    assert "AND f.opponent_team_key = (SELECT team_key FROM teams WHERE team_id = %s)" in plan.sql
+    assert plan.params == ("points", "201939", "1610612747")
+
+
+def test_team_trend_filters_team_game_results_without_rejoining_games() -> None:
+    builder = QuerySQLBuilder()
+    context = ResolvedContext(
+        teams=[ResolvedEntity(id="1610612743", name="Denver Nuggets")],
+        seasons=["2023-24"],
+    )
+    spec = QuerySpec(family=QueryFamily.TEAM_TREND, intent=IntentType.TEAM_TREND)
+
+    plan = builder.build(spec, context)
+
+    assert plan is not None
+    assert "JOIN games" not in plan.sql
+    assert "AND tgr.game_type = 'regular'" in plan.sql
+    assert "AND tgr.season_id = (SELECT season_id FROM seasons WHERE season_label = %s)" in plan.sql
+    assert plan.params == ("1610612743", "2023-24")
@@ -35,3 +35,13 @@ def test_keeps_existing_limit(guardrails: SQLGuardrails) -> None:
 def test_blocks_invalid_sql(guardrails: SQLGuardrails) -> None:
     with pytest.raises(SQLValidationError, match="SQL parse failed"):
         guardrails.validate_and_rewrite("SELECT * FROM teams WHERE (")
+
+
+def test_agent_allows_player_fact_table() -> None:
+    from agent.pipeline import ALLOWED_TABLES
+
+    guardrails = SQLGuardrails(allowed_tables=ALLOWED_TABLES, max_rows=100)
+
+    rewritten = guardrails.validate_and_rewrite("SELECT points FROM player_game_facts f WHERE f.player_key = %s")
+
+    assert "player_game_facts" in rewritten
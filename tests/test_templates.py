@@ -78,7 +78,7 @@ def test_player_profile_summary_with_opponent_filter() -> None:
     plan = builder.build(IntentType.PLAYER_PROFILE_SUMMARY, context)
 
     assert plan is not None
-    assert "g.away_team_id = %s" in plan.sql
+    assert "g.away_team_key = (SELECT team_key FROM teams WHERE team_id = %s)" in plan.sql
     assert "g.game_type = 'playoffs'" in plan.sql
     assert "SUM(COALESCE(pgs.assists, 0))" in plan.sql
     assert "requested_value" in plan.sql
@@ -128,7 +128,8 @@ def test_team_head_to_head_template() -> None:
 
     assert plan is not None
     assert "team_a_wins" in plan.sql
-    assert "g.home_team_id = %s AND g.away_team_id = %s" in plan.sql
+    assert "g.home_team_key = ta.team_key AND g.away_team_key = tb.team_key" in plan.sql
+    assert plan.params == ("1610612747", "1610612738")
 
 
 def test_team_ranking_template() -> None: